@@ -21,16 +21,34 @@ import docent.core
 
 """
 
+from . import cache
+from . import client
+from . import codec
 from . import constants
 from . import exceptions
+from . import identity
+from . import loader
 from . import logger
+from . import memo
 from . import objects
+from . import query
+from . import repository
+from . import store
 from . import types
 from . import utils
 
+from .client import (
+    DocClient,
+    LocalClient,
+    )
 from .constants import PackageConstants as Constants
 from .objects import DocObject
-from .types import DocMeta
+from .repository import SQLiteRepository
+from .store import DocStore
+from .types import (
+    DocLayout,
+    DocMeta,
+    )
 
 __version__ = '0.0.1a14'
 
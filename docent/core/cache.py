@@ -0,0 +1,302 @@
+__all__ = (
+    'CacheInfo',
+    'DocCache',
+    'cached',
+    'generation',
+    'invalidate',
+    )
+
+import collections
+import copy
+import dataclasses
+import functools
+import threading
+import time
+import typing
+
+from . import constants
+from . import identity
+from . import objects
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    MAXSIZE: int = 1024
+
+
+@dataclasses.dataclass
+class CacheInfo:
+    """Cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    size: int = 0
+    maxsize: int = None
+    ttl: float = None
+
+
+class DocCache:
+    """
+    Thread-safe LRU (plus optional TTL, in seconds) cache of \
+    DocObjects.
+
+    ---
+
+    Values are indexed by their DocObject class and hashable field \
+    values, so writes of an object invalidate its entries regardless \
+    of the key it was loaded by (as well as any entry keyed by \
+    the class and those values, ex. a miss cached for its id).
+
+    """
+
+    def __init__(self, maxsize: int = Constants.MAXSIZE, ttl: float = None):
+        self.info = CacheInfo(maxsize=maxsize, ttl=ttl)
+        self._data: collections.OrderedDict[
+            typing.Hashable,
+            tuple[typing.Optional[float], typing.Any]
+            ] = collections.OrderedDict()
+        self._keys: dict[tuple, set[typing.Hashable]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @staticmethod
+    def _record_key(value: typing.Any) -> typing.Optional[tuple]:
+        if isinstance(value, objects.DocObject):
+            try:
+                record_key = (
+                    value.__class__,
+                    objects._get_hash_key(value.__class__)(value)
+                    )
+                hash(record_key)
+            except TypeError:
+                return None
+            return record_key
+        return None
+
+    def _unlink(self, key: typing.Hashable, value: typing.Any) -> None:
+        if (
+            (record_key := self._record_key(value)) is not None
+            and (keys := self._keys.get(record_key)) is not None
+            ):
+            keys.discard(key)
+            if not keys:
+                del self._keys[record_key]
+
+    def get(self, key: typing.Hashable, default: typing.Any = None) -> typing.Any:  # noqa
+        """Return the value cached for key, counting a hit or miss."""
+
+        with self._lock:
+            if (entry := self._data.get(key)) is None:
+                self.info.misses += 1
+                return default
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._data[key]
+                self._unlink(key, value)
+                self.info.expirations += 1
+                self.info.misses += 1
+                self.info.size = len(self._data)
+                return default
+            self._data.move_to_end(key)
+            self.info.hits += 1
+            return value
+
+    def put(
+        self,
+        key: typing.Hashable,
+        value: typing.Any,
+        generation: tuple[type['objects.DocObject'], int] = None
+        ) -> None:
+        """
+        Cache value for key, evicting the least recently used.
+
+        ---
+
+        If `generation` (a DocObject class and its `generation()` \
+        from before value was loaded) is passed, value is only cached \
+        if that class was not invalidated since (checked under the \
+        cache lock, which `invalidate` also takes).
+
+        """
+
+        expires = (
+            None
+            if self.info.ttl is None
+            else time.monotonic() + self.info.ttl
+            )
+        with self._lock:
+            if (
+                generation is not None
+                and _GENERATIONS.get(generation[0], 0) != generation[1]
+                ):
+                return
+            if (entry := self._data.pop(key, None)) is not None:
+                self._unlink(key, entry[1])
+            self._data[key] = (expires, value)
+            if (record_key := self._record_key(value)) is not None:
+                self._keys.setdefault(record_key, set()).add(key)
+            while len(self._data) > self.info.maxsize:
+                evicted, (_, evicted_value) = self._data.popitem(last=False)
+                self._unlink(evicted, evicted_value)
+                self.info.evictions += 1
+            self.info.size = len(self._data)
+
+    def pop(self, key: typing.Hashable) -> typing.Any:
+        """Invalidate the value cached for key, returning it."""
+
+        with self._lock:
+            if (entry := self._data.pop(key, None)) is None:
+                return None
+            self._unlink(key, entry[1])
+            self.info.invalidations += 1
+            self.info.size = len(self._data)
+            return entry[1]
+
+    def discard(self, record: 'objects.DocObject') -> None:
+        """Invalidate values cached for a DocObject (by hash key)."""
+
+        if (record_key := self._record_key(record)) is None:
+            return
+        with self._lock:
+            for key in self._keys.pop(record_key, ()):
+                del self._data[key]
+                self.info.invalidations += 1
+            if (
+                entry := self._data.pop(
+                    (record_key[0], *record_key[1]),
+                    None
+                    )
+                ) is not None:
+                self._unlink((record_key[0], *record_key[1]), entry[1])
+                self.info.invalidations += 1
+            self.info.size = len(self._data)
+
+    def clear(self) -> None:
+        """Invalidate all values."""
+
+        with self._lock:
+            self.info.invalidations += len(self._data)
+            self._data.clear()
+            self._keys.clear()
+            self.info.size = 0
+
+
+_CACHES: dict[type['objects.DocObject'], list[DocCache]] = {}
+_GENERATIONS: dict[type['objects.DocObject'], int] = {}
+_GENERATIONS_LOCK = threading.Lock()
+
+
+def generation(cls: type['objects.DocObject']) -> int:
+    """
+    Return the number of invalidations of a DocObject class (or of \
+    its subclasses, or of any of their objects) so far.
+
+    """
+
+    return _GENERATIONS.get(cls, 0)
+
+
+def invalidate(
+    record: typing.Union['objects.DocObject', type['objects.DocObject']]
+    ) -> None:
+    """
+    Invalidate cached values for a DocObject, or all cached values \
+    for a DocObject class.
+
+    """
+
+    with _GENERATIONS_LOCK:
+        for cls in (record if isinstance(record, type) else record.__class__).__mro__:  # noqa
+            if issubclass(cls, objects.DocObject):
+                _GENERATIONS[cls] = _GENERATIONS.get(cls, 0) + 1
+    if isinstance(record, type):
+        for cache in _CACHES.get(record, ()):
+            cache.clear()
+    elif (caches := _CACHES.get(record.__class__)) is not None:
+        for cache in caches:
+            cache.discard(record)
+    if (identity_map := identity.current()) is not None:
+        if isinstance(record, type):
+            identity_map.clear(record)
+        else:
+            identity_map.discard(record)
+
+
+def cached(
+    maxsize: int = Constants.MAXSIZE,
+    ttl: float = None,
+    copy_values: bool = True,
+    ) -> typing.Callable[[typing.Callable], typing.Callable]:
+    """
+    Read-through cache for DocObject classmethod loaders, keyed by \
+    their (id) arguments (bound to the loader's signature, so \
+    positional and keyword calls share entries).
+
+    ---
+
+    Entries are evicted least recently used first once there are \
+    more than `maxsize`, and expire after `ttl` seconds (if set). \
+    Loaders returning None are not cached.
+
+    * Entries are invalidated when their DocObject is written back \
+    through a SQLiteRepository or DocStore, or returned by a PUT, \
+    PATCH, or DELETE handler (handlers returning no objects \
+    invalidate all entries for the resource). \
+    Use `docent.core.cache.invalidate` for other writes. \
+    Values loaded while their class is invalidated are returned \
+    but not cached.
+
+    * Hits return a shallow copy unless `copy_values=False`, so \
+    callers can reassign fields freely. Nested mutable values (ex. \
+    lists, dicts, or DocObjects) are shared with the cached value, \
+    so copy them before modifying them in place.
+
+    * Within an identity map scope (ex. an API request), repeat \
+    calls return the same instance (see `docent.core.identity`).
+
+    ```py
+    @classmethod
+    @docent.core.cache.cached(maxsize=4096, ttl=60)
+    def from_id(cls, _id: str) -> 'Pet':
+        if (record := clients.DatabaseClient.find_one(_id)):
+            return cls(**record)
+
+    Pet.from_id.cache.info
+    >>>
+    CacheInfo(hits=..., misses=..., evictions=..., ...)
+
+    ```
+
+    """
+
+    def decorator(loader: typing.Callable) -> typing.Callable:
+        cache = DocCache(maxsize, ttl)
+        registered: set[type] = set()
+        arguments = identity._bind_arguments(loader)
+
+        @functools.wraps(loader)
+        def _loader(
+            cls: type['objects.DocObject'],
+            *args: typing.Any,
+            **kwargs: typing.Any
+            ):
+            key = (cls, *arguments(cls, args, kwargs))
+            if (value := cache.get(key)) is None:
+                loaded_generation = generation(cls)
+                if (value := loader(cls, *args, **kwargs)) is None:
+                    return value
+                if (record_type := value.__class__) not in registered:
+                    registered.add(record_type)
+                    _CACHES.setdefault(record_type, []).append(cache)
+                cache.put(key, value, (cls, loaded_generation))
+            return copy.copy(value) if copy_values else value
+
+        _loader.cache = cache
+        return identity.mapped(_loader)
+
+    return decorator
@@ -0,0 +1,301 @@
+__all__ = (
+    'DocClient',
+    'LocalClient',
+    'LocalConnection',
+    'PoolMetrics',
+    )
+
+import contextlib
+import dataclasses
+import threading
+import time
+import typing
+
+from . import constants
+from . import exceptions
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    pass
+
+
+@dataclasses.dataclass
+class PoolMetrics:
+    """Connection pool counters (times in seconds)."""
+
+    acquired: int = 0
+    created: int = 0
+    closed: int = 0
+    expired: int = 0
+    unhealthy: int = 0
+    in_use: int = 0
+    idle: int = 0
+    waits: int = 0
+    timeouts: int = 0
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+
+@dataclasses.dataclass(eq=False)
+class _PooledConnection:
+
+    connection: typing.Any
+    last_used: float
+    last_checked: float
+
+
+class DocClient:
+    """
+    Base class for docent clients with a bounded, thread-safe \
+    connection pool.
+
+    ---
+
+    Derivatives implement `connect` (and optionally `disconnect` \
+    and `ping`), then borrow connections from the class-level pool:
+
+    ```py
+    class DatabaseClient(docent.core.DocClient):
+
+        POOL_SIZE = 4
+
+        @classmethod
+        def connect(cls) -> sqlite3.Connection:
+            return sqlite3.connect('pets.db', check_same_thread=False)
+
+        @classmethod
+        def find_one(cls, _id: str) -> dict:
+            with cls.connection() as conn:
+                ...
+
+    ```
+
+    * At most `POOL_SIZE` connections are open at once; callers \
+    wait up to `POOL_TIMEOUT` seconds for one to be released before \
+    raising PoolTimeoutError.
+
+    * Connections have per-thread affinity: nested `connection()` \
+    calls on a thread share its connection, and a thread is handed \
+    back the connection it last used whenever that one is idle.
+
+    * Connections idle for longer than `MAX_IDLE` seconds are \
+    closed, and connections idle for longer than \
+    `HEALTH_CHECK_INTERVAL` seconds (or that raised) are replaced if \
+    `ping` fails.
+
+    * `metrics` counts acquisitions, connections created and closed, \
+    and time spent waiting on the pool.
+
+    """
+
+    POOL_SIZE: int = 8
+    POOL_TIMEOUT: float = 30.0
+    MAX_IDLE: float = 300.0
+    HEALTH_CHECK_INTERVAL: float = 30.0
+
+    metrics: PoolMetrics = PoolMetrics()
+
+    _condition: threading.Condition = threading.Condition()
+    _idle: list[_PooledConnection] = []
+    _local: threading.local = threading.local()
+    _open: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.metrics = PoolMetrics()
+        cls._condition = threading.Condition()
+        cls._idle = []
+        cls._local = threading.local()
+        cls._open = 0
+
+    @classmethod
+    def connect(cls) -> typing.Any:
+        """Open and return a new connection."""
+
+        raise NotImplementedError
+
+    @classmethod
+    def disconnect(cls, connection: typing.Any) -> None:
+        """Close a connection."""
+
+        if (close := getattr(connection, 'close', None)) is not None:
+            close()
+
+    @classmethod
+    def ping(cls, connection: typing.Any) -> bool:
+        """Return True if a connection is still usable."""
+
+        return True
+
+    @classmethod
+    def _close(cls, pooled: _PooledConnection) -> None:
+        try:
+            cls.disconnect(pooled.connection)
+        except Exception:
+            pass
+        with cls._condition:
+            cls._open -= 1
+            cls.metrics.closed += 1
+            cls._condition.notify()
+
+    @classmethod
+    def _acquire(cls) -> _PooledConnection:
+        start = time.monotonic()
+        waited = False
+        with cls._condition:
+            while True:
+                if cls._idle:
+                    last = getattr(cls._local, 'last', None)
+                    if last is not None and last in cls._idle:
+                        cls._idle.remove(last)
+                        pooled = last
+                    else:
+                        pooled = cls._idle.pop()
+                    break
+                elif cls._open < cls.POOL_SIZE:
+                    cls._open += 1
+                    pooled = None
+                    break
+                elif (
+                    remaining := cls.POOL_TIMEOUT - (time.monotonic() - start)
+                    ) <= 0:
+                    cls.metrics.timeouts += 1
+                    raise exceptions.PoolTimeoutError(
+                        f'No {cls.__name__} connection available after {cls.POOL_TIMEOUT}s'  # noqa
+                        )
+                waited = True
+                cls._condition.wait(remaining)
+            metrics = cls.metrics
+            metrics.acquired += 1
+            metrics.in_use += 1
+            metrics.idle = len(cls._idle)
+            if waited:
+                wait_time = time.monotonic() - start
+                metrics.waits += 1
+                metrics.wait_time += wait_time
+                metrics.max_wait_time = max(metrics.max_wait_time, wait_time)
+
+        now = time.monotonic()
+        if pooled is not None:
+            if now - pooled.last_used > cls.MAX_IDLE:
+                with cls._condition:
+                    cls.metrics.expired += 1
+            elif (
+                now - pooled.last_checked < cls.HEALTH_CHECK_INTERVAL
+                or cls._ping(pooled, now)
+                ):
+                return pooled
+            with cls._condition:
+                cls._open += 1
+            cls._close(pooled)
+        try:
+            connection = cls.connect()
+        except BaseException:
+            with cls._condition:
+                cls._open -= 1
+                cls.metrics.in_use -= 1
+                cls._condition.notify()
+            raise
+        with cls._condition:
+            cls.metrics.created += 1
+        return _PooledConnection(connection, now, now)
+
+    @classmethod
+    def _ping(cls, pooled: _PooledConnection, now: float) -> bool:
+        try:
+            healthy = cls.ping(pooled.connection)
+        except Exception:
+            healthy = False
+        if healthy:
+            pooled.last_checked = now
+        else:
+            with cls._condition:
+                cls.metrics.unhealthy += 1
+        return healthy
+
+    @classmethod
+    def _release(cls, pooled: _PooledConnection, failed: bool) -> None:
+        now = time.monotonic()
+        if failed and not cls._ping(pooled, now):
+            with cls._condition:
+                cls.metrics.in_use -= 1
+            cls._close(pooled)
+            return
+        pooled.last_used = now
+        expired: list[_PooledConnection] = []
+        with cls._condition:
+            cls.metrics.in_use -= 1
+            while cls._idle and now - cls._idle[0].last_used > cls.MAX_IDLE:
+                expired.append(cls._idle.pop(0))
+                cls.metrics.expired += 1
+            cls._idle.append(pooled)
+            cls.metrics.idle = len(cls._idle)
+            cls._condition.notify()
+        for pooled in expired:
+            cls._close(pooled)
+
+    @classmethod
+    @contextlib.contextmanager
+    def connection(cls) -> typing.Iterator[typing.Any]:
+        """Borrow a connection from the pool."""
+
+        local = cls._local
+        if (held := getattr(local, 'held', None)) is not None:
+            yield held.connection
+            return
+        pooled = local.held = cls._acquire()
+        local.last = pooled
+        failed = False
+        try:
+            yield pooled.connection
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            local.held = None
+            cls._release(pooled, failed)
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Close all idle connections."""
+
+        with cls._condition:
+            idle, cls._idle = cls._idle, []
+            cls.metrics.idle = 0
+        for pooled in idle:
+            cls._close(pooled)
+
+
+class LocalConnection:
+    """In-process fake connection (for tests and local development)."""
+
+    def __init__(self, data: dict[str, typing.Any]):
+        self.data = data
+        self.closed = False
+        self.healthy = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class LocalClient(DocClient):
+    """
+    DocClient backed by in-process LocalConnections sharing the \
+    class-level `DATA` dict.
+
+    ---
+
+    Set `connection.healthy = False` to simulate a broken connection.
+
+    """
+
+    DATA: dict[str, typing.Any] = {}
+
+    @classmethod
+    def connect(cls) -> LocalConnection:
+        return LocalConnection(cls.DATA)
+
+    @classmethod
+    def ping(cls, connection: LocalConnection) -> bool:
+        return connection.healthy and not connection.closed
@@ -0,0 +1,270 @@
+__all__ = (
+    'Codec',
+    'dump',
+    'dumps',
+    'get_codec',
+    'iterencode',
+    'loads',
+    'register',
+    'use',
+    )
+
+import dataclasses
+import json
+import typing
+
+from . import constants
+from . import exceptions
+from . import objects
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    FAST_CODECS = ('orjson', )
+
+
+@dataclasses.dataclass(frozen=True)
+class Codec:
+    """
+    A JSON backend.
+
+    ---
+
+    `dumps` must accept `default`, `indent`, and `sort_keys` keyword \
+    arguments (as with `json.dumps`) and return a str. `loads` must \
+    accept a str or bytes.
+
+    ```py
+    import docent.core
+    import ujson
+
+
+    docent.core.codec.register(
+        docent.core.codec.Codec(
+            name='ujson',
+            dumps=lambda obj, default=None, indent=None, sort_keys=False: (
+                ujson.dumps(
+                    obj,
+                    default=default,
+                    indent=indent or 0,
+                    sort_keys=sort_keys
+                    )
+                ),
+            loads=ujson.loads,
+            )
+        )
+    docent.core.codec.use('ujson')
+    ```
+
+    """
+
+    name: str
+    dumps: typing.Callable[..., str]
+    loads: typing.Callable[[typing.Union[bytes, str]], typing.Any]
+
+
+CODECS: dict[str, Codec] = {}
+
+
+def _json_dumps(
+    obj: typing.Any,
+    default: typing.Callable[[typing.Any], typing.Any] = None,
+    indent: int = None,
+    sort_keys: bool = False,
+    ) -> str:
+    return json.dumps(
+        obj,
+        default=default,
+        indent=indent,
+        sort_keys=sort_keys
+        )
+
+
+def _orjson_dumps(
+    obj: typing.Any,
+    default: typing.Callable[[typing.Any], typing.Any] = None,
+    indent: int = None,
+    sort_keys: bool = False,
+    ) -> str:
+    if indent not in {None, 2}:
+        return _json_dumps(obj, default, indent, sort_keys)
+    option = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    if sort_keys:
+        option |= orjson.OPT_SORT_KEYS
+    try:
+        return orjson.dumps(obj, default=default, option=option).decode()
+    except orjson.JSONEncodeError:  # ex. integers over 64 bits
+        return _json_dumps(obj, default, indent, sort_keys)
+
+
+def register(codec: Codec) -> Codec:
+    """Register a JSON backend by name."""
+
+    CODECS[codec.name] = codec
+    return codec
+
+
+def use(name: str) -> Codec:
+    """
+    Switch all docent JSON encoding and decoding to a registered \
+    backend, or the fastest one available for 'auto'.
+
+    ---
+
+    The backend is selected on import from the `JSON_CODEC` \
+    environment variable (default: 'json', the standard library).
+
+    Note: with 'orjson', compact output omits whitespace after \
+    separators.
+
+    """
+
+    global _CODEC
+
+    if name == 'auto':
+        name = next(
+            (k for k in Constants.FAST_CODECS if k in CODECS),
+            'json'
+            )
+    if (codec := CODECS.get(name)) is None:
+        raise exceptions.UnknownCodecError(
+            ' '.join(
+                (
+                    f'Invalid JSON codec: {name!r}.',
+                    f'Must be one of: {sorted(CODECS)!s}',
+                    )
+                )
+            )
+    _CODEC = codec
+    return codec
+
+
+def get_codec() -> Codec:
+    """Return the JSON backend in use."""
+
+    return _CODEC
+
+
+def dumps(
+    obj: typing.Any,
+    default: typing.Callable[[typing.Any], typing.Any] = None,
+    indent: int = None,
+    sort_keys: bool = False,
+    ) -> str:
+    """Serialize obj to a JSON str with the backend in use."""
+
+    return _CODEC.dumps(
+        obj,
+        default=default,
+        indent=indent,
+        sort_keys=sort_keys
+        )
+
+
+def loads(s: typing.Union[bytes, str]) -> typing.Any:
+    """Deserialize a JSON str (or bytes) with the backend in use."""
+
+    return _CODEC.loads(s)
+
+
+register(Codec('json', _json_dumps, json.loads))
+if orjson is not None:
+    register(Codec('orjson', _orjson_dumps, orjson.loads))
+
+_CODEC: Codec = use(
+    Constants.JSON_CODEC
+    if Constants.JSON_CODEC in CODECS or Constants.JSON_CODEC == 'auto'
+    else 'json'
+    )
+
+
+def _iterencode(obj: typing.Any) -> typing.Iterator[str]:
+    """Yield JSON for obj one DocObject (or value) at a time."""
+
+    if isinstance(obj, objects.DocRecords):
+        fields = [k for k in obj.fields if k != 'records']
+        head = dumps(obj._to_dbo(camel_case=True, fields=fields), default=str)
+        yield '{"records": ['
+        for i, record in enumerate(obj):
+            if i:
+                yield ', '
+            yield from _iterencode(record)
+        yield ']}' if head == '{}' else '], ' + head[1:]
+    elif isinstance(obj, objects.DocObject):
+        yield dumps(obj.as_rest, default=str)
+    elif (
+        isinstance(obj, (list, tuple, typing.Iterator))
+        and not isinstance(obj, (str, bytes))
+        ):
+        yield '['
+        for i, item in enumerate(obj):
+            if i:
+                yield ', '
+            yield from _iterencode(item)
+        yield ']'
+    else:
+        yield dumps(obj, default=str)
+
+
+def iterencode(
+    obj: typing.Any,
+    chunk_size: int = Constants.CHUNK_SIZE
+    ) -> typing.Iterator[bytes]:
+    """
+    Incrementally encode obj as UTF-8 REST JSON.
+
+    ---
+
+    DocObjects, DocRecords, and lists or iterators (ex. generators) \
+    thereof are serialized one object at a time, so memory scales \
+    with a single object instead of the whole payload.
+
+    Output is buffered and yielded in chunks of at least chunk_size \
+    bytes (except for the last one).
+
+    ```py
+    for chunk in docent.core.codec.iterencode(pet for pet in pets):
+        wfile.write(chunk)
+    ```
+
+    """
+
+    buffer: list[bytes] = []
+    size = 0
+    for s in _iterencode(obj):
+        buffer.append(chunk := s.encode())
+        if (size := size + len(chunk)) >= chunk_size:
+            yield b''.join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield b''.join(buffer)
+
+
+def dump(
+    obj: typing.Any,
+    fp: typing.BinaryIO,
+    chunk_size: int = Constants.CHUNK_SIZE
+    ) -> int:
+    """
+    Incrementally write obj as UTF-8 REST JSON to a writable binary \
+    file-like object (ex. `wfile`), returning the bytes written.
+
+    """
+
+    n = 0
+    for chunk in iterencode(obj, chunk_size):
+        fp.write(chunk)
+        n += len(chunk)
+    return n
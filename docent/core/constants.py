@@ -4,6 +4,7 @@ import os
 class PackageConstants:
     """Constant values across all of docent."""
 
+    CHUNK_SIZE     = int(os.getenv('CHUNK_SIZE', 65536))
     DOC_DELIM      = '-'
     ENV            = os.getenv('ENV', 'local').lower()
     FTIME_DEFAULT  = '%Y-%m-%dT%H:%M:%S.%f%z'
@@ -11,10 +12,19 @@ class PackageConstants:
     FTIME_LOG_MSEC = '%s.%03d UTC'
     FTIME_US_YEAR  = '%Y-%m-%d'
     INDENT         = int(os.getenv('LOG_INDENT', 2))
+    JSON_CODEC     = os.getenv('JSON_CODEC', 'json').lower()
+    LOG_ASYNC      = os.getenv('LOG_ASYNC', 'false').lower() == 'true'
+    LOG_BATCH_SIZE = int(os.getenv('LOG_BATCH_SIZE', 256))
     LOG_CUTOFF_LEN = int(os.getenv('LOG_CUTOFF_LEN', 1024))
+    LOG_ELIDED_KEY = '...'
+    LOG_ELIDED_MSG = ' ... ({} more) '
+    LOG_FORMAT     = os.getenv('LOG_FORMAT', 'json').lower()
     LOG_LEVEL      = os.getenv(
         'LOG_LEVEL',
         'DEBUG' if ENV in {'dev', 'develop', 'local'} else 'INFO'
         ).upper()
+    LOG_OVERFLOW   = os.getenv('LOG_OVERFLOW', 'block').lower()
+    LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', 10000))
+    MEMO_MAXSIZE   = int(os.getenv('MEMO_MAXSIZE', 4096))
     NEW_LINE_TOKEN = '||N'
     RE_JSON        = r'((?<!\\)\+)'
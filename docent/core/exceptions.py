@@ -1,8 +1,15 @@
 __all__ = (
     'IncorrectCasingError',
+    'InvalidHashModeError',
+    'InvalidIndexError',
+    'InvalidLogFormatError',
     'InvalidLogMessageTypeError',
+    'InvalidLogOverflowError',
+    'InvalidQueryError',
     'MissingDefaultValueError',
     'MissingContainerTypeAnnotation',
+    'PoolTimeoutError',
+    'UnknownCodecError',
     )
 
 from . import constants
@@ -19,11 +26,36 @@ class IncorrectCasingError(SyntaxError):  # noqa
     pass
 
 
+class InvalidHashModeError(SyntaxError):  # noqa
+
+    pass
+
+
+class InvalidIndexError(SyntaxError):  # noqa
+
+    pass
+
+
+class InvalidLogFormatError(SyntaxError):  # noqa
+
+    pass
+
+
 class InvalidLogMessageTypeError(SyntaxError):  # noqa
 
     pass
 
 
+class InvalidLogOverflowError(SyntaxError):  # noqa
+
+    pass
+
+
+class InvalidQueryError(SyntaxError):  # noqa
+
+    pass
+
+
 class MissingContainerTypeAnnotation(SyntaxError):  # noqa
 
     pass
@@ -32,3 +64,13 @@ class MissingContainerTypeAnnotation(SyntaxError):  # noqa
 class MissingDefaultValueError(SyntaxError):  # noqa
 
     pass
+
+
+class PoolTimeoutError(TimeoutError):  # noqa
+
+    pass
+
+
+class UnknownCodecError(KeyError):  # noqa
+
+    pass
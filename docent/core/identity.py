@@ -0,0 +1,222 @@
+__all__ = (
+    'IdentityMap',
+    'current',
+    'mapped',
+    'scope',
+    )
+
+import contextlib
+import contextvars
+import functools
+import inspect
+import typing
+
+from . import constants
+from . import objects
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    pass
+
+
+class IdentityMap:
+    """
+    Scoped map of loaded DocObjects, by loader key and by class plus \
+    hashable field values.
+
+    ---
+
+    Within a scope (ex. one API request), every lookup of the same \
+    object returns the same instance.
+
+    """
+
+    def __init__(self):
+        self.loaders: dict[typing.Callable, typing.Any] = {}
+        self.objects: dict[typing.Hashable, 'objects.DocObject'] = {}
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        return key in self.objects
+
+    def __len__(self) -> int:
+        return len(self.objects)
+
+    @staticmethod
+    def _record_key(record: 'objects.DocObject') -> typing.Optional[tuple]:
+        try:
+            record_key = (
+                record.__class__,
+                *objects._get_hash_key(record.__class__)(record)
+                )
+            hash(record_key)
+        except TypeError:
+            return None
+        return record_key
+
+    def add(
+        self,
+        record: 'objects.DocObject',
+        key: typing.Hashable = None
+        ) -> 'objects.DocObject':
+        """Map record by its hash key (and key, if passed)."""
+
+        if (record_key := self._record_key(record)) is not None:
+            self.objects[record_key] = record
+        if key is not None:
+            self.objects[key] = record
+        return record
+
+    def clear(self, record_type: type['objects.DocObject'] = None) -> None:
+        """Unmap all records (of record_type, if passed)."""
+
+        if record_type is None:
+            self.objects.clear()
+        else:
+            self.objects = {
+                k: v
+                for k, v
+                in self.objects.items()
+                if v.__class__ is not record_type
+                }
+
+    def discard(self, record: 'objects.DocObject') -> None:
+        """Unmap record (under any key)."""
+
+        if (record_key := self._record_key(record)) is not None:
+            mapped_record = self.objects.pop(record_key, None)
+        else:
+            mapped_record = None
+        for key in [
+            k
+            for k, v
+            in self.objects.items()
+            if v is record or v is mapped_record
+            ]:
+            del self.objects[key]
+
+    def get(self, key: typing.Hashable) -> typing.Optional['objects.DocObject']:  # noqa
+        return self.objects.get(key)
+
+
+_IDENTITY_MAP: contextvars.ContextVar[typing.Optional[IdentityMap]] = (
+    contextvars.ContextVar('identity_map', default=None)
+    )
+
+
+def current() -> typing.Optional[IdentityMap]:
+    """Return the IdentityMap for the current scope, if any."""
+
+    return _IDENTITY_MAP.get()
+
+
+@contextlib.contextmanager
+def scope(identity_map: IdentityMap = None) -> typing.Iterator[IdentityMap]:
+    """
+    Open an IdentityMap scope, discarded on exit (or re-enter that \
+    of identity_map, if passed).
+
+    """
+
+    if identity_map is None:
+        identity_map = IdentityMap()
+    token = _IDENTITY_MAP.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        _IDENTITY_MAP.reset(token)
+
+
+def _bind_arguments(
+    loader: typing.Callable
+    ) -> typing.Callable[[type['objects.DocObject'], tuple, dict], tuple]:
+    """
+    Return a function normalizing the arguments of calls to a \
+    classmethod loader (after cls) by binding them to its \
+    signature, so positional and keyword calls share one key.
+
+    ---
+
+    Calls passing every argument positionally are returned as is.
+
+    """
+
+    signature = inspect.signature(loader)
+    parameters = list(signature.parameters.values())[1:]
+    positional = len(parameters)
+    if any(
+        p.kind not in {
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            }
+        for p
+        in parameters
+        ):
+        positional = -1  # Always bind (ex. *args).
+
+    def _arguments(
+        cls: type['objects.DocObject'],
+        args: tuple,
+        kwargs: dict[str, typing.Any]
+        ) -> tuple:
+        if not kwargs and len(args) == positional:
+            return args
+        bound = signature.bind(cls, *args, **kwargs)
+        bound.apply_defaults()
+        arguments: list[typing.Any] = []
+        for name, value in list(bound.arguments.items())[1:]:
+            kind = signature.parameters[name].kind
+            if kind is inspect.Parameter.VAR_POSITIONAL:
+                arguments.extend(value)
+            elif kind is inspect.Parameter.VAR_KEYWORD:
+                arguments.append(tuple(sorted(value.items())))
+            else:
+                arguments.append(value)
+        return tuple(arguments)
+
+    return _arguments
+
+
+def mapped(loader: typing.Callable) -> typing.Callable:
+    """
+    Return objects loaded by a classmethod loader from the current \
+    IdentityMap scope, if any, keyed by class, loader, and arguments.
+
+    ---
+
+    `docent.core.cache.cached` loaders are mapped already.
+
+    ```py
+    @classmethod
+    @docent.core.identity.mapped
+    def from_id(cls, _id: str) -> 'Pet':
+        ...
+
+    ```
+
+    """
+
+    arguments = _bind_arguments(loader)
+
+    @functools.wraps(loader)
+    def _loader(
+        cls: type['objects.DocObject'],
+        *args: typing.Any,
+        **kwargs: typing.Any
+        ):
+        if (identity_map := _IDENTITY_MAP.get()) is None:
+            return loader(cls, *args, **kwargs)
+        elif (
+            record := identity_map.get(
+                key := (
+                    cls,
+                    loader.__qualname__,
+                    *arguments(cls, args, kwargs)
+                    )
+                )
+            ) is None:
+            if (record := loader(cls, *args, **kwargs)) is not None:
+                identity_map.add(record, key)
+        return record
+
+    return _loader
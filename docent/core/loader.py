@@ -0,0 +1,191 @@
+__all__ = (
+    'Deferred',
+    'DocLoader',
+    'scoped',
+    )
+
+import typing
+
+from . import constants
+from . import identity
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    pass
+
+
+K = typing.TypeVar('K', bound=typing.Hashable)
+T = typing.TypeVar('T')
+
+
+class Deferred(typing.Generic[T]):
+    """Result of a `DocLoader.load` call, resolved on first access."""
+
+    __slots__ = (
+        '_exception',
+        '_key',
+        '_loader',
+        '_resolved',
+        '_value',
+        )
+
+    def __init__(self, loader: 'DocLoader', key: typing.Hashable):
+        self._exception: typing.Optional[BaseException] = None
+        self._key = key
+        self._loader = loader
+        self._resolved = False
+        self._value: typing.Optional[T] = None
+
+    def __repr__(self) -> str:
+        return (
+            f'{self.__class__.__name__}({self._key!r}'
+            + (f', {self._value!r})' if self._resolved else ')')
+            )
+
+    def _resolve(
+        self,
+        value: typing.Optional[T] = None,
+        exception: BaseException = None
+        ) -> None:
+        self._exception = exception
+        self._resolved = True
+        self._value = value
+
+    @property
+    def done(self) -> bool:
+        return self._resolved
+
+    def result(self) -> typing.Optional[T]:
+        """
+        Return the loaded value (None if not found), dispatching \
+        all queued keys first if necessary.
+
+        """
+
+        if not self._resolved:
+            self._loader.dispatch()
+        if self._exception is not None:
+            raise self._exception
+        return self._value
+
+
+class DocLoader(typing.Generic[K, T]):
+    """
+    Batching loader: `load(key)` calls are queued and resolved \
+    together with a single `batch_load(keys)` call.
+
+    ---
+
+    batch_load takes a list of unique keys and returns either a \
+    mapping of key to value or a sequence of values in key order \
+    (missing keys resolve to None).
+
+    * Values are memoized by key for the life of the loader; use \
+    `scoped` for one loader per API request.
+
+    * `max_batch_size` splits large dispatches into several calls.
+
+    ```py
+    loader = docent.core.loader.scoped(clients.DatabaseClient.load_many)
+
+    pets = [loader.load(flea.pet_id) for flea in fleas]  # Queued.
+    names = [pet.result()['name'] for pet in pets]  # One round trip.
+
+    ```
+
+    """
+
+    def __init__(
+        self,
+        batch_load: typing.Callable[
+            [list[K]],
+            typing.Union[typing.Mapping[K, T], typing.Sequence[T]]
+            ],
+        max_batch_size: int = None
+        ):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self._deferred: dict[K, Deferred[T]] = {}
+        self._queue: list[K] = []
+
+    def clear(self, key: K = None) -> None:
+        """Forget the memoized value for key (or all keys)."""
+
+        if key is None:
+            self._deferred = {
+                k: deferred
+                for k, deferred
+                in self._deferred.items()
+                if not deferred.done
+                }
+        elif (deferred := self._deferred.get(key)) is not None and deferred.done:  # noqa
+            del self._deferred[key]
+
+    def dispatch(self) -> None:
+        """Resolve all queued keys."""
+
+        while (queue := self._queue):
+            size = self.max_batch_size or len(queue)
+            keys, self._queue = queue[:size], queue[size:]
+            self.batches += 1
+            try:
+                values = self.batch_load(keys)
+            except Exception as exception:
+                for key in keys:
+                    self._deferred.pop(key)._resolve(exception=exception)
+                raise
+            if isinstance(values, typing.Mapping):
+                for key in keys:
+                    self._deferred[key]._resolve(values.get(key))
+            else:
+                values = list(values)
+                for i, key in enumerate(keys):
+                    self._deferred[key]._resolve(
+                        values[i] if i < len(values) else None
+                        )
+
+    def load(self, key: K) -> Deferred[T]:
+        """Queue key, returning its Deferred value."""
+
+        if (deferred := self._deferred.get(key)) is None:
+            deferred = self._deferred[key] = Deferred(self, key)
+            self._queue.append(key)
+        return deferred
+
+    def load_many(self, keys: typing.Iterable[K]) -> list[typing.Optional[T]]:  # noqa
+        """Load keys (in as few batches as possible), returning values."""
+
+        deferred = [self.load(key) for key in keys]
+        return [d.result() for d in deferred]
+
+    def prime(self, key: K, value: T) -> None:
+        """Memoize a value for key (if not already loaded or queued)."""
+
+        if key not in self._deferred:
+            (deferred := Deferred(self, key))._resolve(value)
+            self._deferred[key] = deferred
+
+
+def scoped(
+    batch_load: typing.Callable[
+        [list[K]],
+        typing.Union[typing.Mapping[K, T], typing.Sequence[T]]
+        ],
+    max_batch_size: int = None
+    ) -> DocLoader[K, T]:
+    """
+    Return the DocLoader for batch_load in the current identity map \
+    scope (ex. the current API request), or a new one if unscoped.
+
+    """
+
+    if (identity_map := identity.current()) is None:
+        return DocLoader(batch_load, max_batch_size)
+    elif (loader := identity_map.loaders.get(batch_load)) is None:
+        loader = identity_map.loaders[batch_load] = DocLoader(
+            batch_load,
+            max_batch_size
+            )
+    return loader
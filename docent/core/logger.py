@@ -1,26 +1,707 @@
 __all__ = (
+    'LogWorker',
+    'flush',
     'get_central_log',
+    'start_worker',
+    'stop_worker',
     )
 
+import atexit
+import dataclasses
+import datetime
 import functools
-import json
 import logging
+import queue
 import sys
+import threading
 import time
 import traceback
 import typing
 import warnings
 
+from . import codec
 from . import constants
 from . import exceptions
+from . import memo
 from . import objects
+from . import types
 from . import utils
 
 
 class Constants(constants.PackageConstants):  # noqa
 
-    SILENCE_MSG = 'Call to print() silenced by docent.'
-    WARN_MSG    = 'Calls to print() will be silenced by docent.'
+    DROPPED_MSG   = '{} log record(s) dropped (log queue full).'
+    LOG_FORMATS   = {'json', 'ndjson'}
+    LOG_OVERFLOWS = {'block', 'drop', 'drop_oldest'}
+    SAFE_TYPES    = frozenset(
+        (
+            bool,
+            datetime.date,
+            datetime.datetime,
+            datetime.time,
+            type(None),
+            )
+        )
+    SILENCE_MSG   = 'Call to print() silenced by docent.'
+    WARN_MSG      = 'Calls to print() will be silenced by docent.'
+
+
+@dataclasses.dataclass
+class _LogEntry:
+    """Raw log call, as captured on the calling thread."""
+
+    level: int
+    msg: typing.Union[str, dict, 'objects.DocObject']
+    tb: typing.Optional[str]
+    fn: str
+    lno: int
+    func: str
+    extra: typing.Optional[dict]
+    sinfo: typing.Optional[str]
+    created: float
+    thread: int
+    thread_name: str
+    snapshot: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class _RedactionPlan:
+    """
+    Redaction plan for the (dbo) fields of a DocObject derivative.
+
+    ---
+
+    * `sensitive`: redactions for string values of fields named \
+    like secrets (ex. api_key).
+
+    * `safe`: fields annotated as types that cannot render as \
+    secrets (ex. dates), whose values are not scanned.
+
+    * `nested`: DocObject types of fields annotated as such (or \
+    lists of them), redacted with their own plans.
+
+    * `scan`: all other fields, whose values are scanned.
+
+    """
+
+    sensitive: dict[str, str]
+    safe: frozenset[str]
+    scan: frozenset[str]
+    nested: dict[str, type[objects.DocObject]]
+
+
+@memo.memoized()
+def _get_redaction_plan(cls: type[objects.DocObject]) -> _RedactionPlan:
+    """Get (or compute on first use) the redaction plan for a DocObject."""  # noqa
+
+    sensitive: dict[str, str] = {}
+    safe: set[str] = set()
+    scan: set[str] = set()
+    nested: dict[str, type[objects.DocObject]] = {}
+    serializer = objects._get_serializer(cls)
+    for k, field in types.DocLayout.from_object(cls).fields.items():
+        if (keys := serializer.get(k)) is None:
+            continue
+        tp = field.type
+        if types._is_union(tp):
+            args = [a for a in typing.get_args(tp) if a is not type(None)]
+            if len(args) == 1:
+                tp = args[0]
+        if typing.get_origin(tp) in {list, tuple} and typing.get_args(tp):
+            tp = typing.get_args(tp)[0]
+        if (redaction := utils._get_key_redaction(keys[0])) is not None:
+            sensitive[keys[0]] = redaction
+        elif tp in Constants.SAFE_TYPES:
+            safe.add(keys[0])
+        elif (
+            isinstance(tp, type)
+            and typing.get_origin(tp) is None
+            and issubclass(tp, objects.DocObject)
+            ):
+            nested[keys[0]] = tp
+        else:
+            scan.add(keys[0])
+    return _RedactionPlan(sensitive, frozenset(safe), frozenset(scan), nested)
+
+
+def _redact_dbo(
+    plan: _RedactionPlan,
+    dbo: dict[str, typing.Any]
+    ) -> utils.RedactedDict:
+    """Redact a DocObject's dbo (by key) following its plan."""
+
+    d = utils.RedactedDict()
+    for k, v in dbo.items():
+        if (
+            (redaction := plan.sensitive.get(k)) is not None
+            and isinstance(v, str)
+            ):
+            d[k] = redaction
+            d.safe_keys.add(k)
+        elif k in plan.safe and v.__class__ in Constants.SAFE_TYPES:
+            d[k] = v
+            d.safe_keys.add(k)
+        elif (nested := plan.nested.get(k)) is not None and isinstance(v, dict):  # noqa
+            d[k] = _redact_dbo(_get_redaction_plan(nested), v)
+        elif nested is not None and isinstance(v, list):
+            nested_plan = _get_redaction_plan(nested)
+            d[k] = [
+                _redact_dbo(nested_plan, _v) if isinstance(_v, dict) else _v
+                for _v
+                in v
+                ]
+        elif isinstance(v, (dict, list)):
+            d[k] = utils.redact_log_dict(v)
+        elif k in plan.scan or not isinstance(v, str):
+            d[k] = v
+        else:
+            d[k] = utils._get_key_redaction(k) or v
+    return d
+
+
+def _elide(n: int) -> str:
+    return Constants.LOG_ELIDED_MSG.format(n)
+
+
+def _bound(
+    v: typing.Any,
+    budget: int,
+    convert: bool = False
+    ) -> tuple[typing.Any, int]:
+    """
+    Copy a logged value, visiting at most budget items (list and \
+    tuple items, dict entries, and DocObject fields) and eliding \
+    the rest, returning the copy and the budget left.
+
+    ---
+
+    If convert, DocObjects (v itself, or items of list v) are \
+    converted to (unredacted) `_DboSnapshot`s as they are visited.
+
+    """
+
+    if v is None or v.__class__ in objects.Constants.SCALAR_TYPES:
+        return v, budget
+    elif convert and isinstance(v, objects.DocObject):
+        return _snapshot_doc_object(v, budget)
+    elif v.__class__ is dict:
+        d = {}
+        for i, (k, _v) in enumerate(v.items()):
+            if budget <= 0:
+                d = {str(k): _v for k, _v in d.items()}  # Sortable.
+                d[Constants.LOG_ELIDED_KEY] = _elide(len(v) - i)
+                break
+            d[k], budget = _bound(_v, budget - 1)
+        return d, budget
+    elif v.__class__ in {list, tuple}:
+        c = []
+        for i, _v in enumerate(v):
+            if budget <= 0:
+                c.append(_elide(len(v) - i))
+                break
+            _v, budget = _bound(
+                _v,
+                budget - 1,
+                convert and isinstance(_v, objects.DocObject)
+                )
+            c.append(_v)
+        return (c if v.__class__ is list else tuple(c)), budget
+    return v, budget
+
+
+def _bound_dbo(
+    obj: objects.DocObject,
+    budget: int
+    ) -> tuple[typing.Union[dict, list], int]:
+    """
+    DocObject.as_dbo, visiting at most budget items (as for \
+    `_bound`) and eliding the rest.
+
+    """
+
+    cls = obj.__class__
+    if obj.__class__ is not type(obj) or cls._to_dbo is not objects.DocObject._to_dbo:  # noqa
+        return _bound(obj.as_dbo, budget)  # Lazy or custom dbo.
+
+    serializer = objects._get_serializer(cls)
+    dbo: dict[str, typing.Any] = {}
+    items = objects._get_items(obj)
+    for i, (k, v) in enumerate(items):
+        if budget <= 0:
+            dbo[Constants.LOG_ELIDED_KEY] = _elide(len(items) - i)
+            break
+        budget -= 1
+        try:
+            keys = serializer[k]
+        except KeyError:
+            keys = serializer[k] = objects._keys_for_attribute(cls, k)
+        if keys is None:
+            continue
+        elif v is None or v.__class__ in objects.Constants.SCALAR_TYPES:
+            dbo[keys[0]] = v
+        elif isinstance(v, objects.DocObject):
+            dbo[keys[0]], budget = _bound_dbo(v, budget)
+        elif isinstance(v, dict):
+            d = dbo[keys[0]] = {}
+            for j, (_k, _v) in enumerate(v.items()):
+                if budget <= 0:
+                    d[Constants.LOG_ELIDED_KEY] = _elide(len(v) - j)
+                    break
+                elif (
+                    _k.removesuffix('_').lower().endswith('id')
+                    or not _k.startswith('_')
+                    ):
+                    d[_k], budget = (
+                        _bound_dbo(_v, budget - 1)
+                        if isinstance(_v, objects.DocObject)
+                        else _bound(_v, budget - 1)
+                        )
+        elif isinstance(v, list):
+            c = dbo[keys[0]] = []
+            for j, _v in enumerate(v):
+                if budget <= 0:
+                    c.append(_elide(len(v) - j))
+                    break
+                _v, budget = (
+                    _bound_dbo(_v, budget - 1)
+                    if isinstance(_v, objects.DocObject)
+                    else _bound(_v, budget - 1)
+                    )
+                c.append(_v)
+        else:
+            dbo[keys[0]], budget = _bound(v, budget)
+    return dbo, budget
+
+
+class _DboSnapshot(typing.NamedTuple):
+    """Unredacted dbo of a logged DocObject, and its class."""
+
+    cls: type[objects.DocObject]
+    dbo: dict[str, typing.Any]
+
+
+def _snapshot_doc_object(
+    obj: objects.DocObject,
+    budget: int
+    ) -> tuple[typing.Any, int]:
+    """
+    Convert a DocObject to dbo for logging (as for `_bound`), \
+    leaving its redaction to `_redact_snapshot`.
+
+    """
+
+    dbo, budget = _bound_dbo(obj, budget)
+    if isinstance(dbo, dict):
+        return _DboSnapshot(obj.__class__, dbo), budget
+    return dbo, budget
+
+
+def _redact_snapshot(v: typing.Any) -> typing.Any:
+    """
+    Redact the `_DboSnapshot`s (v itself, or items of list v) of a \
+    snapshotted message value by key, with their class's \
+    (memoized) redaction plan.
+
+    """
+
+    if isinstance(v, _DboSnapshot):
+        return _redact_dbo(_get_redaction_plan(v.cls), v.dbo)
+    elif v.__class__ in {list, tuple}:
+        c = [
+            _redact_snapshot(_v)
+            if isinstance(_v, _DboSnapshot)
+            else _v
+            for _v
+            in v
+            ]
+        return c if v.__class__ is list else tuple(c)
+    return v
+
+
+def _snapshot_message(entry: _LogEntry) -> dict[str, typing.Any]:
+    """
+    Copy a captured log message (bounded, with DocObjects as \
+    unredacted dbo), so it can be redacted and formatted later.
+
+    """
+
+    if Constants.LOG_FORMAT == 'ndjson':
+        new_line, render = '\n', str
+    else:
+        new_line, render = Constants.NEW_LINE_TOKEN, utils.prefix_value_to_string  # noqa
+
+    msg = entry.msg
+    if isinstance(msg, str):
+        if entry.level == logging.WARNING:
+            indices: list[int] = []
+            for i, msg_line in enumerate(s := msg.splitlines()):
+                if (
+                    Constants.SILENCE_MSG == msg_line
+                    or Constants.WARN_MSG == msg_line
+                    ):
+                    indices.append(i)
+                elif 'warn(' in msg_line and not indices:
+                    indices.append(0)
+                    indices.append(i)
+                    break
+                elif 'warn(' in msg_line:
+                    indices.append(i)
+                    break
+            if len(indices) == 1:
+                indices.append(len(s))
+            elif len(indices) < 1:
+                indices = [0, len(s)]
+            if len(s) > 1 and (
+                printed := new_line.join(
+                    s[indices[0] + 1:indices[1]]
+                    )
+                ):
+                msg = {
+                    'message': render(s[indices[0]]),
+                    'printed': render(printed)
+                    }
+            elif Constants.WARN_MSG in msg:
+                msg = {'message': Constants.WARN_MSG}
+            elif Constants.SILENCE_MSG in msg:
+                msg = {'message': Constants.SILENCE_MSG}
+            else:
+                msg = {
+                    'message': render(
+                        new_line.join(s)
+                        )
+                    }
+        else:
+            msg = {'message': render(msg)}
+    elif isinstance(msg, objects.DocObject):
+        msg = {msg.__class__.__name__: msg}
+
+    if entry.tb is not None:
+        msg = {**msg, 'traceback': entry.tb}
+
+    return {
+        k: _bound(v, Constants.LOG_CUTOFF_LEN, convert=True)[0]
+        for k, v
+        in msg.items()
+        }
+
+
+def _prepare_message(entry: _LogEntry) -> dict[str, typing.Any]:
+    """Convert a captured log message to (redacted) log format."""
+
+    return (
+        utils.convert_to_ndjson_format
+        if Constants.LOG_FORMAT == 'ndjson'
+        else utils.convert_to_log_format
+        )(
+        {
+            k: _redact_snapshot(v)
+            for k, v
+            in (
+                entry.msg
+                if entry.snapshot
+                else _snapshot_message(entry)
+                ).items()
+            }
+        )
+
+
+def _format_message(msg: dict[str, typing.Any]) -> str:
+    """Serialize a prepared (redacted) log message."""
+
+    if Constants.LOG_FORMAT == 'ndjson':
+        return codec.dumps(msg)
+    return (
+        prefix := '\n' + (' ' * Constants.INDENT)
+        ).join(
+            codec.dumps(
+                msg,
+                default=utils.prefix_value_to_string,
+                indent=Constants.INDENT,
+                sort_keys=True
+                ).split('\n')
+            ).replace(
+                Constants.NEW_LINE_TOKEN,
+                prefix
+                ) + '\n'
+
+
+def _make_record(log: logging.Logger, entry: _LogEntry) -> logging.LogRecord:
+    """Build the LogRecord for a captured log call."""
+
+    record = log.makeRecord(
+        log.name,
+        entry.level,
+        entry.fn,
+        entry.lno,
+        _format_message(_prepare_message(entry)),
+        tuple(),
+        None,  # exc_info
+        entry.func,
+        entry.extra,
+        entry.sinfo
+        )
+    record.created = entry.created
+    record.msecs = int((entry.created - int(entry.created)) * 1000) + 0.0
+    record.relativeCreated = (entry.created - logging._startTime) * 1000
+    record.thread = entry.thread
+    record.threadName = entry.thread_name
+    return record
+
+
+class LogWorker(threading.Thread):
+    """
+    Background thread formatting, redacting, and writing queued \
+    log calls in batches.
+
+    ---
+
+    Calling threads only capture the message, caller, and \
+    timestamp (dict and DocObject messages are copied first, as \
+    they may be modified after being logged); redaction, \
+    serialization, and writes happen here.
+
+    * At most `queue_size` calls are queued. When the queue is \
+    full, `overflow` either blocks the caller ('block'), drops the \
+    new call ('drop'), or drops the oldest queued call \
+    ('drop_oldest'); drops are counted in `dropped` and reported \
+    in the log.
+
+    * `stop()` signals the worker through an Event, so a stop \
+    request survives 'drop_oldest' discarding its wake-up sentinel.
+
+    * Up to `batch_size` records are written per handler at once, \
+    with a single write and flush for plain StreamHandlers.
+
+    """
+
+    def __init__(
+        self,
+        log: logging.Logger,
+        queue_size: int = Constants.LOG_QUEUE_SIZE,
+        overflow: str = Constants.LOG_OVERFLOW,
+        batch_size: int = Constants.LOG_BATCH_SIZE
+        ):
+        if overflow not in Constants.LOG_OVERFLOWS:
+            raise exceptions.InvalidLogOverflowError(
+                ' '.join(
+                    (
+                        'LOG_OVERFLOW must be one of:',
+                        f'{sorted(Constants.LOG_OVERFLOWS)!s}',
+                        f'\nLOG_OVERFLOW: {overflow!r}',
+                        )
+                    )
+                )
+        super().__init__(name='docent-log-worker', daemon=True)
+        self.log = log
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.dropped = 0
+        self._reported = 0
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._queue: queue.Queue[typing.Optional[_LogEntry]] = queue.Queue(
+            queue_size
+            )
+
+    def put(self, entry: _LogEntry) -> None:
+        """Queue a captured log call, applying the overflow policy."""
+
+        if self.overflow == 'block':
+            self._queue.put(entry)
+            return
+        while True:
+            try:
+                self._queue.put_nowait(entry)
+                return
+            except queue.Full:
+                if self.overflow == 'drop':
+                    self._drop()
+                    return
+            try:
+                oldest = self._queue.get_nowait()
+            except queue.Empty:
+                continue
+            self._queue.task_done()
+            if oldest is not None:  # Wake-up sentinel; see _stopping.
+                self._drop()
+
+    def _drop(self) -> None:
+        with self._lock:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Block until all queued log calls have been written."""
+
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Write all queued log calls, then stop the worker."""
+
+        self._stopping.set()
+        self._queue.put(None)
+        self.join()
+        while True:  # Queued by callers racing the stop.
+            try:
+                entry = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if entry is not None:
+                self.log.handle(_make_record(self.log, entry))
+            self._queue.task_done()
+
+    def run(self) -> None:
+        stopped = False
+        while not stopped:
+            if self._stopping.is_set() and self._queue.empty():
+                break
+            batch = [self._queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            records: list[logging.LogRecord] = []
+            for entry in batch:
+                if entry is None:
+                    stopped = True
+                    continue
+                try:
+                    records.append(_make_record(self.log, entry))
+                except Exception:
+                    if logging.raiseExceptions:
+                        sys.stderr.write(traceback.format_exc())
+            with self._lock:
+                dropped = self.dropped
+            if dropped > self._reported:
+                records.append(
+                    _make_record(
+                        self.log,
+                        _LogEntry(
+                            logging.WARNING,
+                            {
+                                'message': Constants.DROPPED_MSG.format(
+                                    dropped - self._reported
+                                    )
+                                },
+                            None,
+                            "(unknown file)",
+                            0,
+                            "(unknown function)",
+                            None,
+                            None,
+                            time.time(),
+                            self.ident,
+                            self.name
+                            )
+                        )
+                    )
+                self._reported = dropped
+            try:
+                self._write(records)
+            except Exception:
+                if logging.raiseExceptions:
+                    sys.stderr.write(traceback.format_exc())
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, records: list[logging.LogRecord]) -> None:
+        """Hand records to the log's handlers (as Logger.handle would)."""
+
+        log = self.log
+        if log.disabled or not (
+            records := [record for record in records if log.filter(record)]
+            ):
+            return
+        handlers: list[logging.Handler] = []
+        logger = log
+        while logger:
+            handlers.extend(logger.handlers)
+            if not logger.propagate:
+                break
+            logger = logger.parent
+        if not handlers and (handler := logging.lastResort) is not None:
+            handlers.append(handler)
+        for handler in handlers:
+            batch = [
+                record
+                for record
+                in records
+                if record.levelno >= handler.level
+                ]
+            if not batch:
+                continue
+            elif type(handler).emit is not logging.StreamHandler.emit:
+                for record in batch:
+                    handler.handle(record)
+                continue
+            lines: list[str] = []
+            for record in batch:
+                if handler.filter(record):
+                    try:
+                        lines.append(handler.format(record) + handler.terminator)  # noqa
+                    except Exception:
+                        handler.handleError(record)
+            if lines:
+                with handler.lock:
+                    try:
+                        handler.stream.write(''.join(lines))
+                        handler.flush()
+                    except Exception:
+                        handler.handleError(batch[-1])
+
+
+_WORKER: typing.Optional[LogWorker] = None
+
+
+def start_worker(
+    queue_size: int = Constants.LOG_QUEUE_SIZE,
+    overflow: str = Constants.LOG_OVERFLOW,
+    batch_size: int = Constants.LOG_BATCH_SIZE,
+    log: logging.Logger = None
+    ) -> LogWorker:
+    """
+    Move formatting and writing of central log records to a \
+    background LogWorker (done on startup if `LOG_ASYNC=true`).
+
+    ---
+
+    Queued records are written on `stop_worker()`, which is also \
+    called at interpreter exit.
+
+    """
+
+    global _WORKER
+
+    stop_worker()
+    _WORKER = LogWorker(
+        log or get_central_log(),
+        queue_size,
+        overflow,
+        batch_size
+        )
+    _WORKER.start()
+    return _WORKER
+
+
+def stop_worker() -> None:
+    """Write queued log records, then log synchronously again."""
+
+    global _WORKER
+
+    if (worker := _WORKER) is not None:
+        _WORKER = None
+        worker.stop()
+
+
+def flush() -> None:
+    """Block until all queued log records have been written."""
+
+    if (worker := _WORKER) is not None:
+        worker.flush()
+
+
+atexit.register(stop_worker)
 
 
 @functools.lru_cache(maxsize=1)
@@ -51,6 +732,14 @@ def get_central_log() -> logging.Logger:
     api keys, tokens, credit card numbers, connection strings, \
     secrets; essentially, almost all credentials will be redacted.
 
+    * Set `LOG_FORMAT=ndjson` to log one compact (unindented, \
+    unsorted) JSON object per line, instead of indented, key-sorted \
+    JSON.
+
+    * Set `LOG_ASYNC=true` to format and write records on a \
+    background LogWorker instead of the calling thread (see \
+    `LOG_QUEUE_SIZE`, `LOG_OVERFLOW`, and `LOG_BATCH_SIZE`).
+
     * All `warnings` will be filtered through this log and \
     displayed only once.
 
@@ -70,17 +759,39 @@ def get_central_log() -> logging.Logger:
     logging.Formatter.converter = time.gmtime
     logging.Formatter.default_time_format = Constants.FTIME_LOG
     logging.Formatter.default_msec_format = Constants.FTIME_LOG_MSEC
-    logging.basicConfig(
-        format=(' ' * Constants.INDENT).join(
-            (
-                '{\n',
-                '"level": %(levelname)s,\n',
-                '"time": %(asctime)s,\n',
-                '"log": %(name)s,\n',
-                '"data": %(message)s}',
+    if Constants.LOG_FORMAT not in Constants.LOG_FORMATS:
+        raise exceptions.InvalidLogFormatError(
+            ' '.join(
+                (
+                    'LOG_FORMAT must be one of:',
+                    f'{sorted(Constants.LOG_FORMATS)!s}',
+                    f'\nLOG_FORMAT: {Constants.LOG_FORMAT!r}',
+                    )
                 )
-            ),
-        )
+            )
+    elif Constants.LOG_FORMAT == 'ndjson':
+        logging.basicConfig(
+            format=''.join(
+                (
+                    '{"level": "%(levelname)s", ',
+                    '"time": "%(asctime)s", ',
+                    '"log": "%(name)s", ',
+                    '"data": %(message)s}',
+                    )
+                ),
+            )
+    else:
+        logging.basicConfig(
+            format=(' ' * Constants.INDENT).join(
+                (
+                    '{\n',
+                    '"level": %(levelname)s,\n',
+                    '"time": %(asctime)s,\n',
+                    '"log": %(name)s,\n',
+                    '"data": %(message)s}',
+                    )
+                ),
+            )
 
     log = logging.getLogger(__name__)
     log.setLevel(logging._nameToLevel[Constants.LOG_LEVEL])
@@ -129,6 +840,7 @@ def get_central_log() -> logging.Logger:
         stacklevel: int = 1,
         **kwargs
         ):  # noqa
+        created = time.time()
         sinfo = None
         if logging._srcfile:
             try:
@@ -141,50 +853,7 @@ def get_central_log() -> logging.Logger:
         if msg == '%s' and args:
             msg = args[0]
 
-        if isinstance(msg, str):
-            if level == logging.WARNING:
-                indices: list[int] = []
-                for i, msg_line in enumerate(s := msg.splitlines()):
-                    if (
-                        Constants.SILENCE_MSG == msg_line
-                        or Constants.WARN_MSG == msg_line
-                        ):
-                        indices.append(i)
-                    elif 'warn(' in msg_line and not indices:
-                        indices.append(0)
-                        indices.append(i)
-                        break
-                    elif 'warn(' in msg_line:
-                        indices.append(i)
-                        break
-                if len(indices) == 1:
-                    indices.append(len(s))
-                elif len(indices) < 1:
-                    indices = [0, len(s)]
-                if len(s) > 1 and (
-                    printed := Constants.NEW_LINE_TOKEN.join(
-                        s[indices[0] + 1:indices[1]]
-                        )
-                    ):
-                    msg = {
-                        'message': utils.prefix_value_to_string(s[indices[0]]),
-                        'printed': utils.prefix_value_to_string(printed)
-                        }
-                elif Constants.WARN_MSG in msg:
-                    msg = {'message': Constants.WARN_MSG}
-                elif Constants.SILENCE_MSG in msg:
-                    msg = {'message': Constants.SILENCE_MSG}
-                else:
-                    msg = {
-                        'message': utils.prefix_value_to_string(
-                            Constants.NEW_LINE_TOKEN.join(s)
-                            )
-                        }
-            else:
-                msg = {'message': utils.prefix_value_to_string(msg)}
-        elif isinstance(msg, objects.DocObject):
-            msg = {msg.__name__: msg}
-        elif not isinstance(msg, dict):
+        if not isinstance(msg, (str, dict, objects.DocObject)):
             raise exceptions.InvalidLogMessageTypeError(
                 'docent can only log: `dict, str, DocObject` types.'
                 )
@@ -197,60 +866,32 @@ def get_central_log() -> logging.Logger:
             exc_info[-1] is not None
             and not isinstance(exc_info[1], KeyboardInterrupt)
             ):
-            msg['traceback'] = (
-                traceback
-                .format_exc()
-                )
-
-        msg: dict[str, str] = utils.convert_to_log_format(
-            {
-                k: (
-                    [
-                        (
-                            _v.as_dbo
-                            if isinstance(_v, objects.DocObject)
-                            else _v
-                            )
-                        for _v
-                        in v
-                        ]
-                    if isinstance(v, list)
-                    else v.as_dbo
-                    if isinstance(v, objects.DocObject)
-                    else v
-                    )
-                for k, v
-                in msg.items()
-                }
-            )
+            tb = traceback.format_exc()
+        else:
+            tb = None
 
-        record = log.makeRecord(
-            log.name,
+        entry = _LogEntry(
             level,
+            msg,
+            tb,
             fn,
             lno,
-            (
-                prefix := '\n' + (' ' * Constants.INDENT)
-                ).join(
-                    utils.redact_string(
-                        json.dumps(
-                            msg,
-                            default=utils.prefix_value_to_string,
-                            indent=Constants.INDENT,
-                            sort_keys=True
-                            )
-                        ).split('\n')
-                    ).replace(
-                        Constants.NEW_LINE_TOKEN,
-                        prefix
-                        ) + '\n',
-            tuple(),
-            None,  # exc_info
             func,
             extra,
-            sinfo
+            sinfo,
+            created,
+            threading.get_ident(),
+            threading.current_thread().name
             )
-        log.handle(record)
+        if (worker := _WORKER) is not None:
+            if not isinstance(msg, str):  # Snapshot mutable messages.
+                entry.msg = _snapshot_message(entry)
+                entry.snapshot = True
+            worker.put(entry)
+        else:
+            log.handle(_make_record(log, entry))
 
     log._log = _custom_log
+    if Constants.LOG_ASYNC:
+        start_worker(log=log)
     return log
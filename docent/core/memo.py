@@ -0,0 +1,69 @@
+__all__ = (
+    'clear',
+    'info',
+    'memoized',
+    )
+
+import functools
+import typing
+
+from . import constants
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    pass
+
+
+_MEMOS: dict[str, functools._lru_cache_wrapper] = {}
+
+
+def memoized(
+    maxsize: int = None
+    ) -> typing.Callable[[typing.Callable], functools._lru_cache_wrapper]:
+    """
+    Bounded (least recently used) memoization for docent internals.
+
+    ---
+
+    Memoized functions are registered by qualified name, so their \
+    statistics can be read together with `info()` and their \
+    entries dropped together with `clear()`.
+
+    * `maxsize` defaults to the `MEMO_MAXSIZE` environment variable \
+    (4096 if unset).
+
+    ```py
+    @docent.core.memo.memoized()
+    def get_schema_reference_from_object(obj: DocObject) -> dict:
+        ...
+
+    docent.core.memo.info()
+    >>>
+    {'docent.rest.utils.get_schema_reference_from_object': CacheInfo(hits=..., misses=..., maxsize=4096, currsize=...), ...}
+
+    ```
+
+    """  # noqa
+
+    def decorator(func: typing.Callable) -> functools._lru_cache_wrapper:
+        memo = functools.lru_cache(
+            maxsize=Constants.MEMO_MAXSIZE if maxsize is None else maxsize
+            )(func)
+        _MEMOS['.'.join((func.__module__, func.__qualname__))] = memo
+        return memo
+
+    return decorator
+
+
+def info() -> dict[str, functools._CacheInfo]:
+    """Return hits, misses, maxsize, and size of every memoized function."""  # noqa
+
+    return {name: memo.cache_info() for name, memo in _MEMOS.items()}
+
+
+def clear() -> None:
+    """Drop the entries of every memoized function."""
+
+    for memo in _MEMOS.values():
+        memo.cache_clear()
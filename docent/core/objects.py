@@ -1,26 +1,244 @@
 __all__ = (
+    'DocColumns',
     'DocObject',
     'DocRecords',
+    'LazyDocObject',
     )
 
 import abc
+import collections.abc
 import dataclasses
-import enum
 import functools
 import hashlib
-import json
+import itertools
+import operator
 import re
 import typing
 
+from . import codec
 from . import constants
 from . import exceptions
+from . import memo
+from . import query
 from . import types
 from . import utils
 
 
 class Constants(constants.PackageConstants):  # noqa
 
-    pass
+    HASH_MODES: frozenset[str] = frozenset(
+        (
+            'sha1',
+            'tuple',
+            )
+        )
+    SCALAR_TYPES: frozenset[type] = frozenset(
+        (
+            bool,
+            bytes,
+            float,
+            int,
+            str,
+            )
+        )
+
+
+def _keys_for_attribute(
+    cls: 'DocObject',
+    k: str
+    ) -> typing.Optional[tuple[str, str]]:
+    """
+    Output keys (dbo, rest) for an attribute of a DocObject derivative,
+    or None if the attribute is not serialized.
+
+    """
+
+    if (
+        (
+            k.removesuffix('_').lower().endswith('id')
+            or not k.startswith('_')
+            )
+        and not (
+            hasattr(cls, k)
+            and isinstance(getattr(cls, k), functools.cached_property)
+            )
+        ):
+        return (k.removesuffix('_'), utils.to_camel_case(k.strip('_')))
+
+
+@memo.memoized()
+def _get_serializer(
+    cls: 'DocObject'
+    ) -> dict[str, typing.Optional[tuple[str, str]]]:
+    """
+    Get (or compile on first use) the serializer for a
+    DocObject derivative.
+
+    ---
+
+    The serializer maps every attribute name seen on instances of \
+    the class to its precomputed output keys, so that include rules, \
+    underscore handling, and camelCase conversion are all derived \
+    once per class instead of once per serialized object.
+
+    """
+
+    return {
+        k: _keys_for_attribute(cls, k)
+        for k
+        in types.DocLayout.from_object(cls).field_order
+        }
+
+
+@memo.memoized(maxsize=1)
+def _get_numpy() -> typing.Any:
+    """
+    Import NumPy on first use by DocColumns (returning None if it \
+    is not installed), so importing docent never imports it.
+
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+@memo.memoized()
+def _get_hash_key(
+    cls: 'DocObject'
+    ) -> typing.Callable[['DocObject'], tuple]:
+    """
+    Get (or compile on first use) a function returning the values \
+    of a DocObject derivative's hashable fields from an instance, \
+    as a tuple.
+
+    """
+
+    hashable_fields = types.DocLayout.from_object(cls).hashable_fields
+    if len(hashable_fields) > 1:
+        return operator.attrgetter(*hashable_fields)
+    elif hashable_fields:
+        return lambda o, k=hashable_fields[0]: (getattr(o, k), )  # noqa
+    else:
+        return lambda o: ()  # noqa
+
+
+def _get_items(
+    obj: 'DocObject'
+    ) -> typing.Iterable[tuple[str, typing.Any]]:
+    """
+    Return (attribute, value) pairs for a DocObject: items of its \
+    __dict__ or, for slotted derivatives, its (assigned) fields.
+
+    """
+
+    try:
+        return obj.__dict__.items()
+    except AttributeError:
+        return [
+            (k, v)
+            for k
+            in types.DocLayout.from_object(obj.__class__).field_order
+            if (v := getattr(obj, k, _UNSET)) is not _UNSET
+            ]
+
+
+@memo.memoized()
+def _get_nested_types(
+    cls: 'DocObject'
+    ) -> dict[str, type['DocObject']]:
+    """
+    Get (or compute on first use) the DocObject type of each field \
+    of a DocObject derivative annotated as one (or Optional thereof).
+
+    """
+
+    nested_types: dict[str, type['DocObject']] = {}
+    for k, field in types.DocLayout.from_object(cls).fields.items():
+        tp = field.type
+        if types._is_union(tp):
+            args = [a for a in typing.get_args(tp) if a is not type(None)]
+            if len(args) == 1:
+                tp = args[0]
+        if (
+            isinstance(tp, type)
+            and typing.get_origin(tp) is None  # ex. list[str] (python 3.9)
+            and issubclass(tp, DocObject)
+            ):
+            nested_types[k] = tp
+    return nested_types
+
+
+@memo.memoized()
+def _get_passthrough_keys(
+    cls: 'DocObject',
+    camel_case: bool
+    ) -> frozenset[str]:
+    """Output keys of a DocObject derivative's fields."""
+
+    return frozenset(
+        output_keys[1 if camel_case else 0]
+        for k
+        in types.DocLayout.from_object(cls).field_order
+        if (output_keys := _keys_for_attribute(cls, k)) is not None
+        )
+
+
+_UNSET = object()
+
+
+def _value_to_dbo(
+    v: typing.Any,
+    camel_case: bool = False,
+    include_null: bool = True,
+    ) -> typing.Any:
+    """Recursively convert a (non-null, non-scalar) field value to dbo."""
+
+    if isinstance(v, DocObject):
+        return v._to_dbo(camel_case, include_null)
+    elif isinstance(v, dict):
+        v: dict[str, typing.Any]
+        return {
+            (
+                utils.to_camel_case(_k.strip('_'))
+                if camel_case
+                else _k
+                ): (
+                    _v._to_dbo(camel_case, include_null)
+                    if isinstance(_v, DocObject)
+                    else
+                    _v
+                    )
+            for _k, _v
+            in v.items()
+            if (
+                _k.removesuffix('_').lower().endswith('id')
+                or not _k.startswith('_')
+                )
+            and (
+                _v is not None
+                if not include_null
+                else True
+                )
+            }
+    elif isinstance(v, list):
+        return [
+            _v._to_dbo(camel_case, include_null)
+            if isinstance(_v, DocObject)
+            else
+            _v
+            for _v
+            in v
+            if (
+                _v is not None
+                if not include_null
+                else True
+                )
+            ]
+    else:
+        return v
 
 
 @dataclasses.dataclass
@@ -236,6 +454,65 @@ class DocObject(metaclass=types.DocMeta):
     translate (or 'ignore') additional requirements about the object \
     into an Open API specification.
 
+    #### Change Tracking
+    Set `TRACK_CHANGES = True` on a derivative to record which fields \
+    are assigned after construction. Fields passed to the constructor \
+    (or re-assigned in `__post_init__`) count as assigned.
+
+    * Truthiness, diffs, and merges between tracked objects of the \
+    same type then only need to evaluate assigned fields.
+
+    * `dirty_fields` and `as_dirty_dbo` return the fields (and their \
+    values) assigned since construction or since the last call to \
+    `mark_clean()` -- useful for sending only what changed to a \
+    data store on PATCH.
+
+    * In-place mutations (ex. `pet.tags.append('good')`) are not \
+    assignments: follow them with `pet.mark_dirty('tags')`.
+
+    ```py
+    @dataclasses.dataclass
+    class Pet(docent.core.DocObject):
+        \"""A pet.\"""
+
+        TRACK_CHANGES = True
+
+        id_: str = None
+        name: str = None
+
+
+    pet = Pet(id_='abc123', name='Bob')
+    pet.mark_clean()
+    pet.name = 'Bobby'
+    pet.as_dirty_dbo
+    >>>
+    {'name': 'Bobby'}
+
+    ```
+
+    #### Slots
+    Derivatives may be declared with `@dataclasses.dataclass(slots=True)` \
+    to store field values without a per-instance `__dict__`, which \
+    saves memory when holding many objects.
+
+    * Serialization, dict style access, hashing, diffs, and change \
+    tracking all work the same way for slotted derivatives.
+
+    * Only declared fields can be set on slotted instances, and \
+    `functools.cached_property` cannot be used on them.
+
+    #### Lazy Nested Objects
+    Set `LAZY_NESTED = True` on a derivative to keep dicts passed \
+    (via `from_dict`, `from_rest`, or request parsing) for fields \
+    annotated as DocObjects as raw dicts until first accessed.
+
+    * The field value is a `LazyDocObject` that builds the nested \
+    DocObject on first attribute access and stands in for it \
+    (including `isinstance` checks).
+
+    * Serializing an untouched nested object passes its raw dict \
+    straight through when its keys already match the output casing.
+
     ---
 
     Special Method Usage
@@ -249,6 +526,16 @@ class DocObject(metaclass=types.DocMeta):
     the DocObject instance are different from default values, \
     otherwise False.
 
+    ```py
+    hash(DocObject)
+    ```
+
+    DocObjects hash on the values of their `hashable_fields` \
+    (id / key fields, else name fields, else all fields) as a tuple. \
+    Use `DocObject.digest` for a SHA-1 hex digest of the same values \
+    that is stable across processes (or set `HASH_MODE = 'sha1'` on \
+    the derivative to hash on that digest).
+
     ```py
     print(DocObject)
     ```
@@ -298,6 +585,18 @@ class DocObject(metaclass=types.DocMeta):
 
     """
 
+    __slots__ = (
+        '__digest',
+        '__dirty',
+        '__hash',
+        '__settled',
+        '__weakref__',
+        )
+
+    HASH_MODE: typing.ClassVar[str] = 'tuple'
+    LAZY_NESTED: typing.ClassVar[bool] = False
+    TRACK_CHANGES: typing.ClassVar[bool] = False
+
     def __init_subclass__(cls):
         if cls.fields and not any((cls.isCamelCase, cls.is_snake_case)):
             raise exceptions.IncorrectCasingError(
@@ -345,27 +644,61 @@ class DocObject(metaclass=types.DocMeta):
                     )
 
         if not cls.doc_path.startswith('docent.core'):
-            cls.APPLICATION_OBJECTS.setdefault(cls.reference, cls)
-
-        def __hash__(self: 'DocObject') -> int:
-            return int(
-                hashlib.sha1(
-                    Constants.DOC_DELIM.join(
-                        [
-                            str(self[k])
-                            for k
-                            in self.hashable_fields
-                            ]
-                        ).encode()
-                    ).hexdigest(),
-                base=16
+            registered = cls.APPLICATION_OBJECTS.setdefault(cls.reference, cls)  # noqa
+            if (
+                registered is not cls
+                and (fields := cls.__dict__.get('__dataclass_fields__'))
+                and registered.__dict__.get('__dataclass_fields__') is fields
+                ):  # Replaced by dataclass(slots=True) with a new class.
+                cls.APPLICATION_OBJECTS[cls.reference] = cls
+
+        if cls.HASH_MODE not in Constants.HASH_MODES:
+            raise exceptions.InvalidHashModeError(
+                ' '.join(
+                    (
+                        'HASH_MODE for DocObject derivatives',
+                        f'must be one of: {sorted(Constants.HASH_MODES)!s}',
+                        f'\nHASH_MODE: {cls.HASH_MODE!r}',
+                        )
+                    )
                 )
+        elif cls.HASH_MODE == 'sha1':
+
+            def __hash__(self: 'DocObject') -> int:
+                return int(self.digest, base=16)
+
+        elif cls.TRACK_CHANGES:  # Cleared by __setattr__ (see below).
+
+            def __hash__(self: 'DocObject') -> int:
+                if (h := self.__hash) is not None:
+                    return h
+                values = _get_hash_key(self.__class__)(self)
+                try:
+                    h = hash(values)
+                except TypeError:
+                    return hash(tuple([str(v) for v in values]))
+                if all(
+                    v is None or v.__class__ in Constants.SCALAR_TYPES
+                    for v
+                    in values
+                    ):
+                    object.__setattr__(self, '_DocObject__hash', h)
+                return h
 
-        if not hasattr(cls, '__hash__') or cls.__hash__ is None:
+        else:
+
+            def __hash__(self: 'DocObject') -> int:
+                values = _get_hash_key(self.__class__)(self)
+                try:
+                    return hash(values)
+                except TypeError:
+                    return hash(tuple([str(v) for v in values]))
+
+        if '__hash__' not in cls.__dict__ or cls.__hash__ is None:
             cls.__hash__ = __hash__
 
         def __repr__(self: 'DocObject') -> str:
-            return json.dumps(
+            return codec.dumps(
                 self.as_rest,
                 default=utils.prefix_value_to_string,
                 indent=Constants.INDENT,
@@ -374,12 +707,81 @@ class DocObject(metaclass=types.DocMeta):
 
         cls.__repr__ = __repr__
 
+        def __new__(
+            cls_: type['DocObject'],
+            *args: typing.Any,
+            **kwargs: typing.Any
+            ) -> 'DocObject':
+            self = object.__new__(cls_)
+            dirty = set(kwargs)
+            if args:
+                dirty.update(
+                    [
+                        k
+                        for k, field
+                        in cls_.__dataclass_fields__.items()
+                        if field.init
+                        and (
+                            field._field_type
+                            is not dataclasses._FIELD_CLASSVAR
+                            )
+                        ][:len(args)]
+                    )
+            object.__setattr__(self, '_DocObject__dirty', dirty)
+            object.__setattr__(self, '_DocObject__hash', None)
+            object.__setattr__(self, '_DocObject__settled', set())
+            return self
+
+        def __setattr__(self: 'DocObject', name: str, value: typing.Any):
+            try:
+                assigned = name in self.__dict__
+            except AttributeError:
+                assigned = hasattr(self, name)
+            if assigned:
+                self.__dirty.add(name)
+            if self.__hash is not None:
+                object.__setattr__(self, '_DocObject__hash', None)
+            super(cls, self).__setattr__(name, value)
+
+        def __getstate__(
+            self: 'DocObject'
+            ) -> tuple[typing.Optional[dict], dict]:
+            try:
+                state, slots = self.__dict__, {}
+            except AttributeError:
+                state, slots = None, dict(_get_items(self))
+            slots['_DocObject__dirty'] = set(self.__dirty)
+            slots['_DocObject__settled'] = set(self.__settled)
+            return state, slots
+
+        if cls.TRACK_CHANGES:
+            for name, method in (
+                ('__new__', staticmethod(__new__)),
+                ('__setattr__', __setattr__),
+                ('__getstate__', __getstate__),
+                ):
+                if (
+                    name not in cls.__dict__
+                    or (  # Copied by dataclass(slots=True) to a new class.
+                        getattr(cls.__dict__[name], '__qualname__', None)
+                        == method.__qualname__
+                        )
+                    ):
+                    setattr(cls, name, method)
+
         return super().__init_subclass__()
 
     def __bool__(self) -> bool:
         """Determine object truthiness by diff with default field values."""  # noqa
 
-        return bool(self - self.__class__())
+        if (assigned := self._assigned_fields()) is None:
+            return bool(self - self.__class__())
+        layout = types.DocLayout.from_object(self.__class__)
+        return any(
+            self._differs(self[field], layout.default_for(field))
+            for field
+            in assigned
+            )
 
     def __contains__(self, key: str) -> bool:
         """Return True if key (or alias) is a field for the DocObject derivative."""  # noqa
@@ -390,7 +792,7 @@ class DocObject(metaclass=types.DocMeta):
         """Return field value dict style."""
 
         if (k := self.__class__.key_for(key)):
-            return self.__dict__[k]
+            return getattr(self, k)
         else:
             raise KeyError(key)
 
@@ -405,17 +807,11 @@ class DocObject(metaclass=types.DocMeta):
     def __sub__(self, other: 'DocObject') -> dict[str, typing.Any]:
         """Calculate diff between same object types."""
 
+        if (assigned := self._assigned_fields(other)) is None:
+            assigned = types.DocLayout.from_object(self.__class__).fields
         diff = {}
-        for field in self.fields:
-            value = self[field]
-            other_value = other[field]
-            if (
-                isinstance(value, DocObject)
-                and isinstance(other_value, DocObject)
-                and value.as_dbo != other_value.as_dbo
-                ):
-                diff[field] = other_value
-            elif value != other_value:
+        for field in assigned:
+            if self._differs(self[field], (other_value := other[field])):
                 diff[field] = other_value
         return diff
 
@@ -423,16 +819,13 @@ class DocObject(metaclass=types.DocMeta):
         """Interpolate values from other if populated with non-default."""
 
         obj = other.__class__()
-        for field, field_meta in self.fields.items():
+        layout = types.DocLayout.from_object(self.__class__)
+        if (assigned := self._assigned_fields(other)) is None:
+            assigned = layout.fields
+        for field in assigned:
             value = self[field]
             other_value = other[field]
-            if isinstance(
-                field_meta.default_factory,
-                dataclasses._MISSING_TYPE
-                ):
-                default_value = field_meta.default
-            else:
-                default_value = field_meta.default_factory()
+            default_value = layout.default_for(field)
             if value != default_value:
                 obj[field] = value
             elif other_value != default_value:
@@ -445,119 +838,173 @@ class DocObject(metaclass=types.DocMeta):
         """Overwrite values with other if populated with non-default."""
 
         obj = other.__class__()
-        for field, field_meta in self.fields.items():
+        layout = types.DocLayout.from_object(self.__class__)
+        if (assigned := self._assigned_fields(other)) is None:
+            assigned = layout.fields
+        for field in assigned:
             value = self[field]
             other_value = other[field]
-            if isinstance(
-                field_meta.default_factory,
-                dataclasses._MISSING_TYPE
-                ):
-                default_value = field_meta.default
-            else:
-                default_value = field_meta.default_factory()
+            default_value = layout.default_for(field)
             if other_value != default_value:
                 obj[field] = other_value
             else:
                 obj[field] = value
         return obj
 
+    @staticmethod
+    def _differs(value: typing.Any, other_value: typing.Any) -> bool:
+        return (
+            (
+                isinstance(value, DocObject)
+                and isinstance(other_value, DocObject)
+                and value.as_dbo != other_value.as_dbo
+                )
+            or value != other_value
+            )
+
+    def _assigned_fields(
+        self,
+        other: 'DocObject' = None
+        ) -> typing.Optional[list[str]]:
+        """
+        Public fields assigned since construction (on self and other), \
+        or None if changes are not tracked for both objects.
+
+        """
+
+        if not self.TRACK_CHANGES or (
+            other is not None
+            and other.__class__ is not self.__class__
+            ):
+            return None
+        try:
+            assigned = self.__dirty | self.__settled
+            if other is not None:
+                assigned |= other.__dirty | other.__settled
+        except AttributeError:
+            return None
+        return [
+            field
+            for field
+            in types.DocLayout.from_object(self.__class__).fields
+            if field in assigned
+            ]
+
     def _to_dbo(
         self,
         camel_case: bool = False,
         include_null: bool = True,
+        fields: typing.Optional[list[str]] = None,
         ) -> typing.Union[dict, list[dict]]:
-        d = {
-            k: v
-            for k, v
-            in self.__dict__.items()
-            if (
-                k.removesuffix('_').lower().endswith('id')
-                or not k.startswith('_')
-                )
-            and (
-                v is not None
-                if not include_null
-                else True
-                )
-            and (
-                not isinstance(
-                    getattr(self.__class__, k),
-                    functools.cached_property
-                    )
-                if hasattr(self.__class__, k)
-                else True
-                )
-            }
+        serializer = _get_serializer(self.__class__)
+        i = 1 if camel_case else 0
         dbo: dict[str, typing.Any] = {}
-        for k, v in d.items():
-            if isinstance(v, DocObject):
-                dbo[k] = v._to_dbo(camel_case, include_null)
-            elif isinstance(v, dict):
-                v: dict[str, typing.Any]
-                dbo[k] = {
-                    (
-                        utils.to_camel_case(_k.strip('_'))
-                        if camel_case
-                        else _k
-                        ): (
-                            _v._to_dbo(camel_case, include_null)
-                            if isinstance(_v, DocObject)
-                            else
-                            _v
-                            )
-                    for _k, _v
-                    in v.items()
-                    if (
-                        _k.removesuffix('_').lower().endswith('id')
-                        or not _k.startswith('_')
-                        )
-                    and (
-                        _v is not None
-                        if not include_null
-                        else True
-                        )
-                    }
-            elif isinstance(v, list) and not isinstance(v, str):
-                dbo[k] = [
-                    _v._to_dbo(camel_case, include_null)
-                    if isinstance(_v, DocObject)
-                    else
-                    _v
-                    for _v
-                    in v
-                    if (
-                        _v is not None
-                        if not include_null
-                        else True
-                        )
-                    ]
+        for k, v in (
+            _get_items(self)
+            if fields is None
+            else [(k, getattr(self, k)) for k in fields]
+            ):
+            try:
+                keys = serializer[k]
+            except KeyError:
+                keys = serializer[k] = _keys_for_attribute(self.__class__, k)
+            if keys is None:
+                continue
+            elif v is None:
+                if include_null:
+                    dbo[keys[i]] = v
+            elif v.__class__ in Constants.SCALAR_TYPES:
+                dbo[keys[i]] = v
             else:
-                dbo[k] = v
-        if camel_case:
-            dbo = {
-                utils.to_camel_case(k.strip('_')): v
-                for k, v
-                in dbo.items()
-                }
-        else:
-            dbo = {
-                k.removesuffix('_'): v
-                for k, v
-                in dbo.items()
-                }
+                dbo[keys[i]] = _value_to_dbo(v, camel_case, include_null)
         return dbo
 
+    def mark_clean(self) -> None:
+        """Reset dirty fields (no-op unless TRACK_CHANGES is set)."""
+
+        if self.TRACK_CHANGES:
+            self.__settled.update(self.__dirty)
+            self.__dirty.clear()
+
+    def mark_dirty(self, *fields: str) -> None:
+        """
+        Flag fields (or their aliases) as dirty, ex. after an in-place \
+        mutation (no-op unless TRACK_CHANGES is set).
+
+        """
+
+        for field in fields:
+            if not (k := self.__class__.key_for(field)):
+                raise KeyError(field)
+            elif self.TRACK_CHANGES:
+                self.__dirty.add(k)
+
+    @property
+    def dirty_fields(self) -> list[str]:
+        """
+        Fields assigned since construction or the last call to \
+        mark_clean (if TRACK_CHANGES is set), otherwise fields \
+        with non-default values.
+
+        """
+
+        if self.TRACK_CHANGES:
+            return [
+                field
+                for field
+                in types.DocLayout.from_object(self.__class__).fields
+                if field in self.__dirty
+                ]
+        else:
+            return list(self - self.__class__())
+
+    @property
+    def digest(self) -> str:
+        """
+        SHA-1 hex digest of the object's hashable field values, \
+        stable across processes (unlike the built-in hash).
+
+        """
+
+        values = _get_hash_key(self.__class__)(self)
+        try:
+            cached_values, digest = self.__digest
+        except AttributeError:
+            pass
+        else:
+            if (
+                len(cached_values) == len(values)
+                and all(map(operator.is_, cached_values, values))
+                ):
+                return digest
+        digest = hashlib.sha1(
+            Constants.DOC_DELIM.join([str(v) for v in values]).encode()
+            ).hexdigest()
+        if all(
+            v is None or v.__class__ in Constants.SCALAR_TYPES
+            for v
+            in values
+            ):
+            object.__setattr__(self, '_DocObject__digest', (values, digest))
+        return digest
+
     @property
     def as_dbo(self) -> typing.Union[dict, list[dict]]:
         """Recursively return object as a dictionary or list thereof."""
 
         return self._to_dbo()
 
+    @property
+    def as_dirty_dbo(self) -> dict:
+        """Return only dirty fields as_dbo."""
+
+        return self._to_dbo(fields=self.dirty_fields)
+
     @property
     def as_json(self) -> str:
         """Return object as a camelCase, JSON serialized string."""
 
-        return json.dumps(self.as_rest, default=str, sort_keys=True)
+        return codec.dumps(self.as_rest, default=str, sort_keys=True)
 
     @property
     def as_rest(self) -> dict:
@@ -573,13 +1020,13 @@ class DocObject(metaclass=types.DocMeta):
         """Load object from a camelCase REST request."""
 
         if isinstance(rest_obj, str):
-            rest_obj = json.loads(
-                re.sub(
+            if '+' in rest_obj:
+                rest_obj = re.sub(
                     Constants.RE_JSON,
                     '',
                     rest_obj
                     )
-                )
+            rest_obj = codec.loads(rest_obj)
 
         return cls.from_dict(rest_obj)
 
@@ -587,18 +1034,50 @@ class DocObject(metaclass=types.DocMeta):
     def from_dict(cls, d: dict[str, typing.Any]) -> 'DocObject':
         """Instantiate object from a dict representation."""
 
+        key_for = cls.key_for
+        if cls.LAZY_NESTED:
+            return cls(**_lazy_kwargs(cls, d))
         return cls(
             **{
                 k: v
                 for _k, v
                 in d.items()
-                if (k := cls.key_for(_k))
+                if (k := key_for(_k))
                 }
             )
 
+    @classmethod
+    def from_dicts(
+        cls,
+        ds: list[dict[str, typing.Any]]
+        ) -> list['DocObject']:
+        """Instantiate objects in bulk from a list of dict representations."""
+
+        key_for = cls.key_for
+        if cls.LAZY_NESTED:
+            return [cls(**_lazy_kwargs(cls, d)) for d in ds]
+        return [
+            cls(
+                **{
+                    k: v
+                    for _k, v
+                    in d.items()
+                    if (k := key_for(_k))
+                    }
+                )
+            for d
+            in ds
+            ]
+
+    @classmethod
+    @property
+    def layout(cls) -> types.DocLayout:
+        """Immutable field layout for the object."""
+
+        return types.DocLayout.from_object(cls)
+
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def hashable_fields(cls) -> list[str]:
         """
         Set of minimum fields required to compute a unique hash
@@ -606,65 +1085,28 @@ class DocObject(metaclass=types.DocMeta):
 
         """
 
-        id_fields: list[str] = []
-        name_fields: list[str] = []
-        for f in cls.fields:
-            if (s := f.strip('_').lower()).endswith('id'):
-                id_fields.append(f)
-            elif s.endswith('key'):
-                id_fields.append(f)
-            elif s.startswith('name') or s.endswith('name'):
-                name_fields.append(f)
-
-        if id_fields:
-            return id_fields
-        elif name_fields:
-            return name_fields
-        else:
-            return list(cls.fields)
+        return list(types.DocLayout.from_object(cls).hashable_fields)
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def enumerations(cls) -> dict[str, list]:
         """Dictionary containing all enums for object."""
 
-        d: dict[str, list] = {}
-        cls.fields: dict[str, dataclasses.Field]
-        for k, field in cls.fields.items():
-            if (
-                (field_enum := field.metadata.get('enum'))
-                and isinstance(field_enum, enum.EnumMeta)
-                ):
-                field_enum: enum.Enum
-                d[utils.to_camel_case(k)] = [e.value for e in field_enum]
-            elif field_enum:
-                d[utils.to_camel_case(k)] = list(field_enum)
-            if d.get(k) and field.metadata.get('nullable', True):
-                d[utils.to_camel_case(k)].append(None)
-
-        return d
+        return {
+            k: list(v)
+            for k, v
+            in types.DocLayout.from_object(cls).enumerations.items()
+            }
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def reference(cls) -> str:
         """Unique reference to the object's name and path."""
 
-        return Constants.DOC_DELIM.join(
-            (
-                *[
-                    utils.to_camel_case(s)
-                    for s
-                    in cls.doc_path.split('.')
-                    ],
-                utils.to_camel_case(cls.__name__)
-                )
-            )
+        return types.DocLayout.from_object(cls).reference
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def distribution(cls) -> str:
         """
         The docent distribution to which the object belongs, or,
@@ -672,24 +1114,17 @@ class DocObject(metaclass=types.DocMeta):
         of that package.
         """
 
-        if 'docent' in cls.doc_path and '.objects' in cls.doc_path:
-            pkg, dist, *_ = cls.doc_path.split('.')
-            dist = dist.replace('_', '-')
-            return f'{pkg}[{dist}]'
-        else:
-            return cls.doc_path.split('.')[0]
+        return types.DocLayout.from_object(cls).distribution
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def doc_path(cls) -> str:
         """Full path to object file within its package."""
 
-        return cls.__module__
+        return types.DocLayout.from_object(cls).doc_path
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def description(cls) -> str:
         """
         Brief description of the object.
@@ -699,39 +1134,24 @@ class DocObject(metaclass=types.DocMeta):
         name and membership is generated.
         """
 
-        default_dataclasses_docstring = cls.__name__ + '(*args, **kwargs)'
-        if cls.__doc__ and cls.__doc__ != default_dataclasses_docstring:
-            return cls.__doc__
-        else:
-            return cls.default_description
+        return types.DocLayout.from_object(cls).description
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def default_description(cls) -> str:
         """Simple description derived from class and package name."""
 
-        return ' '.join(
-            (
-                'An object called',
-                cls.__name__,
-                'belonging to the',
-                cls.distribution,
-                'distribution.'
-                )
-            )
+        return types.DocLayout.from_object(cls).default_description
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def is_snake_case(cls) -> bool:
         """True if object is snake_case."""
 
-        return utils.is_snake_case(cls.fields)
+        return types.DocLayout.from_object(cls).is_snake_case
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def isCamelCase(cls) -> bool:
         """
         True if object is camelCase.
@@ -740,23 +1160,137 @@ class DocObject(metaclass=types.DocMeta):
         will not be evaluated.
         """
 
-        return utils.isCamelCase(cls.fields)
+        return types.DocLayout.from_object(cls).isCamelCase
 
     @classmethod
     @property
-    def fields(cls) -> dict[str, dataclasses.Field]:
-        """Return public fields for object."""
+    def fields(cls) -> typing.Mapping[str, dataclasses.Field]:
+        """Return public fields for object (read-only)."""
 
-        d = {}
-        v: dataclasses.Field
-        for k, v in cls.__dataclass_fields__.items():
-            if (
-                k.startswith('_')
-                and not k.removesuffix('_').lower().endswith('id')
-                ):
-                continue
-            d[k] = v
-        return d
+        return types.DocLayout.from_object(cls).fields
+
+
+def _lazy_kwargs(
+    cls: type[DocObject],
+    d: dict[str, typing.Any]
+    ) -> dict[str, typing.Any]:
+    """Constructor kwargs from a dict, with nested dicts left lazy."""
+
+    key_for = cls.key_for
+    nested_types = _get_nested_types(cls)
+    return {
+        k: (
+            LazyDocObject(nested_types[k], v)
+            if k in nested_types and v.__class__ is dict
+            else v
+            )
+        for _k, v
+        in d.items()
+        if (k := key_for(_k))
+        }
+
+
+class LazyDocObject:
+    """
+    Raw dict standing in for a nested DocObject until first \
+    attribute access.
+
+    ---
+
+    See `DocObject.LAZY_NESTED`.
+
+    """
+
+    __slots__ = (
+        '_obj',
+        '_raw',
+        '_record_type',
+        )
+
+    def __init__(self, record_type: type[DocObject], raw: dict[str, typing.Any]):  # noqa
+        _set_lazy_obj(self, None)
+        _set_lazy_raw(self, raw)
+        _set_lazy_record_type(self, record_type)
+
+    @property
+    def __class__(self) -> type[DocObject]:
+        return self._record_type
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._hydrate(), name)
+
+    def __setattr__(self, name: str, value: typing.Any):
+        setattr(self._hydrate(), name, value)
+
+    def __delattr__(self, name: str):
+        delattr(self._hydrate(), name)
+
+    def __bool__(self) -> bool:
+        return bool(self._hydrate())
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._hydrate()
+
+    def __eq__(self, other: typing.Any) -> bool:
+        return self._hydrate() == other
+
+    def __getitem__(self, key: str) -> typing.Any:
+        return self._hydrate()[key]
+
+    def __hash__(self) -> int:
+        return hash(self._hydrate())
+
+    def __lshift__(self, other: DocObject) -> DocObject:
+        return self._hydrate() << other
+
+    def __reduce_ex__(self, protocol: int):
+        return self._hydrate().__reduce_ex__(protocol)
+
+    def __repr__(self) -> str:
+        return repr(self._hydrate())
+
+    def __rshift__(self, other: DocObject) -> DocObject:
+        return self._hydrate() >> other
+
+    def __setitem__(self, key: str, value: typing.Any):
+        self._hydrate()[key] = value
+
+    def __sub__(self, other: DocObject) -> dict[str, typing.Any]:
+        return self._hydrate() - other
+
+    @property
+    def is_hydrated(self) -> bool:
+        return self._obj is not None
+
+    def _hydrate(self) -> DocObject:
+        if (obj := self._obj) is None:
+            obj = self._record_type.from_dict(self._raw)
+            _set_lazy_obj(self, obj)
+        return obj
+
+    def _to_dbo(
+        self,
+        camel_case: bool = False,
+        include_null: bool = True,
+        fields: typing.Optional[list[str]] = None,
+        ) -> typing.Union[dict, list[dict]]:
+        if (
+            self._obj is None
+            and fields is None
+            and self._raw.keys() <= _get_passthrough_keys(
+                self._record_type,
+                camel_case
+                )
+            ):
+            if include_null:
+                return dict(self._raw)
+            return {k: v for k, v in self._raw.items() if v is not None}
+        return self._hydrate()._to_dbo(camel_case, include_null, fields)
+
+
+_set_lazy_obj = LazyDocObject._obj.__set__
+_set_lazy_raw = LazyDocObject._raw.__set__
+_set_lazy_record_type = LazyDocObject._record_type.__set__
 
 
 @dataclasses.dataclass
@@ -776,19 +1310,25 @@ class DocRecords(abc.ABC, DocObject):
     DocRecords truthiness will evaluate to True if records \
     is not an empty list.
 
+    ```py
+    DocObject in DocRecords
+    ```
+
+    Returns True if an equal record is contained in DocRecords.
+
     ```py
     DocRecords1 + DocRecords2
     ```
 
     Extends records contained in DocRecords1 with all records \
-    from DocRecords2.
+    from DocRecords2 that do not already exist in DocRecords1.
 
     ```py
     DocRecords1 += DocRecords2
     ```
 
     In-place extension of DocRecords1 to include all records \
-    from DocRecords2.
+    from DocRecords2 that do not already exist in DocRecords1.
 
     ```py
     DocRecords1 - DocRecords2
@@ -804,8 +1344,38 @@ class DocRecords(abc.ABC, DocObject):
     In-place removal of all records contained in DocRecords1 that already \
     exist in DocRecords2.
 
+    ```py
+    DocRecords1 & DocRecords2
+    ```
+
+    Returns unique records contained in both DocRecords1 and DocRecords2.
+
+    ```py
+    DocRecords1 | DocRecords2
+    ```
+
+    Returns unique records contained in either DocRecords1 or DocRecords2.
+
+    ---
+
+    Notes
+    -----
+
+    * Membership checks and the operators above use a hash index \
+    over the records' `hashable_fields`, built on first use and \
+    kept in sync on `+=`, so they run in linear time.
+
+    * The index is rebuilt automatically whenever `records` is \
+    re-assigned or changes length. Call `reindex()` after replacing \
+    records in place (ex. `records[0] = pet`) or after changing the \
+    `hashable_fields` of contained records.
+
+    * Results are always of the same (concrete) type as DocRecords1.
+
     """
 
+    __slots__ = ('__index', '__indexed', '__dict__')
+
     records: list[DocObject] = dataclasses.field(
         default_factory=list
         )
@@ -819,13 +1389,43 @@ class DocRecords(abc.ABC, DocObject):
         ...
 
     def __add__(self, other: 'DocRecords') -> 'DocRecords':
-        return DocRecords(records=self.records + other.records)
+        obj = dataclasses.replace(self, records=list(self.records))
+        obj += other
+        return obj
+
+    def __and__(self, other: 'DocRecords') -> 'DocRecords':
+        seen: dict[typing.Optional[int], list[DocObject]] = {}
+        return dataclasses.replace(
+            self,
+            records=[
+                record
+                for record
+                in self.records
+                if record in other
+                and self._add_to_index(seen, record)
+                ]
+            )
 
     def __bool__(self) -> bool:
         return bool(self.records)
 
+    def __contains__(self, item: typing.Union[DocObject, str]) -> bool:
+        if isinstance(item, DocObject):
+            return item in self._get_index().get(self._index_key(item), ())
+        else:
+            return super().__contains__(item)
+
     def __iadd__(self, other: 'DocRecords') -> 'DocRecords':
-        self.records.extend(other.records)
+        index = self._get_index()
+        self.records.extend(
+            [
+                record
+                for record
+                in other.records
+                if self._add_to_index(index, record)
+                ]
+            )
+        self.__indexed = (self.records, len(self.records))
         return self
 
     def __isub__(self, other: 'DocRecords') -> 'DocRecords':
@@ -833,24 +1433,373 @@ class DocRecords(abc.ABC, DocObject):
             record
             for record
             in self.records
-            if record not in other.records
+            if record not in other
             ]
         return self
 
     def __len__(self) -> int:
         return len(self.records)
 
+    def __or__(self, other: 'DocRecords') -> 'DocRecords':
+        seen: dict[typing.Optional[int], list[DocObject]] = {}
+        return dataclasses.replace(
+            self,
+            records=[
+                record
+                for records
+                in (self.records, other.records)
+                for record
+                in records
+                if self._add_to_index(seen, record)
+                ]
+            )
+
     def __sub__(self, other: 'DocRecords') -> 'DocRecords':
-        return DocRecords(
+        return dataclasses.replace(
+            self,
             records=[
                 record
                 for record
                 in self.records
-                if record not in other.records
+                if record not in other
                 ]
             )
 
+    @staticmethod
+    def _index_key(record: DocObject) -> typing.Optional[int]:
+        try:
+            return hash(record)
+        except TypeError:
+            return None
+
+    @classmethod
+    def _add_to_index(
+        cls,
+        index: dict[typing.Optional[int], list[DocObject]],
+        record: DocObject
+        ) -> bool:
+        """Add record to index, returning False if already indexed."""
+
+        if (bucket := index.get(key := cls._index_key(record))) is None:
+            index[key] = [record]
+        elif record in bucket:
+            return False
+        else:
+            bucket.append(record)
+        return True
+
+    def _get_index(self) -> dict[typing.Optional[int], list[DocObject]]:
+        try:
+            records, length = self.__indexed
+        except AttributeError:
+            records = length = None
+        if records is not self.records or length != len(self.records):
+            self.reindex()
+        return self.__index
+
+    def reindex(self) -> None:
+        """(Re)build the hash index of records."""
+
+        index: dict[typing.Optional[int], list[DocObject]] = {}
+        for record in self.records:
+            self._add_to_index(index, record)
+        self.__index = index
+        self.__indexed = (self.records, len(self.records))
+
     @functools.cached_property
     def record_type(self) -> DocObject:  # noqa
         records_field: dataclasses.Field = self.fields['records']
         return records_field.type.__args__[0]
+
+    def where(self, doc_query: dict[str, typing.Any]) -> 'DocRecords':
+        """
+        Return records matching a query (ex. `Pet.age > 10`), \
+        using the hash index where possible.
+
+        """
+
+        if not isinstance(doc_query, query.CompiledQuery):
+            doc_query = query.compile_query(doc_query, self.record_type)
+        return dataclasses.replace(self, records=doc_query.filter(self))
+
+
+class _Rows(collections.abc.MutableSequence):
+    """Mutable sequence of rows built on demand from columns."""
+
+    __slots__ = ('columns', 'record_type')
+
+    def __init__(
+        self,
+        record_type: type[DocObject],
+        columns: dict[str, list[typing.Any]]
+        ):
+        self.record_type = record_type
+        self.columns = columns
+
+    def __delitem__(self, i: typing.Union[int, slice]):
+        for column in self.columns.values():
+            del column[i]
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if isinstance(other, _Rows):
+            return (
+                self.record_type is other.record_type
+                and self.columns == other.columns
+                )
+        elif isinstance(other, collections.abc.Sequence):
+            return list(self) == list(other)
+        else:
+            return NotImplemented
+
+    def __getitem__(
+        self,
+        i: typing.Union[int, slice]
+        ) -> typing.Union[DocObject, list[DocObject]]:
+        if isinstance(i, slice):
+            return [self[j] for j in range(len(self))[i]]
+        return self.record_type(
+            **{k: column[i] for k, column in self.columns.items()}
+            )
+
+    def __iter__(self) -> typing.Iterator[DocObject]:
+        keys = tuple(self.columns)
+        for values in zip(*self.columns.values()):
+            yield self.record_type(**dict(zip(keys, values)))
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __setitem__(self, i: int, record: typing.Union[DocObject, dict]):
+        if isinstance(i, slice):
+            raise TypeError('Slice assignment is not supported for columns.')
+        for k, v in self._values(record).items():
+            self.columns[k][i] = v
+
+    def _values(
+        self,
+        record: typing.Union[DocObject, dict[str, typing.Any]]
+        ) -> dict[str, typing.Any]:
+        if isinstance(record, DocObject):
+            return {k: getattr(record, k) for k in self.columns}
+        layout = types.DocLayout.from_object(self.record_type)
+        values = {
+            k: v
+            for _k, v
+            in record.items()
+            if (k := self.record_type.key_for(_k)) in self.columns
+            }
+        return {
+            k: values[k] if k in values else layout.default_for(k)
+            for k
+            in self.columns
+            }
+
+    def _to_dbo(
+        self,
+        camel_case: bool = False,
+        include_null: bool = True,
+        ) -> list[dict[str, typing.Any]]:
+        serializer = _get_serializer(self.record_type)
+        i = 1 if camel_case else 0
+        keys: list[str] = []
+        columns: list[list[typing.Any]] = []
+        for k, column in self.columns.items():
+            if (key := serializer.get(k)) is None:
+                continue
+            keys.append(key[i])
+            if set(map(type, column)) <= Constants.SCALAR_TYPES | {type(None)}:  # noqa
+                columns.append(column)
+            else:
+                columns.append(
+                    [
+                        v
+                        if v is None or v.__class__ in Constants.SCALAR_TYPES
+                        else _value_to_dbo(v, camel_case, include_null)
+                        for v
+                        in column
+                        ]
+                    )
+        if include_null:
+            return [dict(zip(keys, values)) for values in zip(*columns)]
+        else:
+            return [
+                {k: v for k, v in zip(keys, values) if v is not None}
+                for values
+                in zip(*columns)
+                ]
+
+    def insert(self, i: int, record: typing.Union[DocObject, dict]):
+        for k, v in self._values(record).items():
+            self.columns[k].insert(i, v)
+
+    @classmethod
+    def from_records(
+        cls,
+        record_type: type[DocObject],
+        records: typing.Iterable[typing.Union[DocObject, dict]]
+        ) -> '_Rows':
+        """Copy rows, or convert records (or dicts) to columns."""
+
+        if isinstance(records, _Rows):
+            return cls(
+                record_type,
+                {k: list(column) for k, column in records.columns.items()}
+                )
+        rows = cls(
+            record_type,
+            {
+                k: []
+                for k, field
+                in record_type.__dataclass_fields__.items()
+                if field._field_type is dataclasses._FIELD
+                and field.init
+                }
+            )
+        columns = list(rows.columns.values())
+        for record in records:
+            for column, v in zip(columns, rows._values(record).values()):
+                column.append(v)
+        return rows
+
+
+@dataclasses.dataclass
+class DocColumns(DocRecords):
+    """
+    Columnar docent Container Object.
+
+    ---
+
+    A DocRecords variant that stores one list per `record_type` \
+    field instead of one DocObject per record, building records \
+    on demand.
+
+    ```py
+    import dataclasses
+
+    import docent.core
+
+    from . import objects
+
+
+    @dataclasses.dataclass
+    class Pets(docent.core.objects.DocColumns):
+        \"""Many pets.\"""
+
+        records: list[objects.Pet] = dataclasses.field(
+            default_factory=list
+            )
+
+
+    pets = Pets.from_rest({'records': [{'id': 'a1', 'name': 'Bob'}]})
+    pets.column('name')
+    >>>
+    ['Bob']
+
+    ```
+
+    * `records` accepts DocObjects or dicts (keyed on any field \
+    alias) and always holds a list-like view over the columns: \
+    records (and dicts) are converted to columns on assignment.
+
+    * Records returned by indexing or iteration are new objects: \
+    write changes back with `records[i] = record`.
+
+    * Serialization (`as_dbo`, `as_rest`, `as_json`) is built \
+    directly from the columns.
+
+    * When NumPy is installed, `column` and `select` return numeric \
+    columns as NumPy arrays, and `where` accepts boolean arrays, \
+    so filters can be vectorized. See below.
+
+    ```py
+    old_pets = pets.where(pets.column('age') > 10)
+    ```
+
+    """
+
+    def __getitem__(
+        self,
+        i: typing.Union[int, slice]
+        ) -> typing.Union[DocObject, list[DocObject]]:
+        return self.records[i]
+
+    def __iter__(self) -> typing.Iterator[DocObject]:
+        return iter(self.records)
+
+    def __setattr__(self, name: str, value: typing.Any):
+        if name == 'records':
+            value = _Rows.from_records(self.record_type, value)
+        super().__setattr__(name, value)
+
+    def _to_dbo(
+        self,
+        camel_case: bool = False,
+        include_null: bool = True,
+        fields: typing.Optional[list[str]] = None,
+        ) -> typing.Union[dict, list[dict]]:
+        dbo = super()._to_dbo(camel_case, include_null, fields)
+        if 'records' in dbo:
+            dbo['records'] = self.records._to_dbo(camel_case, include_null)
+        return dbo
+
+    def column(self, field: str) -> typing.Union[list, 'numpy.ndarray']:
+        """
+        Return a copy of the values for a field (or alias), as a \
+        NumPy array if NumPy is installed and the values are numeric.
+
+        """
+
+        if not (k := self.record_type.key_for(field)):
+            raise KeyError(field)
+        column = self.records.columns[k]
+        if (
+            (numpy := _get_numpy()) is not None
+            and (array := numpy.asarray(column)).dtype.kind in 'biuf'
+            ):
+            return array
+        else:
+            return list(column)
+
+    def select(
+        self,
+        *fields: str
+        ) -> dict[str, typing.Union[list, 'numpy.ndarray']]:
+        """Project fields (or aliases) to a dict of columns."""
+
+        return {field: self.column(field) for field in fields}
+
+    def where(
+        self,
+        mask: typing.Union[typing.Iterable[bool], dict[str, typing.Any]]
+        ) -> 'DocColumns':
+        """
+        Return records for which mask (ex. a boolean NumPy array) \
+        is True, or which match a query (ex. `Pet.age > 10`).
+
+        """
+
+        if isinstance(mask, dict):
+            mask = query.compile_query(mask, self.record_type)
+        if isinstance(mask, query.CompiledQuery):
+            mask = mask.mask(self)
+        elif (
+            (numpy := _get_numpy()) is not None
+            and isinstance(mask, numpy.ndarray)
+            ):
+            mask = mask.astype(bool).tolist()
+        else:
+            mask = list(mask)
+        return dataclasses.replace(
+            self,
+            records=_Rows(
+                self.record_type,
+                {
+                    k: list(itertools.compress(column, mask))
+                    for k, column
+                    in self.records.columns.items()
+                    }
+                )
+            )
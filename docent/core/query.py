@@ -0,0 +1,413 @@
+__all__ = (
+    'CompiledQuery',
+    'DocQuery',
+    'compile_query',
+    'to_sql',
+    )
+
+import dataclasses
+import itertools
+import keyword
+import typing
+
+from . import constants
+from . import exceptions
+from . import objects
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    AND: str = '__and__'
+    HASH_QUALNAME: str = 'DocObject.__init_subclass__.<locals>.__hash__'
+    OR: str = '__or__'
+    OPERATORS: dict[str, str] = {
+        '__eq__': '==',
+        '__ne__': '!=',
+        '__gt__': '>',
+        '__ge__': '>=',
+        '__gte__': '>=',
+        '__lt__': '<',
+        '__le__': '<=',
+        '__lte__': '<=',
+        }
+    ORDERING_OPERATORS: frozenset[str] = frozenset(('>', '>=', '<', '<='))
+
+
+class DocQuery(dict):
+    """
+    Query fragment, as returned by comparisons against DocFields.
+
+    ---
+
+    Fragments map field names to {operator: value} conditions \
+    and combine with `&` (and) and `|` (or).
+
+    ```py
+    import docent.template.package
+
+    Pet = docent.template.package.objects.Pet
+
+    query = (Pet.type == 'dog') & ((Pet.name == 'Bob') | (Pet.name == 'Al'))
+    query
+    >>>
+    {'__and__': [{'type': {'__eq__': 'dog'}}, {'__or__': [...]}]}
+
+    ```
+
+    Use `compile` (or `compile_query`) to build a predicate, then \
+    call it on DocObjects or use it to `filter` DocRecords and other \
+    iterables of DocObjects.
+
+    ```py
+    dogs = query.compile(Pet).filter(pets)
+    ```
+
+    """
+
+    def __and__(self, other: dict) -> 'DocQuery':
+        return self.__class__({Constants.AND: [self, other]})
+
+    def __or__(self, other: dict) -> 'DocQuery':
+        return self.__class__({Constants.OR: [self, other]})
+
+    def compile(
+        self,
+        record_type: type['objects.DocObject'] = None
+        ) -> 'CompiledQuery':
+        """Compile the query to a single predicate."""
+
+        return compile_query(self, record_type)
+
+
+@dataclasses.dataclass(frozen=True)
+class CompiledQuery:
+    """
+    A query compiled to a single predicate.
+
+    ---
+
+    * `predicate(obj)` evaluates the query against a DocObject.
+
+    * `column_predicate(*values)` evaluates the query against the \
+    values of `fields`, in order (ex. one row of a DocColumns).
+
+    * `equalities` are the field values every match must equal \
+    (used for index lookups).
+
+    * `conditions` are the (operator, value) comparisons every match \
+    must satisfy, by field (used for index lookups).
+
+    Ordering comparisons (`>`, `>=`, `<`, `<=`) against None values \
+    evaluate to False.
+
+    """
+
+    query: dict[str, typing.Any]
+    record_type: typing.Optional[type['objects.DocObject']]
+    fields: tuple[str, ...]
+    equalities: typing.Mapping[str, typing.Any]
+    conditions: typing.Mapping[str, tuple[tuple[str, typing.Any], ...]]
+    predicate: typing.Callable[['objects.DocObject'], bool]
+    column_predicate: typing.Callable[..., bool]
+
+    def __call__(self, obj: 'objects.DocObject') -> bool:
+        return self.predicate(obj)
+
+    def _validate(
+        self,
+        records: typing.Iterable['objects.DocObject']
+        ) -> None:
+        """Validate fields compiled without a record_type against records'."""  # noqa
+
+        if self.record_type is None and isinstance(records, objects.DocRecords):  # noqa
+            record_type = records.record_type
+            for field in self.fields:
+                if _field_for(field, record_type) != field:
+                    raise exceptions.InvalidQueryError(
+                        f'Invalid query field for {record_type.__name__}: {field!r}'  # noqa
+                        )
+
+    def _candidates(
+        self,
+        records: 'objects.DocRecords'
+        ) -> typing.Iterable['objects.DocObject']:
+        """Records (narrowed with the hash index if possible)."""
+
+        record_type = self.record_type or records.record_type
+        hashable_fields = record_type.layout.hashable_fields
+        if (
+            record_type.HASH_MODE == 'tuple'
+            and record_type.__hash__.__qualname__ == Constants.HASH_QUALNAME
+            and hashable_fields
+            and all(k in self.equalities for k in hashable_fields)
+            ):
+            try:
+                key = hash(tuple([self.equalities[k] for k in hashable_fields]))  # noqa
+            except TypeError:
+                pass
+            else:
+                return records._get_index().get(key, ())
+        return records.records
+
+    def mask(self, records: 'objects.DocColumns') -> list[bool]:
+        """Evaluate the query against each row of a DocColumns."""
+
+        self._validate(records)
+        columns = records.records.columns
+        if not self.fields:
+            return [self.column_predicate()] * len(records.records)
+        return list(
+            map(
+                self.column_predicate,
+                *[columns[k] for k in self.fields]
+                )
+            )
+
+    def filter(
+        self,
+        records: typing.Iterable['objects.DocObject']
+        ) -> list['objects.DocObject']:
+        """
+        Return DocObjects matching the query from DocRecords (using \
+        its hash index or columns where possible) or any other \
+        iterable of DocObjects.
+
+        """
+
+        self._validate(records)
+        if isinstance(records, objects.DocColumns):
+            return [
+                records.records[i]
+                for i
+                in itertools.compress(range(len(records)), self.mask(records))
+                ]
+        elif isinstance(records, objects.DocRecords):
+            return [
+                record
+                for record
+                in self._candidates(records)
+                if self.predicate(record)
+                ]
+        else:
+            return [record for record in records if self.predicate(record)]
+
+
+def _field_for(
+    key: str,
+    record_type: typing.Optional[type['objects.DocObject']]
+    ) -> str:
+    if record_type is not None:
+        if not (k := record_type.key_for(key)):
+            raise exceptions.InvalidQueryError(
+                f'Invalid query field for {record_type.__name__}: {key!r}'
+                )
+        return k
+    elif not key.isidentifier() or keyword.iskeyword(key):
+        raise exceptions.InvalidQueryError(f'Invalid query field: {key!r}')
+    return key
+
+
+def _compile(
+    query: dict[str, typing.Any],
+    record_type: typing.Optional[type['objects.DocObject']],
+    fields: dict[str, int],
+    values: list[typing.Any],
+    conditions: typing.Optional[dict[str, list[tuple[str, typing.Any]]]],
+    ) -> str:
+    """
+    Return a python expression for query, collecting field names, \
+    values, and (for conjunctions only) conditions along the way.
+
+    """
+
+    if not isinstance(query, dict):
+        raise exceptions.InvalidQueryError(f'Invalid query: {query!r}')
+    expressions: list[str] = []
+    for key, condition in query.items():
+        if key in {Constants.AND, Constants.OR}:
+            is_and = key == Constants.AND
+            subexpressions = [
+                _compile(
+                    subquery,
+                    record_type,
+                    fields,
+                    values,
+                    conditions if is_and else None
+                    )
+                for subquery
+                in condition
+                ]
+            if subexpressions:
+                expressions.append(
+                    '(' + (' and ' if is_and else ' or ').join(subexpressions) + ')'  # noqa
+                    )
+            else:
+                expressions.append('True' if is_and else 'False')
+            continue
+        elif not isinstance(condition, dict):
+            raise exceptions.InvalidQueryError(
+                f'Invalid query condition for {key!r}: {condition!r}'
+                )
+        field = _field_for(key, record_type)
+        i = fields.setdefault(field, len(fields))
+        for op, value in condition.items():
+            if (operator := Constants.OPERATORS.get(op)) is None:
+                raise exceptions.InvalidQueryError(
+                    f'Invalid query operator for {key!r}: {op!r}'
+                    )
+            j = len(values)
+            values.append(value)
+            if operator in Constants.ORDERING_OPERATORS:
+                expressions.append(
+                    f'((_t := {{f{i}}}) is not None and _t {operator} _v{j})'
+                    )
+            else:
+                expressions.append(f'{{f{i}}} {operator} _v{j}')
+            if conditions is not None:
+                conditions.setdefault(field, []).append((operator, value))
+    if not expressions:
+        return 'True'
+    elif len(expressions) == 1:
+        return expressions[0]
+    else:
+        return '(' + ' and '.join(expressions) + ')'
+
+
+def compile_query(
+    query: dict[str, typing.Any],
+    record_type: type['objects.DocObject'] = None
+    ) -> CompiledQuery:
+    """
+    Compile a DocQuery (or equivalent dict) to a single predicate.
+
+    ---
+
+    If record_type is passed, field names may be any alias \
+    accepted by `record_type.key_for` and are validated against \
+    its fields. Otherwise, they are validated against the \
+    record_type of the DocRecords (or DocColumns) they filter.
+
+    """
+
+    fields: dict[str, int] = {}
+    values: list[typing.Any] = []
+    conditions: dict[str, list[tuple[str, typing.Any]]] = {}
+    expression = _compile(query, record_type, fields, values, conditions)
+    namespace = {f'_v{j}': value for j, value in enumerate(values)}
+    predicate = eval(
+        'lambda o: ' + expression.format(
+            **{f'f{i}': f'o.{field}' for field, i in fields.items()}
+            ),
+        namespace
+        )
+    column_predicate = eval(
+        f"lambda {', '.join(f'f{i}' for i in fields.values())}: "
+        + expression.format(**{f'f{i}': f'f{i}' for i in fields.values()}),
+        namespace
+        )
+    return CompiledQuery(
+        query=query,
+        record_type=record_type,
+        fields=tuple(fields),
+        equalities={
+            field: next(v for op, v in comparisons if op == '==')
+            for field, comparisons
+            in conditions.items()
+            if any(op == '==' for op, _ in comparisons)
+            },
+        conditions={
+            field: tuple(comparisons)
+            for field, comparisons
+            in conditions.items()
+            },
+        predicate=predicate,
+        column_predicate=column_predicate,
+        )
+
+
+def _to_sql(
+    query: dict[str, typing.Any],
+    record_type: typing.Optional[type['objects.DocObject']],
+    params: list[typing.Any],
+    encoders: typing.Mapping[str, typing.Callable[[typing.Any], typing.Any]],
+    ) -> str:
+    """Return a SQL expression for query, collecting params."""
+
+    if not isinstance(query, dict):
+        raise exceptions.InvalidQueryError(f'Invalid query: {query!r}')
+    expressions: list[str] = []
+    for key, condition in query.items():
+        if key in {Constants.AND, Constants.OR}:
+            is_and = key == Constants.AND
+            subexpressions = [
+                _to_sql(subquery, record_type, params, encoders)
+                for subquery
+                in condition
+                ]
+            if subexpressions:
+                expressions.append(
+                    '(' + (' AND ' if is_and else ' OR ').join(subexpressions) + ')'  # noqa
+                    )
+            else:
+                expressions.append('1' if is_and else '0')
+            continue
+        elif not isinstance(condition, dict):
+            raise exceptions.InvalidQueryError(
+                f'Invalid query condition for {key!r}: {condition!r}'
+                )
+        field = _field_for(key, record_type)
+        column = '"' + field.replace('"', '""') + '"'
+        for op, value in condition.items():
+            if (operator := Constants.OPERATORS.get(op)) is None:
+                raise exceptions.InvalidQueryError(
+                    f'Invalid query operator for {key!r}: {op!r}'
+                    )
+            elif value is None and operator in {'==', '!='}:
+                expressions.append(
+                    f"{column} IS {'' if operator == '==' else 'NOT '}NULL"
+                    )
+                continue
+            elif (encode := encoders.get(field)) is not None:
+                value = encode(value)
+            params.append(value)
+            if operator == '!=':
+                expressions.append(f'{column} IS NOT ?')
+            else:
+                expressions.append(f"{column} {'=' if operator == '==' else operator} ?")  # noqa
+    if not expressions:
+        return '1'
+    elif len(expressions) == 1:
+        return expressions[0]
+    else:
+        return '(' + ' AND '.join(expressions) + ')'
+
+
+def to_sql(
+    query: dict[str, typing.Any],
+    record_type: type['objects.DocObject'] = None,
+    encoders: typing.Mapping[str, typing.Callable[[typing.Any], typing.Any]] = None  # noqa
+    ) -> tuple[str, list[typing.Any]]:
+    """
+    Translate a DocQuery (or equivalent dict) to a parameterized \
+    SQL expression (for a WHERE clause) and its parameters.
+
+    ---
+
+    Comparisons follow the semantics of compiled predicates: \
+    `== None` is `IS NULL`, `!=` is null-safe, and ordering \
+    comparisons never match NULL.
+
+    * encoders optionally maps field names to functions converting \
+    query values to their stored (column) representation.
+
+    ```py
+    to_sql((Pet.type == 'dog') & (Pet.age > 3), Pet)
+    >>>
+    ('("type" = ? AND "age" > ?)', ['dog', 3])
+
+    ```
+
+    """
+
+    params: list[typing.Any] = []
+    return _to_sql(query, record_type, params, encoders or {}), params
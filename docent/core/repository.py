@@ -0,0 +1,376 @@
+__all__ = (
+    'SQLiteRepository',
+    )
+
+import dataclasses
+import datetime
+import sqlite3
+import threading
+import typing
+
+from . import cache
+from . import codec
+from . import constants
+from . import objects
+from . import query
+from . import types
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    INDEX: str = 'index'
+    SQL_TYPES: dict[type, str] = {
+        bool: 'INTEGER',
+        bytes: 'BLOB',
+        datetime.date: 'TEXT',
+        datetime.datetime: 'TEXT',
+        float: 'REAL',
+        int: 'INTEGER',
+        str: 'TEXT',
+        }
+
+
+T = typing.TypeVar('T', bound='objects.DocObject')
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _field_type(field: dataclasses.Field) -> typing.Any:
+    """Return the field's type, unwrapping Optional[...]."""
+
+    tp = field.type
+    if types._is_union(tp):
+        args = [arg for arg in typing.get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            tp = args[0]
+    return tp
+
+
+def _dumps(value: typing.Any) -> str:
+    if isinstance(value, objects.DocObject):
+        value = value.as_dbo
+    elif isinstance(value, (list, tuple)):
+        value = [
+            v.as_dbo if isinstance(v, objects.DocObject) else v
+            for v
+            in value
+            ]
+    return codec.dumps(value, default=str)
+
+
+def _converters(
+    field: dataclasses.Field
+    ) -> tuple[
+        str,
+        typing.Optional[typing.Callable[[typing.Any], typing.Any]],
+        typing.Optional[typing.Callable[[typing.Any], typing.Any]]
+        ]:
+    """Return (SQL type, encoder, decoder) for a field."""
+
+    tp = _field_type(field)
+    if tp is bool:
+        return Constants.SQL_TYPES[tp], None, bool
+    elif tp is datetime.datetime:
+        return (
+            Constants.SQL_TYPES[tp],
+            datetime.datetime.isoformat,
+            datetime.datetime.fromisoformat
+            )
+    elif tp is datetime.date:
+        return (
+            Constants.SQL_TYPES[tp],
+            datetime.date.isoformat,
+            datetime.date.fromisoformat
+            )
+    elif isinstance(tp, type) and tp in Constants.SQL_TYPES:
+        return Constants.SQL_TYPES[tp], None, None
+    elif (
+        isinstance(tp, type)
+        and typing.get_origin(tp) is None  # ex. list[str] (python 3.9)
+        and issubclass(tp, objects.DocObject)
+        ):
+        return 'TEXT', _dumps, lambda s: tp.from_dict(codec.loads(s))
+    else:
+        return 'TEXT', _dumps, codec.loads
+
+
+class SQLiteRepository(typing.Generic[T]):
+    """
+    sqlite3 backed repository of DocObjects.
+
+    ---
+
+    The table schema is derived from the record_type's dataclass \
+    fields, with its `hashable_fields` as primary key and an index \
+    for each field declaring `'index'` metadata.
+
+    * Scalars are stored natively, dates as ISO 8601 text, and \
+    everything else (ex. nested DocObjects) as JSON.
+
+    * `insert_many` / `upsert_many` write records in bulk with one \
+    prepared statement (executemany) inside a single transaction.
+
+    * `find` translates DocField query expressions to SQL and \
+    streams matching records as DocObjects (or, with \
+    `find_records`, as batches of DocRecords).
+
+    ```py
+    repository = docent.core.SQLiteRepository(Pet, 'pets.db')
+    repository.upsert_many(pets)
+
+    for pet in repository.find(Pet.type == 'dog'):
+        ...
+
+    ```
+
+    A single connection is shared (and writes serialized) across \
+    threads; pass `connection` to use an existing one.
+
+    """
+
+    def __init__(
+        self,
+        record_type: type[T],
+        database: str = ':memory:',
+        table: str = None,
+        connection: sqlite3.Connection = None
+        ):
+        layout = types.DocLayout.from_object(record_type)
+        self.record_type = record_type
+        self.table = table or layout.reference
+        self.connection = connection or sqlite3.connect(
+            database,
+            check_same_thread=False
+            )
+        self.fields = tuple(
+            k
+            for k
+            in layout.field_order
+            if layout.fields[k].init
+            )
+        self.primary_key = tuple(
+            k
+            for k
+            in layout.hashable_fields
+            if k in self.fields
+            )
+
+        sql_types: dict[str, str] = {}
+        self.encoders: dict[str, typing.Callable[[typing.Any], typing.Any]] = {}  # noqa
+        self.decoders: dict[str, typing.Callable[[typing.Any], typing.Any]] = {}  # noqa
+        for k in self.fields:
+            sql_type, encoder, decoder = _converters(layout.fields[k])
+            sql_types[k] = sql_type
+            if encoder is not None:
+                self.encoders[k] = encoder
+            if decoder is not None:
+                self.decoders[k] = decoder
+
+        table_name = _quote(self.table)
+        columns = ', '.join(_quote(k) for k in self.fields)
+        placeholders = ', '.join('?' for _ in self.fields)
+        primary_key = ', '.join(_quote(k) for k in self.primary_key)
+        updates = ', '.join(
+            f'{_quote(k)} = excluded.{_quote(k)}'
+            for k
+            in self.fields
+            if k not in self.primary_key
+            )
+        self._select = f'SELECT {columns} FROM {table_name}'
+        self._insert = f'INSERT INTO {table_name} ({columns}) VALUES ({placeholders})'  # noqa
+        self._upsert = ' '.join(
+            (
+                self._insert,
+                f'ON CONFLICT ({primary_key})',
+                f'DO UPDATE SET {updates}' if updates else 'DO NOTHING',
+                )
+            ) if primary_key else self._insert
+        self._lock = threading.RLock()
+
+        definitions = [f'{_quote(k)} {sql_types[k]}' for k in self.fields]
+        if primary_key:
+            definitions.append(f'PRIMARY KEY ({primary_key})')
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {table_name} ({', '.join(definitions)})"  # noqa
+            ]
+        for k in self.fields:
+            if layout.metadata[k].get(Constants.INDEX):
+                statements.append(
+                    ' '.join(
+                        (
+                            'CREATE INDEX IF NOT EXISTS',
+                            _quote(f'{self.table}_{k}'),
+                            f'ON {table_name} ({_quote(k)})',
+                            )
+                        )
+                    )
+        with self._lock, self.connection:
+            for statement in statements:
+                self.connection.execute(statement)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def _encode(
+        self,
+        records: typing.Iterable[typing.Union[T, dict]],
+        encoded: list[T]
+        ) -> typing.Iterator[tuple]:
+        """
+        Yield rows of column values for records (or dicts), \
+        collecting the records in encoded.
+
+        """
+
+        encoders = [self.encoders.get(k) for k in self.fields]
+        for record in records:
+            if isinstance(record, dict):
+                record = self.record_type.from_dict(record)
+            encoded.append(record)
+            yield tuple(
+                [
+                    value
+                    if encode is None or value is None
+                    else encode(value)
+                    for encode, value
+                    in zip(
+                        encoders,
+                        [getattr(record, k) for k in self.fields]
+                        )
+                    ]
+                )
+
+    def _decode(self, row: tuple) -> T:
+        decoders = self.decoders
+        return self.record_type(
+            **{
+                k: (
+                    v
+                    if v is None or (decode := decoders.get(k)) is None
+                    else decode(v)
+                    )
+                for k, v
+                in zip(self.fields, row)
+                }
+            )
+
+    def _where(
+        self,
+        doc_query: typing.Optional[dict[str, typing.Any]]
+        ) -> tuple[str, list[typing.Any]]:
+        if not doc_query:
+            return '', []
+        clause, params = query.to_sql(
+            doc_query,
+            self.record_type,
+            self.encoders
+            )
+        return f' WHERE {clause}', params
+
+    def _write(
+        self,
+        statement: str,
+        records: typing.Iterable[typing.Union[T, dict]]
+        ) -> int:
+        encoded: list[T] = []
+        with self._lock, self.connection:
+            count = self.connection.executemany(
+                statement,
+                self._encode(records, encoded)
+                ).rowcount
+        for record in encoded:  # Once committed, so no stale re-reads.
+            cache.invalidate(record)
+        return count
+
+    def count(self, doc_query: dict[str, typing.Any] = None) -> int:
+        """Return the number of records matching a query."""
+
+        where, params = self._where(doc_query)
+        return self.connection.execute(
+            f'SELECT COUNT(*) FROM {_quote(self.table)}{where}',
+            params
+            ).fetchone()[0]
+
+    def delete(self, doc_query: dict[str, typing.Any] = None) -> int:
+        """Delete records matching a query, returning the count."""
+
+        where, params = self._where(doc_query)
+        with self._lock, self.connection:
+            count = self.connection.execute(
+                f'DELETE FROM {_quote(self.table)}{where}',
+                params
+                ).rowcount
+        cache.invalidate(self.record_type)
+        return count
+
+    def find(
+        self,
+        doc_query: dict[str, typing.Any] = None,
+        batch_size: int = 1024
+        ) -> typing.Iterator[T]:
+        """Stream records matching a DocField query expression."""
+
+        where, params = self._where(doc_query)
+        cursor = self.connection.execute(self._select + where, params)
+        try:
+            while (rows := cursor.fetchmany(batch_size)):
+                yield from map(self._decode, rows)
+        finally:
+            cursor.close()
+
+    def find_one(
+        self,
+        doc_query: dict[str, typing.Any] = None
+        ) -> typing.Optional[T]:
+        """Return the first record matching a query, if any."""
+
+        where, params = self._where(doc_query)
+        row = self.connection.execute(
+            f'{self._select}{where} LIMIT 1',
+            params
+            ).fetchone()
+        return None if row is None else self._decode(row)
+
+    def find_records(
+        self,
+        records_type: type['objects.DocRecords'],
+        doc_query: dict[str, typing.Any] = None,
+        batch_size: int = 1024
+        ) -> typing.Iterator['objects.DocRecords']:
+        """Stream records matching a query as batches of DocRecords."""
+
+        batch: list[T] = []
+        for record in self.find(doc_query, batch_size):
+            batch.append(record)
+            if len(batch) == batch_size:
+                yield records_type(batch)
+                batch = []
+        if batch:
+            yield records_type(batch)
+
+    def get(self, *key: typing.Any) -> typing.Optional[T]:
+        """Return the record for values of the primary key, if any."""
+
+        return self.find_one(
+            {k: {'__eq__': v} for k, v in zip(self.primary_key, key)}
+            )
+
+    def insert_many(self, records: typing.Iterable[typing.Union[T, dict]]) -> int:  # noqa
+        """
+        Insert records (or dicts) in one transaction, returning the \
+        count (raises sqlite3.IntegrityError on duplicate keys).
+
+        """
+
+        return self._write(self._insert, records)
+
+    def upsert_many(self, records: typing.Iterable[typing.Union[T, dict]]) -> int:  # noqa
+        """
+        Insert or replace (by primary key) records (or dicts) in one \
+        transaction, returning the count.
+
+        """
+
+        return self._write(self._upsert, records)
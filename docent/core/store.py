@@ -0,0 +1,344 @@
+__all__ = (
+    'DocStore',
+    )
+
+import bisect
+import threading
+import typing
+
+from . import cache
+from . import constants
+from . import exceptions
+from . import objects
+from . import query
+from . import types
+
+
+class Constants(constants.PackageConstants):  # noqa
+
+    HASH_INDEX: str = 'hash'
+    INDEX: str = 'index'
+    SORTED_INDEX: str = 'sorted'
+
+
+T = typing.TypeVar('T', bound='objects.DocObject')
+
+
+class DocStore(typing.Generic[T]):
+    """
+    Indexed, in-memory store of DocObjects, keyed by the values of \
+    their `hashable_fields`.
+
+    ---
+
+    Secondary indexes are declared through field metadata (or the \
+    indexes argument, which takes precedence):
+
+    * `'index': 'hash'` (or True) for O(1) equality lookups \
+    (ex. enums and foreign keys).
+
+    * `'index': 'sorted'` for O(log n) equality and range lookups \
+    (None values are not indexed).
+
+    ```py
+    @dataclasses.dataclass
+    class Flea(docent.core.DocObject):
+
+        _id: str = None
+        pet_id: str = dataclasses.field(
+            default=None,
+            metadata={'index': 'hash'}
+            )
+
+    store = docent.core.DocStore(Flea)
+    store.add_many(fleas)
+    store.find(Flea.pet_id == '123')
+
+    ```
+
+    `find` accepts DocField query expressions (or compiled queries) \
+    and narrows candidates with the primary key or the most \
+    selective usable index before applying the query predicate.
+
+    * Stored records should be treated as immutable: `add` a \
+    record again after changing any of its indexed fields.
+
+    """
+
+    def __init__(
+        self,
+        record_type: type[T],
+        records: typing.Iterable[T] = (),
+        indexes: typing.Mapping[str, typing.Union[str, bool]] = None
+        ):
+        layout = types.DocLayout.from_object(record_type)
+        declared: dict[str, typing.Union[str, bool]] = {
+            field: kind
+            for field, metadata
+            in layout.metadata.items()
+            if (kind := metadata.get(Constants.INDEX))
+            }
+        for key, kind in (indexes or {}).items():
+            if not (field := record_type.key_for(key)):
+                raise exceptions.InvalidIndexError(
+                    f'Invalid index field for {record_type.__name__}: {key!r}'
+                    )
+            declared[field] = kind
+
+        self.record_type = record_type
+        self.hash_indexes: dict[str, dict[typing.Any, dict[tuple, T]]] = {}
+        self.sorted_indexes: dict[str, tuple[list, list[tuple]]] = {}
+        for field, kind in declared.items():
+            if kind is True or kind == Constants.HASH_INDEX:
+                self.hash_indexes[field] = {}
+            elif kind == Constants.SORTED_INDEX:
+                self.sorted_indexes[field] = ([], [])
+            elif kind:
+                raise exceptions.InvalidIndexError(
+                    f'Invalid index for {record_type.__name__}.{field}: {kind!r}'  # noqa
+                    )
+
+        self._indexed_fields = (*self.sorted_indexes, *self.hash_indexes)
+        self._indexed_values: dict[tuple, tuple] = {}
+        self._key = objects._get_hash_key(record_type)
+        self._lock = threading.RLock()
+        self._records: dict[tuple, T] = {}
+        self.add_many(records)
+
+    def __contains__(self, record: T) -> bool:
+        return self._records.get(self._key(record)) == record
+
+    def __iter__(self) -> typing.Iterator[T]:
+        with self._lock:
+            return iter(list(self._records.values()))
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __repr__(self) -> str:
+        indexes = {
+            **dict.fromkeys(self.hash_indexes, Constants.HASH_INDEX),
+            **dict.fromkeys(self.sorted_indexes, Constants.SORTED_INDEX),
+            }
+        return (
+            f'{self.__class__.__name__}[{self.record_type.__name__}]'
+            f'(records={len(self)}, indexes={indexes})'
+            )
+
+    def _index(self, key: tuple, record: T) -> None:
+        """Add record to secondary indexes (atomic on TypeError)."""
+
+        values = tuple([getattr(record, f) for f in self._indexed_fields])
+        inserted: list[tuple[str, typing.Any]] = []
+        try:
+            for field, value in zip(self.sorted_indexes, values):
+                if value is not None:
+                    sorted_values, keys = self.sorted_indexes[field]
+                    i = bisect.bisect_right(sorted_values, value)
+                    sorted_values.insert(i, value)
+                    keys.insert(i, key)
+                    inserted.append((field, value))
+        except TypeError:
+            for field, value in inserted:
+                self._unindex_sorted(field, key, value)
+            raise
+        for field, value in zip(
+            self.hash_indexes,
+            values[len(self.sorted_indexes):]
+            ):
+            try:
+                bucket = self.hash_indexes[field].setdefault(value, {})
+            except TypeError:
+                continue
+            bucket[key] = record
+        if values:
+            self._indexed_values[key] = values
+
+    def _unindex(self, key: tuple) -> None:
+        """Remove the record for key from secondary indexes."""
+
+        if (values := self._indexed_values.pop(key, None)) is None:
+            return
+        for field, value in zip(self.sorted_indexes, values):
+            if value is not None:
+                self._unindex_sorted(field, key, value)
+        for field, value in zip(
+            self.hash_indexes,
+            values[len(self.sorted_indexes):]
+            ):
+            index = self.hash_indexes[field]
+            try:
+                bucket = index.get(value)
+            except TypeError:
+                continue
+            if bucket is not None:
+                bucket.pop(key, None)
+                if not bucket:
+                    del index[value]
+
+    def _unindex_sorted(self, field: str, key: tuple, value: typing.Any):
+        values, keys = self.sorted_indexes[field]
+        for i in range(
+            bisect.bisect_left(values, value),
+            bisect.bisect_right(values, value)
+            ):
+            if keys[i] == key:
+                del values[i]
+                del keys[i]
+                return
+
+    def _candidates(
+        self,
+        compiled_query: query.CompiledQuery
+        ) -> typing.Iterable[T]:
+        """
+        Records (narrowed with the primary key or the most \
+        selective usable index, if possible).
+
+        """
+
+        layout = self.record_type.layout
+        equalities = compiled_query.equalities
+        if (
+            layout.hashable_fields
+            and all(k in equalities for k in layout.hashable_fields)
+            ):
+            try:
+                record = self._records.get(
+                    tuple([equalities[k] for k in layout.hashable_fields])
+                    )
+            except TypeError:
+                pass
+            else:
+                return () if record is None else (record, )
+
+        candidates: typing.Iterable[T] = self._records.values()
+        size = len(self._records)
+        for field, comparisons in compiled_query.conditions.items():
+            if (index := self.hash_indexes.get(field)) is not None:
+                for operator, value in comparisons:
+                    if operator != '==':
+                        continue
+                    try:
+                        bucket = index.get(value, {})
+                    except TypeError:
+                        continue
+                    if len(bucket) < size:
+                        candidates, size = bucket.values(), len(bucket)
+            if (sorted_index := self.sorted_indexes.get(field)) is not None:
+                values, keys = sorted_index
+                lo, hi = 0, len(values)
+                try:
+                    for operator, value in comparisons:
+                        if operator == '!=':
+                            continue
+                        elif value is None:
+                            raise TypeError
+                        elif operator in {'==', '>='}:
+                            lo = max(lo, bisect.bisect_left(values, value))
+                        elif operator == '>':
+                            lo = max(lo, bisect.bisect_right(values, value))
+                        if operator in {'==', '<='}:
+                            hi = min(hi, bisect.bisect_right(values, value))
+                        elif operator == '<':
+                            hi = min(hi, bisect.bisect_left(values, value))
+                except TypeError:
+                    continue
+                if lo != 0 or hi != len(values):
+                    if (n := max(hi - lo, 0)) < size:
+                        candidates = [self._records[k] for k in keys[lo:hi]]
+                        size = n
+        return candidates
+
+    def add(self, record: T) -> T:
+        """Add (or replace, by key) a record, returning it."""
+
+        key = self._key(record)
+        with self._lock:
+            if (existing := self._records.get(key)) is not None:
+                self._unindex(key)
+            try:
+                self._index(key, record)
+            except TypeError:
+                if existing is not None:
+                    self._index(key, existing)
+                raise
+            self._records[key] = record
+        cache.invalidate(record)
+        return record
+
+    def add_many(self, records: typing.Iterable[T]) -> None:
+        """Add (or replace, by key) records."""
+
+        with self._lock:
+            for record in records:
+                self.add(record)
+
+    def clear(self) -> None:
+        """Remove all records."""
+
+        with self._lock:
+            self._records.clear()
+            self._indexed_values.clear()
+            for index in self.hash_indexes.values():
+                index.clear()
+            for values, keys in self.sorted_indexes.values():
+                values.clear()
+                keys.clear()
+        cache.invalidate(self.record_type)
+
+    def find(
+        self,
+        doc_query: typing.Union[dict, query.CompiledQuery] = None
+        ) -> list[T]:
+        """Return records matching a DocField query expression."""
+
+        if doc_query is None:
+            return list(self)
+        elif not isinstance(doc_query, query.CompiledQuery):
+            doc_query = query.compile_query(doc_query, self.record_type)
+        predicate = doc_query.predicate
+        with self._lock:
+            return [
+                record
+                for record
+                in self._candidates(doc_query)
+                if predicate(record)
+                ]
+
+    def find_one(
+        self,
+        doc_query: typing.Union[dict, query.CompiledQuery] = None
+        ) -> typing.Optional[T]:
+        """Return the first record matching a query, if any."""
+
+        if doc_query is None:
+            return next(iter(self), None)
+        elif not isinstance(doc_query, query.CompiledQuery):
+            doc_query = query.compile_query(doc_query, self.record_type)
+        predicate = doc_query.predicate
+        with self._lock:
+            return next(
+                (
+                    record
+                    for record
+                    in self._candidates(doc_query)
+                    if predicate(record)
+                    ),
+                None
+                )
+
+    def get(self, *key: typing.Any) -> typing.Optional[T]:
+        """Return the record for values of `hashable_fields`, if any."""
+
+        return self._records.get(key)
+
+    def remove(self, record: T) -> typing.Optional[T]:
+        """Remove the record with the same key, returning it if found."""
+
+        key = self._key(record)
+        with self._lock:
+            if (existing := self._records.pop(key, None)) is not None:
+                self._unindex(key)
+                cache.invalidate(existing)
+        return existing
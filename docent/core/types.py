@@ -1,16 +1,20 @@
 __all__ = (
     'DocField',
+    'DocLayout',
     'DocMeta',
     )
 
 import abc
 import dataclasses
-import functools
-import json
+import enum
+import types
 import typing
 
+from . import codec
 from . import constants
+from . import memo
 from . import objects
+from . import query
 from . import utils
 
 
@@ -21,6 +25,14 @@ class Constants(constants.PackageConstants):  # noqa
         }
 
 
+def _is_union(tp: typing.Any) -> bool:
+    """Whether tp is a typing.Union (or, on python 3.10+, `X | Y`)."""
+
+    if (origin := typing.get_origin(tp)) is None:
+        return False
+    return origin in {typing.Union, getattr(types, 'UnionType', None)}
+
+
 class DocField:
     """
     Simple docent field object.
@@ -39,7 +51,7 @@ class DocField:
         self.type = type
 
     def __repr__(self) -> str:
-        return json.dumps(
+        return codec.dumps(
             {
                 'name': self.name,
                 'type': self.type
@@ -48,23 +60,32 @@ class DocField:
             indent=Constants.INDENT
             )
 
-    def __eq__(self, value: typing.Any) -> dict[str, dict[str, typing.Any]]:
-        return {self.name: {'__eq__': value}}
+    def __hash__(self) -> int:
+        return hash((self.__class__, self.name))
+
+    def __eq__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__eq__': value}})
 
-    def __ne__(self, value: typing.Any) -> dict[str, dict[str, typing.Any]]:
-        return {self.name: {'__ne__': value}}
+    def __ne__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__ne__': value}})
 
-    def __gt__(self, value: typing.Any) -> dict[str, dict[str, typing.Any]]:
-        return {self.name: {'__gt__': value}}
+    def __gt__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__gt__': value}})
 
-    def __gte__(self, value: typing.Any) -> dict[str, dict[str, typing.Any]]:
-        return {self.name: {'__gte__': value}}
+    def __ge__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__ge__': value}})
 
-    def __lt__(self, value: typing.Any) -> dict[str, dict[str, typing.Any]]:
-        return {self.name: {'__lt__': value}}
+    def __gte__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__gte__': value}})
 
-    def __lte__(self, value: typing.Any) -> dict[str, dict[str, typing.Any]]:
-        return {self.name: {'__lte__': value}}
+    def __lt__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__lt__': value}})
+
+    def __le__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__le__': value}})
+
+    def __lte__(self, value: typing.Any) -> 'query.DocQuery':
+        return query.DocQuery({self.name: {'__lte__': value}})
 
     @classmethod
     def from_dataclass_field(cls, field: dataclasses.Field) -> 'DocField':
@@ -73,58 +94,328 @@ class DocField:
         return cls(field.name, field.type)
 
 
+class _DefaultDocField(DocField):
+    """
+    DocField for a field the dataclass `__init__` does not assign \
+    (`init=False` without a `default_factory`), which returns the \
+    field's default from instances.
+
+    """
+
+    def __init__(self, name: str, type: object, default: typing.Any):
+        super().__init__(name, type)
+        self.default = default
+
+    def __get__(
+        self,
+        obj: typing.Optional['objects.DocObject'],
+        objtype: type = None
+        ) -> typing.Any:
+        return self if obj is None else self.default
+
+
+@dataclasses.dataclass(frozen=True)
+class DocLayout:
+    """
+    Immutable field layout for a DocObject derivative.
+
+    ---
+
+    Computed once per class (on first use after the dataclass \\
+    decorator has populated the class's own fields) and shared by \\
+    every part of docent that needs to introspect the class's fields.
+
+    ```py
+    import docent.template.package
+
+    layout = docent.core.DocLayout.from_object(
+        docent.template.package.objects.Pet
+        )
+    layout.id_fields
+    >>>
+    ('_id',)
+
+    ```
+
+    """
+
+    field_order: tuple[str, ...]
+    fields: typing.Mapping[str, dataclasses.Field]
+    id_fields: tuple[str, ...]
+    hashable_fields: tuple[str, ...]
+    defaults: typing.Mapping[str, typing.Any]
+    default_factories: typing.Mapping[str, typing.Callable[[], typing.Any]]
+    metadata: typing.Mapping[str, typing.Mapping[str, typing.Any]]
+    enumerations: typing.Mapping[str, tuple[typing.Any, ...]]
+    is_snake_case: bool
+    isCamelCase: bool
+    aliases: typing.Mapping[str, str]
+    stripped_fields: typing.Mapping[str, str]
+    reference: str
+    distribution: str
+    doc_path: str
+    description: str
+    default_description: str
+
+    def default_for(self, field_name: str) -> typing.Any:
+        """Return a (new, if factory-made) default value for a field."""
+
+        if field_name in self.default_factories:
+            return self.default_factories[field_name]()
+        else:
+            return self.defaults.get(field_name)
+
+    @classmethod
+    def from_object(
+        cls,
+        obj: typing.Union['objects.DocObject', 'DocMeta']
+        ) -> 'DocLayout':
+        """
+        Get (or compute on first use) the layout for a DocObject \\
+        derivative or instance thereof.
+
+        ---
+
+        Layouts are only cached once the dataclass decorator has \\
+        populated the class's own fields.
+
+        """
+
+        if not isinstance(obj, type):
+            obj = obj.__class__
+        try:
+            return _get_layout(obj)
+        except _UnpopulatedLayout as unpopulated:
+            return unpopulated.layout
+
+    @classmethod
+    def _compute(cls, obj: 'DocMeta') -> 'DocLayout':
+        field_order: list[str] = []
+        fields: dict[str, dataclasses.Field] = {}
+        defaults: dict[str, typing.Any] = {}
+        default_factories: dict[str, typing.Callable[[], typing.Any]] = {}
+        metadata: dict[str, typing.Mapping[str, typing.Any]] = {}
+        field: dataclasses.Field
+        for k, field in obj.__dataclass_fields__.items():
+            if field._field_type is not dataclasses._FIELD:
+                continue
+            field_order.append(k)
+            if not isinstance(field.default, dataclasses._MISSING_TYPE):
+                defaults[k] = field.default
+            elif not isinstance(
+                field.default_factory,
+                dataclasses._MISSING_TYPE
+                ):
+                default_factories[k] = field.default_factory
+            metadata[k] = field.metadata
+            if (
+                k.startswith('_')
+                and not k.removesuffix('_').lower().endswith('id')
+                ):
+                continue
+            fields[k] = field
+
+        id_fields: list[str] = []
+        key_fields: list[str] = []
+        name_fields: list[str] = []
+        for f in fields:
+            if (s := f.strip('_').lower()).endswith('id'):
+                id_fields.append(f)
+                key_fields.append(f)
+            elif s.endswith('key'):
+                key_fields.append(f)
+            elif s.startswith('name') or s.endswith('name'):
+                name_fields.append(f)
+
+        enumerations: dict[str, list] = {}
+        for k, field in fields.items():
+            if (
+                (field_enum := field.metadata.get('enum'))
+                and isinstance(field_enum, enum.EnumMeta)
+                ):
+                field_enum: enum.Enum
+                enumerations[utils.to_camel_case(k)] = [
+                    e.value
+                    for e
+                    in field_enum
+                    ]
+            elif field_enum:
+                enumerations[utils.to_camel_case(k)] = list(field_enum)
+            if enumerations.get(k) and field.metadata.get('nullable', True):
+                enumerations[utils.to_camel_case(k)].append(None)
+
+        is_snake_case = utils.is_snake_case(fields)
+        stripped_fields: dict[str, str] = {}
+        for _k in {f.strip('_') for f in fields}:
+            for k in (_k, '_' + _k, _k + '_', '_' + _k + '_'):
+                if k in fields:
+                    stripped_fields[_k] = k
+                    break
+        aliases: dict[str, str] = {}
+        for f in fields:
+            if not (_k := f.strip('_')):
+                continue
+            camel_case = utils.to_camel_case(_k)
+            for alias in (
+                f,
+                _k,
+                '_' + _k,
+                _k + '_',
+                '_' + _k + '_',
+                camel_case,
+                camel_case[0].upper() + camel_case[1:],
+                ):
+                if (k := _key_for(alias, stripped_fields, is_snake_case)):
+                    aliases[alias] = k
+
+        doc_path: str = obj.__module__
+        if 'docent' in doc_path and '.objects' in doc_path:
+            pkg, dist, *_ = doc_path.split('.')
+            distribution = f"{pkg}[{dist.replace('_', '-')}]"
+        else:
+            distribution = doc_path.split('.')[0]
+        default_description = ' '.join(
+            (
+                'An object called',
+                obj.__name__,
+                'belonging to the',
+                distribution,
+                'distribution.'
+                )
+            )
+        default_dataclasses_docstring_prefix = obj.__name__ + '('
+        if (
+            obj.__doc__
+            and not obj.__doc__.startswith(default_dataclasses_docstring_prefix)
+            ):
+            description = obj.__doc__
+        else:
+            description = default_description
+
+        return cls(
+            field_order=tuple(field_order),
+            fields=types.MappingProxyType(fields),
+            id_fields=tuple(id_fields),
+            hashable_fields=tuple(key_fields or name_fields or fields),
+            defaults=types.MappingProxyType(defaults),
+            default_factories=types.MappingProxyType(default_factories),
+            metadata=types.MappingProxyType(metadata),
+            enumerations=types.MappingProxyType(
+                {k: tuple(v) for k, v in enumerations.items()}
+                ),
+            is_snake_case=is_snake_case,
+            isCamelCase=utils.isCamelCase(fields),
+            aliases=types.MappingProxyType(aliases),
+            stripped_fields=types.MappingProxyType(stripped_fields),
+            reference=Constants.DOC_DELIM.join(
+                (
+                    *[
+                        utils.to_camel_case(s)
+                        for s
+                        in doc_path.split('.')
+                        ],
+                    utils.to_camel_case(obj.__name__)
+                    )
+                ),
+            distribution=distribution,
+            doc_path=doc_path,
+            description=description,
+            default_description=default_description,
+            )
+
+
+_APPLICATION_OBJECTS: dict[str, 'objects.DocObject'] = {}
+
+
 class DocMeta(abc.ABCMeta, type):
     """DocObject class constructor."""
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
     def APPLICATION_OBJECTS(cls) -> dict[str, 'objects.DocObject']:
         """Python dict containing all DocObject subclasses used by the program."""  # noqa
 
-        return {}
+        return _APPLICATION_OBJECTS
 
-    def __call__(cls, *args, **kwargs):
-        """Register a DocObject derivative as an application object."""
-
-        if not cls.__module__.startswith('docent.core'):
-            cls.APPLICATION_OBJECTS.setdefault(cls.reference, cls)
-
-        return super().__call__(*args, **kwargs)
+    def __new__(
+        mcs,
+        name: str,
+        bases: tuple[type, ...],
+        namespace: dict[str, typing.Any],
+        **kwargs: typing.Any
+        ) -> 'DocMeta':
+        if (
+            '__slots__' in namespace
+            and '__dataclass_fields__' in namespace
+            and not issubclass(mcs, _SlottedDocMeta)
+            ):  # Re-created by dataclass(slots=True).
+            mcs = _SlottedDocMeta
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
 
     def __contains__(cls, key: str) -> bool:
         """Return True if key (or alias) is a field for the DocObject derivative."""  # noqa
 
         return bool(cls.key_for(key))
 
-    def __getattribute__(cls, __name: str) -> typing.Union[DocField, typing.Any]:  # noqa
-        """Return DocField instead of field value for uninstantiated DocObject derivatives."""  # noqa
+    def __getitem__(cls, key: str) -> typing.Any:
+        """Return field value dict style."""
 
-        if (
-            (type(cls) is DocMeta)
-            and (
-                object.__getattribute__(cls, '__name__')
-                not in Constants.FORBIDDEN_OBJECTS
-                )
-            and (
-                field := (
-                    super()
-                    .__getattribute__('__dataclass_fields__')
-                    .get(__name)
-                    )
-                )
+        if not (k := cls.key_for(key)):
+            raise KeyError(key)
+        elif (
+            (value := cls.__dict__.get(k, _UNSET)) is _UNSET
+            or isinstance(value, (DocField, types.MemberDescriptorType))
             ):
-            return DocField.from_dataclass_field(field)
+            return DocLayout.from_object(cls).defaults.get(k)
         else:
-            return super().__getattribute__(__name)
+            return value
 
-    def __getitem__(cls, key: str) -> typing.Any:
-        """Return field value dict style."""
+    def __setattr__(cls, __name: str, value: typing.Any):
+        """
+        Replace field defaults with DocFields once the dataclass \
+        decorator has populated the class's own fields.
 
-        if (k := cls.key_for(key)):
-            return cls.__dict__.get(k)
-        else:
-            raise KeyError(key)
+        ---
+
+        Uninstantiated DocObject derivatives then return DocFields \
+        for fields at normal attribute lookup speed.
+
+        Note: this relies on `dataclasses` (3.9 through 3.13) setting \
+        `__dataclass_fields__` before generating `__init__`, which \
+        reads defaults from the fields themselves (not the class). \
+        Fields `__init__` does not assign get a `_DefaultDocField`, \
+        so instances still return their default.
+
+        """
+
+        super().__setattr__(__name, value)
+        if (
+            __name == '__dataclass_fields__'
+            and cls.__name__ not in Constants.FORBIDDEN_OBJECTS
+            ):
+            for k, field in value.items():
+                if field._field_type is not dataclasses._FIELD:
+                    continue
+                elif isinstance(field.default, DocField):  # Inherited.
+                    field.default = next(
+                        (
+                            base_field.default
+                            for base
+                            in cls.__mro__[1:]
+                            if (
+                                base_field := base.__dict__.get(
+                                    '__dataclass_fields__',
+                                    {}
+                                    ).get(k)
+                                )
+                            ),
+                        dataclasses.MISSING
+                        )
+                if field.init or field.default_factory is not dataclasses.MISSING:  # noqa
+                    doc_field = DocField.from_dataclass_field(field)
+                else:
+                    doc_field = _DefaultDocField(k, field.type, field.default)
+                super().__setattr__(k, doc_field)
 
     def __setitem__(cls, key: str, value: typing.Any):
         """Set field value dict style."""
@@ -134,7 +425,6 @@ class DocMeta(abc.ABCMeta, type):
         else:
             raise KeyError(key)
 
-    @functools.cache
     def key_for(cls: 'objects.DocObject', key: str) -> typing.Union[str, None]:  # noqa
         """
         Get the actual attribute name for key as it has been
@@ -156,27 +446,93 @@ class DocMeta(abc.ABCMeta, type):
 
         """
 
-        if (
-            cls.is_snake_case
-            and not key.islower()
-            and (
-                (
-                    k := (
-                        _k := utils.camel_case_to_snake_case(
-                            key.strip('_')
-                            )
-                        )
-                    ) in cls.fields
-                or (k := '_' + _k) in cls.fields
-                or (k := _k + '_') in cls.fields
-                or (k := '_' + _k + '_') in cls.fields
-                )
-            ):
-            return k
-        elif (
-            (k := (_k := key.strip('_'))) in cls.fields
-            or (k := '_' + _k) in cls.fields
-            or (k := _k + '_') in cls.fields
-            or (k := '_' + _k + '_') in cls.fields
-            ):
-            return k
+        return _get_key(cls, key)
+
+
+@memo.memoized()
+def _get_key(cls: 'objects.DocObject', key: str) -> typing.Union[str, None]:  # noqa
+    """Resolve key (or alias) to a DocObject derivative's field name."""
+
+    layout = DocLayout.from_object(cls)
+    try:
+        return layout.aliases[key]
+    except KeyError:
+        return _key_for(
+            key,
+            layout.stripped_fields,
+            layout.is_snake_case
+            )
+
+
+def _key_for(
+    key: str,
+    stripped: dict[str, str],
+    is_snake_case: bool
+    ) -> typing.Union[str, None]:
+    """
+    Resolve key to a field name from a table of fields keyed on
+    their names stripped of leading / trailing underscores.
+
+    """
+
+    if (
+        is_snake_case
+        and not key.islower()
+        and (_k := key.strip('_'))
+        and (k := stripped.get(utils.camel_case_to_snake_case(_k)))
+        ):
+        return k
+    else:
+        return stripped.get(key.strip('_'))
+
+
+class _UnpopulatedLayout(Exception):
+    """Raised to return (without memoizing) an incomplete layout."""
+
+    def __init__(self, layout: DocLayout):
+        self.layout = layout
+
+
+@memo.memoized()
+def _get_layout(obj: 'DocMeta') -> DocLayout:
+    """
+    Compute the layout for a DocObject derivative, memoized only \
+    once the dataclass decorator has populated its own fields.
+
+    """
+
+    layout = DocLayout._compute(obj)
+    if '__dataclass_fields__' not in type.__getattribute__(obj, '__dict__'):
+        raise _UnpopulatedLayout(layout)
+    return layout
+
+
+class _SlottedDocMeta(DocMeta):
+    """
+    DocObject class constructor for dataclass(slots=True) derivatives, \
+    whose slot descriptors would otherwise shadow their DocFields.
+
+    """
+
+    def __getattribute__(cls, __name: str) -> typing.Union[DocField, typing.Any]:  # noqa
+        """Return DocField instead of slot descriptor for fields."""
+
+        value = type.__getattribute__(cls, __name)
+        if value.__class__ is types.MemberDescriptorType:
+            return _get_doc_fields(cls).get(__name, value)
+        return value
+
+
+@memo.memoized()
+def _get_doc_fields(cls: _SlottedDocMeta) -> dict[str, DocField]:
+    """DocFields of a slotted DocObject derivative, by field name."""
+
+    return {
+        k: DocField.from_dataclass_field(field)
+        for k, field
+        in type.__getattribute__(cls, '__dataclass_fields__').items()
+        if field._field_type is dataclasses._FIELD
+        }
+
+
+_UNSET = object()
@@ -1,13 +1,16 @@
 __all__ = (
+    'RedactedDict',
     'camel_case_to_kebab_case',
     'camel_case_to_snake_case',
     'convert_to_log_format',
+    'convert_to_ndjson_format',
     'isCamelCase',
     'is_snake_case',
     'parse_dt',
     'prefix_value_to_string',
     'redact_log_dict',
     'redact_string',
+    'redact_strings',
     'to_camel_case',
     'snake_case_to_kebab_case',
     )
@@ -17,6 +20,7 @@ import re
 import typing
 
 from . import constants
+from . import memo
 from . import patterns
 
 
@@ -42,6 +46,7 @@ class Constants(constants.PackageConstants):  # noqa
             'Severity': 'HIGH',
             'Title': 'Connection String Password',
             'Regex': re.compile(r"""(:\/\/)+\w+(:[^:@]+)@"""),
+            'Keywords': ['://'],
             },
         {
             'ID': 'credit-card',
@@ -53,10 +58,56 @@ class Constants(constants.PackageConstants):  # noqa
         ]
 
 
-def redact_string(string: str) -> str:
-    """Redact potentially sensitive values from being logged."""
+def _index_redaction_keywords(
+    redaction_patterns: list[dict[str, typing.Any]]
+    ) -> tuple[tuple[int, ...], dict[str, tuple[int, ...]]]:
+    """
+    Return indices of patterns without Keywords (always run) and \
+    the indices of patterns for each of their Keywords.
+
+    """
+
+    always: list[int] = []
+    keywords: dict[str, list[int]] = {}
+    for i, r in enumerate(redaction_patterns):
+        if (kws := r.get('Keywords')):
+            for kw in kws:
+                keywords.setdefault(kw, []).append(i)
+        else:
+            always.append(i)
+    return tuple(always), {k: tuple(v) for k, v in keywords.items()}
+
+
+_REDACT_ALWAYS, _REDACT_KEYWORDS = _index_redaction_keywords(
+    Constants.REDACT_LOG_STR_PATTERNS
+    )
+
+
+def _select_redaction_patterns(string: str) -> list[dict[str, typing.Any]]:
+    """
+    Return the REDACT_LOG_STR_PATTERNS that could match string \
+    (those with a Keyword in it, plus any without Keywords), in order.
+
+    ---
+
+    Non-ASCII strings select every pattern, as re.IGNORECASE \
+    matches some characters (ex. 'İ', 'ı') as ASCII letters that \
+    str.casefold does not fold them to.
+
+    """
+
+    if not string.isascii():
+        return Constants.REDACT_LOG_STR_PATTERNS
+    folded = string.lower()
+    selected = set(_REDACT_ALWAYS)
+    for keyword, indices in _REDACT_KEYWORDS.items():
+        if keyword in folded:
+            selected.update(indices)
+    return [Constants.REDACT_LOG_STR_PATTERNS[i] for i in sorted(selected)]
 
-    for r in Constants.REDACT_LOG_STR_PATTERNS:
+
+def _redact(string: str, redaction_patterns: list[dict[str, typing.Any]]) -> str:  # noqa
+    for r in redaction_patterns:
         reason: str = r['Title']
         regex: re.Pattern = r['Regex']
         string = regex.sub(
@@ -67,24 +118,98 @@ def redact_string(string: str) -> str:
     return string
 
 
+def redact_string(string: str) -> str:
+    """
+    Redact potentially sensitive values from being logged.
+
+    ---
+
+    A literal keyword prefilter selects the REDACT_LOG_STR_PATTERNS \
+    that could match (ex. 'ghp_' for GitHub tokens), and only those \
+    (plus any without Keywords) are run, in order.
+
+    """
+
+    return _redact(string, _select_redaction_patterns(string))
+
+
+def redact_strings(strings: list[str]) -> list[str]:
+    """
+    Redact potentially sensitive values from a batch of strings \
+    (ex. the leaf values of a log message).
+
+    ---
+
+    The strings are prefiltered and searched together (joined by \
+    new lines), so patterns are only run on each string if they \
+    match somewhere in the batch.
+
+    """
+
+    joined = '\n'.join(strings)
+    if not (
+        redaction_patterns := [
+            r
+            for r
+            in _select_redaction_patterns(joined)
+            if r['Regex'].search(joined) is not None
+            ]
+        ):
+        return strings
+    return [_redact(s, redaction_patterns) for s in strings]
+
+
+class RedactedDict(dict):
+    """
+    dict (ex. of DocObject fields) already redacted by key, with \
+    the keys of values needing no value scanning (ex. dates).
+
+    """
+
+    __slots__ = ('safe_keys', )
+
+    def __init__(self, *args: typing.Any, **kwargs: typing.Any):
+        super().__init__(*args, **kwargs)
+        self.safe_keys: set[str] = set()
+
+
+_RENDERED_TYPES = frozenset((dict, list, tuple, RedactedDict))
+
+
+def _key_redaction(string: str) -> typing.Optional[str]:
+    for r in Constants.REDACT_DICT_KEY_PATTERNS:
+        regex: re.Pattern = r['Regex']
+        if regex.search(string) is not None:
+            reason: str = r['Title']
+            return f'[ REDACTED :: {reason.upper()} ]'
+    return None
+
+
+@memo.memoized()
+def _get_key_redaction(key: str) -> typing.Optional[str]:
+    """
+    Return the redaction for string values of a dict key matching \
+    REDACT_DICT_KEY_PATTERNS (None if not sensitive).
+
+    """
+
+    return _key_redaction(key)
+
+
 def redact_log_dict(
     obj: typing.Any,
     ) -> typing.Union[dict, typing.Any]:
     """Redact potentially sensitive values from being logged (based on dict key)."""  # noqa
 
-    if isinstance(obj, dict):
+    if isinstance(obj, RedactedDict):
+        d = obj
+    elif isinstance(obj, dict):
         d = {}
         for k, v in obj.items():
             if isinstance(v, (dict, list)):
                 d[k] = redact_log_dict(v)
             elif isinstance(v, str):
-                d[k] = v
-                for r in Constants.REDACT_DICT_KEY_PATTERNS:
-                    regex: re.Pattern = r['Regex']
-                    if regex.search(k) is not None:
-                        reason: str = r['Title']
-                        d[k] = f'[ REDACTED :: {reason.upper()} ]'
-                        break
+                d[k] = _get_key_redaction(k) or v
             else:
                 d[k] = v
     elif isinstance(obj, list):
@@ -93,22 +218,75 @@ def redact_log_dict(
             if isinstance(v, (dict, list)):
                 d.append(redact_log_dict(v))
             elif isinstance(v, str):
-                matched = False
-                for r in Constants.REDACT_DICT_KEY_PATTERNS:
-                    regex: re.Pattern = r['Regex']
-                    if regex.search(v) is not None:
-                        reason: str = r['Title']
-                        d.append(f'[ REDACTED :: {reason.upper()} ]')
-                        matched = True
-                        break
-                if not matched:
-                    d.append(v)
+                d.append(_key_redaction(v) or v)
             else:
                 d.append(v)
 
     return d
 
 
+def _redact_leaves(
+    leaves: list[tuple[typing.Union[dict, list], typing.Union[str, int]]],
+    dicts: list[dict],
+    ) -> None:
+    """
+    Redact the string leaves (and the keys of dicts) of a log message \
+    in place.
+
+    ---
+
+    Each leaf is scanned as it is dumped (ex. '"key": "value"'), so \
+    patterns matching a key and its value (ex. GCP service accounts) \
+    or anchored to their surroundings behave as on the full message.
+
+    """
+
+    prefixes = [
+        f'"{k}": "' if isinstance(container, dict) else '"'
+        for container, k
+        in leaves
+        ]
+    strings = [
+        prefix + container[k] + '"'
+        for prefix, (container, k)
+        in zip(prefixes, leaves)
+        ]
+    quoted = {k: f'"{k}"' for d in dicts for k in d}
+    keys = list(quoted.values())
+    if (redacted_strings := redact_strings(scanned := strings + keys)) is scanned:  # noqa
+        return
+
+    for prefix, (container, k), s, redacted in zip(
+        prefixes,
+        leaves,
+        strings,
+        redacted_strings
+        ):
+        if redacted == s:
+            continue
+        elif redacted.startswith(prefix) and redacted.endswith('"'):
+            container[k] = redacted[len(prefix):-1]
+        elif redact_string(key := f'"{k}"') != key:  # Redacted below.
+            container[k] = redact_string(container[k])
+        else:  # Matched across the key and value.
+            container[k] = redacted
+
+    if (
+        renamed := {
+            k: redacted.strip('"')
+            for (k, key), redacted
+            in zip(quoted.items(), redacted_strings[len(strings):])
+            if redacted != key
+            }
+        ):
+        for d in dicts:
+            if not renamed.keys().isdisjoint(d):
+                items = list(d.items())
+                d.clear()
+                for k, v in items:
+                    d[renamed.get(k, k)] = v
+
+
 def parse_dt(dt_string: str) -> datetime.datetime:
     """Parse string to datetime."""
 
@@ -126,21 +304,92 @@ def parse_dt(dt_string: str) -> datetime.datetime:
             )
 
 
+def _render(v: typing.Any, limit: int) -> tuple[str, int]:
+    """
+    Render a value as str, walking lists, tuples, and dicts only \
+    until more than limit characters are rendered.
+
+    ---
+
+    Returns the rendering (as str(v) would, if not cut short) and \
+    the number of items (at any depth) left unrendered.
+
+    """
+
+    if v.__class__ not in _RENDERED_TYPES:
+        return str(v), 0
+
+    parts: list[str] = []
+    size = elided = 0
+
+    def write(s: str) -> None:
+        nonlocal size
+        parts.append(s)
+        size += len(s)
+
+    def walk(v: typing.Any) -> bool:
+        """Render v, returning False if cut short."""
+
+        nonlocal elided
+        if isinstance(v, str) and len(v) > limit:
+            write(repr(v[:limit + 1]))
+            return False
+        elif v.__class__ not in _RENDERED_TYPES:
+            write(repr(v))
+            return True
+        elif isinstance(v, dict):
+            opening, closing, items = '{', '}', v.items()
+        elif isinstance(v, list):
+            opening, closing, items = '[', ']', v
+        else:
+            opening, closing, items = '(', ',)' if len(v) == 1 else ')', v
+        write(opening)
+        for i, item in enumerate(items):
+            if size > limit:
+                elided += len(v) - i
+                return False
+            elif i:
+                write(', ')
+            if opening == '{':
+                write(repr(item[0]) + ': ')
+                item = item[1]
+            if not walk(item):
+                elided += len(v) - i - 1
+                return False
+        write(closing)
+        return True
+
+    walk(v)
+    return ''.join(parts), elided
+
+
 def prefix_value_to_string(v: typing.Any, extra_indentation: int = Constants.INDENT) -> str:
-    """Prefix indentation to any value as a string."""
+    """
+    Prefix indentation to any value as a string.
+
+    ---
 
+    Lists, tuples, and dicts are rendered only up to LOG_CUTOFF_LEN \
+    (with a count of the items elided), not in full.
+
+    """
+
+    if v.__class__ in _RENDERED_TYPES:
+        s, elided = _render(v, Constants.LOG_CUTOFF_LEN)
+    else:
+        s, elided = str(v), 0
     return (
         prefix + prefix.join(
             (
                 s[:Constants.LOG_CUTOFF_LEN],
                 ' ... ',
                 ' ... ',
-                ' ... ',
+                Constants.LOG_ELIDED_MSG.format(elided) if elided else ' ... ',
                 )
             )
         if len(
             s := (
-                str(v)
+                s
                 .rstrip('\n')
                 .replace(
                     '\n',
@@ -156,38 +405,144 @@ def prefix_value_to_string(v: typing.Any, extra_indentation: int = Constants.IND
         )
 
 
+def _to_log_format(
+    msg: dict[str, typing.Any],
+    extra_indentation: int,
+    leaves: list[tuple[typing.Union[dict, list], typing.Union[str, int]]],
+    dicts: list[dict],
+    ) -> dict[str, str]:
+    """
+    Recursively convert a dict[str, typing.Any] to dict[str, str], \
+    collecting (container, key) references to its (unsafe) leaves.
+
+    """
+
+    extra_indentation += Constants.INDENT
+    d: dict[str, typing.Any] = {}
+    if not isinstance(msg, RedactedDict):  # Keys are DocObject fields.
+        dicts.append(d)
+    for k, v in msg.items():
+        if isinstance(v, list):
+            d[k] = c = []
+            for _v in v:
+                if isinstance(_v, dict):
+                    c.append(
+                        _to_log_format(_v, extra_indentation, leaves, dicts)
+                        )
+                else:
+                    leaves.append((c, len(c)))
+                    c.append(prefix_value_to_string(_v, extra_indentation))
+        elif isinstance(v, dict):
+            d[k] = c = {}
+            if isinstance(v, RedactedDict):
+                safe_keys = v.safe_keys
+            else:
+                safe_keys = ()
+                dicts.append(c)
+            for _k, _v in v.items():
+                if isinstance(_v, dict):
+                    c[_k] = _to_log_format(
+                        _v,
+                        extra_indentation,
+                        leaves,
+                        dicts
+                        )
+                else:
+                    if _k not in safe_keys:
+                        leaves.append((c, _k))
+                    c[_k] = prefix_value_to_string(_v, extra_indentation)
+        else:
+            if not (isinstance(msg, RedactedDict) and k in msg.safe_keys):
+                leaves.append((d, k))
+            d[k] = prefix_value_to_string(v, extra_indentation)
+    return d
+
+
 def convert_to_log_format(
     msg: dict[str, typing.Any],
     extra_indentation: int = Constants.INDENT
     ) -> dict[str, str]:
-    """Recursively convert a dict[str, typing.Any] to dict[str, str]."""
+    """
+    Recursively convert a dict[str, typing.Any] to dict[str, str].
 
-    extra_indentation += Constants.INDENT
-    return {
-        k: (
-            [
-                convert_to_log_format(_v, extra_indentation)
-                if isinstance(_v, dict)
-                else prefix_value_to_string(_v, extra_indentation)
-                for _v
-                in v
-                ]
-            if isinstance(v, list)
-            else {
-                _k: (
-                    convert_to_log_format(_v, extra_indentation)
-                    if isinstance(_v, dict)
-                    else prefix_value_to_string(_v, extra_indentation)
-                    )
-                for _k, _v
-                in v.items()
-                }
-            if isinstance(v, dict)
-            else prefix_value_to_string(v, extra_indentation)
-            )
-        for k, v
-        in redact_log_dict(msg).items()
-        }
+    ---
+
+    Values are redacted (by key and by value) as they are converted, \
+    skipping those a RedactedDict marks safe.
+
+    """
+
+    leaves: list[tuple[typing.Union[dict, list], typing.Union[str, int]]] = []  # noqa
+    dicts: list[dict] = []
+    d = _to_log_format(
+        redact_log_dict(msg),
+        extra_indentation,
+        leaves,
+        dicts
+        )
+    _redact_leaves(leaves, dicts)
+    return d
+
+
+def _to_ndjson_value(
+    v: typing.Any,
+    leaves: list[tuple[typing.Union[dict, list], typing.Union[str, int]]],
+    dicts: list[dict],
+    ) -> typing.Any:
+    """
+    Recursively convert a value to compact log format, collecting \
+    (container, key) references to its (unsafe) string leaves.
+
+    """
+
+    if isinstance(v, dict):
+        d = {}
+        if isinstance(v, RedactedDict):  # Keys are DocObject fields.
+            safe_keys = v.safe_keys
+        else:
+            safe_keys = ()
+            dicts.append(d)
+        for k, _v in v.items():
+            if (
+                isinstance(c := _to_ndjson_value(_v, leaves, dicts), str)
+                and k not in safe_keys
+                ):
+                leaves.append((d, str(k)))
+            d[str(k)] = c
+        return d
+    elif isinstance(v, (list, tuple)):
+        d = []
+        for _v in v:
+            if isinstance(c := _to_ndjson_value(_v, leaves, dicts), str):
+                leaves.append((d, len(d)))
+            d.append(c)
+        return d
+    elif v is None or isinstance(v, (bool, int, float)):
+        return v
+    elif len(s := v if isinstance(v, str) else str(v)) > Constants.LOG_CUTOFF_LEN:  # noqa
+        return s[:Constants.LOG_CUTOFF_LEN] + ' ... '
+    else:
+        return s
+
+
+def convert_to_ndjson_format(msg: dict[str, typing.Any]) -> dict[str, typing.Any]:  # noqa
+    """
+    Recursively convert a dict[str, typing.Any] to compact log format.
+
+    ---
+
+    JSON scalars are kept as is, other values are converted to \
+    (truncated) strings, and string values are redacted (by key \
+    and by value, skipping those a RedactedDict marks safe), so the \
+    result can be dumped as one line of JSON.
+
+    """
+
+    leaves: list[tuple[typing.Union[dict, list], typing.Union[str, int]]] = []  # noqa
+    dicts: list[dict] = []
+    d = _to_ndjson_value(redact_log_dict(msg), leaves, dicts)
+    _redact_leaves(leaves, dicts)
+    return d
 
 
 def camel_case_to_kebab_case(camel_case_str: str) -> str:
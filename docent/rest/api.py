@@ -143,9 +143,36 @@ class APIMeta(type):  # noqa
         request: objects.Request
         ) -> tuple[docent.core.objects.DocObject, int]:
 
+        return cls._process(request)
+
+    def stream(
+        cls,
+        request: objects.Request
+        ) -> tuple[
+            typing.Union[
+                docent.core.objects.DocObject,
+                objects.response.Stream
+                ],
+            int
+            ]:
+        """
+        Process a request as with `API[request]`, returning bodies \
+        streamed by `Response` as a `Stream` (encoded up to its first \
+        chunk within request error handling).
+
+        """
+
+        return cls._process(request, streamed=True)
+
+    def _process(
+        cls,
+        request: objects.Request,
+        streamed: bool = False
+        ) -> tuple[docent.core.objects.DocObject, int]:
+
         cls.route_request: typing.Callable[[list[str]], resource.Resource]
         cls.process_request: typing.Callable[
-            [resource.Resource, objects.Request],
+            [resource.Resource, objects.Request, bool],
             tuple[docent.core.objects.DocObject, int]
             ]
 
@@ -179,7 +206,8 @@ class APIMeta(type):  # noqa
         else:
             response, status_code = cls.process_request(
                 requested_resource,
-                request
+                request,
+                streamed
                 )
 
         return response, status_code
@@ -281,77 +309,87 @@ class API(metaclass=APIMeta):
     def process_request(
         cls,
         rsc: resource.Resource,
-        request: 'objects.request.Request'
+        request: 'objects.request.Request',
+        streamed: bool = False
         ) -> tuple[docent.core.objects.DocObject, int]:  # noqa
 
-        try:
-            request_id = uuid.uuid4().hex
-            docent.core.log.info(
-                {
-                    'request_id': request_id,
-                    'resource': rsc.__name__,
-                    'message': 'validating request',
-                    'request': request,
-                    }
-                )
-            if rsc is not objects.documentation.Swagger:
-                method_obj, request = cls._validate_resource_request(
-                    rsc,
-                    request
+        with docent.core.identity.scope():
+            try:
+                request_id = uuid.uuid4().hex
+                docent.core.log.info(
+                    {
+                        'request_id': request_id,
+                        'resource': rsc.__name__,
+                        'message': 'validating request',
+                        'request': request,
+                        }
                     )
-            docent.core.log.info(
-                {
-                    'request_id': request_id,
-                    'resource': rsc.__name__,
-                    'message': 'processing validated request',
-                    'request': request
-                    }
-                )
-            if rsc is objects.documentation.Swagger:
-                response_obj, status_code = cls._handle_docs_request(
-                    rsc,
-                    request
+                if rsc is not objects.documentation.Swagger:
+                    method_obj, request = cls._validate_resource_request(
+                        rsc,
+                        request
+                        )
+                docent.core.log.info(
+                    {
+                        'request_id': request_id,
+                        'resource': rsc.__name__,
+                        'message': 'processing validated request',
+                        'request': request
+                        }
                     )
-            else:
-                response_obj, status_code = cls._handle_resource_request(
-                    method_obj,
-                    request
+                if rsc is objects.documentation.Swagger:
+                    response_obj, status_code = cls._handle_docs_request(
+                        rsc,
+                        request
+                        )
+                else:
+                    response_obj, status_code = cls._handle_resource_request(
+                        method_obj,
+                        request
+                        )
+                if streamed and objects.response.Stream.is_streamed(
+                    response_obj
+                    ):
+                    response_obj = objects.response.Stream(response_obj)
+                docent.core.log.info(
+                    {
+                        'request_id': request_id,
+                        'resource': rsc.__name__,
+                        'message': 'request processed successfully',
+                        'status_code': str(status_code),
+                        'response': (
+                            response_obj.body
+                            if isinstance(response_obj, objects.response.Stream)  # noqa
+                            else response_obj
+                            ),
+                        },
                     )
-            docent.core.log.info(
-                {
-                    'request_id': request_id,
-                    'resource': rsc.__name__,
-                    'message': 'request processed successfully',
-                    'status_code': str(status_code),
-                    'response': response_obj,
-                    },
-                )
-        except Exception as exception:
-            most_recent_trace = traceback.format_tb(
-                exception.__traceback__
-                )[-1]
-            if len(spl := most_recent_trace.strip().split(', ')) != 3:
-                is_error_raised = False
-            else:
-                file_name, _, trace = spl
-                is_error_raised = ' raise ' in trace
-                is_error_from_api = cls.APPLICATION in file_name
-            if is_error_raised or is_error_from_api:
-                response_obj = objects.response.Error.from_exception(exception)
-            else:
-                response_obj = objects.response.Error.from_exception(
-                    exceptions.UnexpectedError
+            except Exception as exception:
+                most_recent_trace = traceback.format_tb(
+                    exception.__traceback__
+                    )[-1]
+                if len(spl := most_recent_trace.strip().split(', ')) != 3:
+                    is_error_raised = False
+                else:
+                    file_name, _, trace = spl
+                    is_error_raised = ' raise ' in trace
+                    is_error_from_api = cls.APPLICATION in file_name
+                if is_error_raised or is_error_from_api:
+                    response_obj = objects.response.Error.from_exception(exception)  # noqa
+                else:
+                    response_obj = objects.response.Error.from_exception(
+                        exceptions.UnexpectedError
+                        )
+                status_code = response_obj.errorCode
+                docent.core.log.error(
+                    {
+                        'request_id': request_id,
+                        'resource': rsc.__name__,
+                        'message': 'error processing request',
+                        'status_code': str(status_code),
+                        'response': response_obj,
+                        },
                     )
-            status_code = response_obj.errorCode
-            docent.core.log.error(
-                {
-                    'request_id': request_id,
-                    'resource': rsc.__name__,
-                    'message': 'error processing request',
-                    'status_code': str(status_code),
-                    'response': response_obj,
-                    },
-                )
 
         return response_obj, status_code
 
@@ -36,6 +36,7 @@ class FrameworkConstants(docent.core.Constants):  # noqa
         exceptions.ResourceLockedError: 429,
         exceptions.ResourceNotFoundError: 404,
         exceptions.UnexpectedError: 500,
+        docent.core.exceptions.InvalidQueryError: 400,
         **DEFAULT_ERROR_CODES,
         }
     DEFAULT_ERROR_MAP: dict[Exception, str]                  = {
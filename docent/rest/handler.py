@@ -1,7 +1,8 @@
 import docent.core
 
 import http.server
-import json
+import socket
+import struct
 import urllib.parse
 
 from . import constants
@@ -28,10 +29,33 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
         for header, value in response._headers.items():
             self.send_header(header, str(value))
         self.end_headers()
-        if response._encoded:
-            self.wfile.write(response._content)
-        else:
+        if not response._encoded:
             self.wfile.write(response._content.encode())
+        elif isinstance(response._content, bytes):
+            self.wfile.write(response._content)
+        else:  # Streamed (without Content-Length) until closed.
+            try:
+                for chunk in response._content:
+                    self.wfile.write(chunk)
+            except Exception:
+                docent.core.log.error(
+                    {
+                        'resource': 'DocHandler',
+                        'message': 'error streaming response',
+                        'path': self.path,
+                        },
+                    )
+                # Reset the connection now (instead of shutting it down
+                # once handled), so clients see an error rather than a
+                # complete (truncated) body.
+                self.close_connection = True
+                self.connection.setsockopt(
+                    socket.SOL_SOCKET,
+                    socket.SO_LINGER,
+                    struct.pack('ii', 1, 0)
+                    )
+                self.rfile.close()
+                self.connection.close()
 
     def get_request(self) -> objects.Request:  # noqa
         parsed = urllib.parse.urlparse(self.path)
@@ -91,7 +115,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
             if (
                 data := self.rfile.read(int(content)).decode(errors='replace')
                 ):
-                body = json.loads(data)
+                body = docent.core.codec.loads(data)
             else:
                 body = {}
         else:
@@ -110,7 +134,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
 
     def do_DELETE(self):  # noqa
         if (request := self.get_request()):
-            response_obj, status_code = api.API[request]
+            response_obj, status_code = api.API.stream(request)
         else:
             err = (
                 objects
@@ -127,7 +151,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
 
     def do_GET(self):  # noqa
         if (request := self.get_request()):
-            response_obj, status_code = api.API[request]
+            response_obj, status_code = api.API.stream(request)
         else:
             err = (
                 objects
@@ -144,7 +168,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
 
     def do_OPTIONS(self):  # noqa
         if (request := self.get_request()):
-            response_obj, status_code = api.API[request]
+            response_obj, status_code = api.API.stream(request)
         else:
             err = (
                 objects
@@ -161,7 +185,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
 
     def do_PATCH(self):  # noqa
         if (request := self.get_request()):
-            response_obj, status_code = api.API[request]
+            response_obj, status_code = api.API.stream(request)
         else:
             err = (
                 objects
@@ -178,7 +202,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
 
     def do_POST(self):  # noqa
         if (request := self.get_request()):
-            response_obj, status_code = api.API[request]
+            response_obj, status_code = api.API.stream(request)
         else:
             err = (
                 objects
@@ -195,7 +219,7 @@ class DocHandler(http.server.BaseHTTPRequestHandler):  # noqa
 
     def do_PUT(self):  # noqa
         if (request := self.get_request()):
-            response_obj, status_code = api.API[request]
+            response_obj, status_code = api.API.stream(request)
         else:
             err = (
                 objects
@@ -6,9 +6,10 @@ __all__ = (
 
 import dataclasses
 import hashlib
-import json
 import typing
 
+import docent.core
+
 from .. import utils
 
 from . import constants
@@ -219,7 +220,7 @@ class Component(metaclass=ComponentMeta):  # noqa
     def as_json(self) -> str:
         """Return object as a JSON serialized string."""
 
-        return json.dumps(
+        return docent.core.codec.dumps(
             self.as_component,
             default=str,
             indent=Constants.INDENT
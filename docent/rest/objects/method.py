@@ -19,7 +19,7 @@ from . import validator
 
 class Constants(constants.ComponentConstants):  # noqa
 
-    pass
+    WRITE_METHODS: frozenset[str] = frozenset(('delete', 'patch', 'put'))
 
 
 @dataclasses.dataclass
@@ -37,6 +37,7 @@ class Method(base.Component):  # noqa
         [request.Request],
         docent.core.objects.DocObject
         ] = None
+    _resource: type[docent.core.objects.DocObject] = None
     _response_headers: response.Headers = None
     _body_validator: validator.SchemaValidator = None
     _parameters_validator: validator.SchemaValidator = None
@@ -52,7 +53,23 @@ class Method(base.Component):  # noqa
             docent.core.objects.DocObject,
             list[docent.core.objects.DocObject],
             ]:  # noqa
-        return self._callable(request)
+        response_obj = self._callable(request)
+        if (
+            self._resource is not None
+            and self._name in Constants.WRITE_METHODS
+            ):
+            if isinstance(response_obj, docent.core.objects.DocObject):
+                docent.core.cache.invalidate(response_obj)
+            elif response_obj and isinstance(
+                response_obj,
+                (list, docent.core.objects.DocRecords)
+                ):
+                for obj in response_obj:
+                    if isinstance(obj, docent.core.objects.DocObject):
+                        docent.core.cache.invalidate(obj)
+            else:
+                docent.core.cache.invalidate(self._resource)
+        return response_obj
 
     def __post_init__(self):  # noqa
         if (
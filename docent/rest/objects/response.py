@@ -5,11 +5,11 @@ __all__ = (
     'Response',
     'Responses',
     'ResponseSpec',
+    'Stream',
     )
 
 import dataclasses
 import datetime
-import json
 import typing
 
 import docent.core
@@ -27,6 +27,60 @@ class Constants(constants.ComponentConstants):  # noqa
     pass
 
 
+class Stream:
+    """
+    REST JSON body encoded one DocObject at a time, up to its first \
+    chunk on init.
+
+    ---
+
+    Initialize within the request's error handling and identity \
+    map scope, so a body fitting in one chunk (or the first chunk \
+    of a larger one) is encoded before any status is sent. \
+    Remaining chunks are encoded in the same identity map scope.
+
+    """
+
+    def __init__(
+        self,
+        body: typing.Any,
+        chunk_size: int = Constants.CHUNK_SIZE
+        ):
+        self.body = body
+        self.identity_map = docent.core.identity.current()
+        self._chunks = docent.core.codec.iterencode(body, chunk_size)
+        self.head = next(self._chunks, b'')
+        self.done = len(self.head) < chunk_size
+
+    def __iter__(self) -> typing.Iterator[bytes]:
+        yield self.head
+        if not self.done:
+            with docent.core.identity.scope(self.identity_map):
+                yield from self._chunks
+
+    @staticmethod
+    def is_streamed(body: typing.Any) -> bool:
+        """Whether body is encoded as a Stream."""
+
+        return (
+            isinstance(
+                body,
+                (docent.core.objects.DocRecords, typing.Iterator)
+                )
+            or (
+                isinstance(body, list)
+                and body
+                and isinstance(
+                    body[0],
+                    (
+                        docent.core.DocObject,
+                        docent.core.DocMeta
+                        )
+                    )
+                )
+            )
+
+
 @dataclasses.dataclass
 class Response(docent.core.objects.DocObject):  # noqa
 
@@ -53,6 +107,8 @@ class Response(docent.core.objects.DocObject):  # noqa
             if e.name in enums.header.DefaultHeaderValues._member_map_
             }
         )
+    _content: typing.Union[bytes, str, typing.Iterable[bytes]] = None
+    _content_type: str = None
 
     def __post_init__(self):  # noqa
         if isinstance(self.body, documentation.SwaggerHTML):
@@ -63,38 +119,42 @@ class Response(docent.core.objects.DocObject):  # noqa
             self._encoded = True
             self._content_type = enums.component.ContentType.icon.value
         elif isinstance(self.body, documentation.SwaggerJSON):
-            self._content = json.dumps(self.body.data, default=str)
+            self._content = docent.core.codec.dumps(self.body.data, default=str)
             self._content_type = enums.component.ContentType.json.value
         elif isinstance(self.body, documentation.SwaggerYAML):
             self._content = self.body.data
             self._content_type = enums.component.ContentType.yaml.value
+        elif isinstance(self.body, Stream) or Stream.is_streamed(self.body):
+            stream = (
+                self.body
+                if isinstance(self.body, Stream)
+                else Stream(self.body, Constants.CHUNK_SIZE)
+                )
+            self._content = stream.head if stream.done else stream
+            self._encoded = True
+            self._content_type = enums.component.ContentType.json.value
         elif isinstance(self.body, docent.core.objects.DocObject):
-            self._content = json.dumps(self.body.as_rest, default=str)
+            self._content = docent.core.codec.dumps(self.body.as_rest, default=str)
             self._content_type = enums.component.ContentType.json.value
         elif isinstance(self.body, str):
             self._content = self.body
             self._content_type = enums.component.ContentType.text.value
         elif isinstance(self.body, list):
-            if (
-                self.body
-                and isinstance(
-                    self.body[0],
-                    (
-                        docent.core.DocObject,
-                        docent.core.DocMeta
-                        )
-                    )
-                ):
-                self.body = [o.as_rest for o in self.body]
-            self._content = json.dumps(self.body, default=str)
+            self._content = docent.core.codec.dumps(self.body, default=str)
             self._content_type = enums.component.ContentType.json.value
         else:
             self._content = ''
             self._content_type = enums.component.ContentType.json.value
 
-        self._headers[
-            enums.header.DefaultHeaders.contentLength.value
-            ] = len(self._content)
+        if isinstance(self._content, (bytes, str)):
+            self._headers[
+                enums.header.DefaultHeaders.contentLength.value
+                ] = len(self._content)
+        else:  # Streamed (larger than one chunk) until closed.
+            self._headers.pop(
+                enums.header.DefaultHeaders.contentLength.value,
+                None
+                )
         self._headers[
             enums.header.DefaultHeaders.contentType.value
             ] = self._content_type
@@ -209,7 +209,9 @@ class SchemaObject(SchemaComponent):  # noqa
         dbo: dict[str, typing.Any] = {}
         required_fields = []
 
-        for k, field in obj.fields.items():
+        layout = docent.core.types.DocLayout.from_object(obj)
+
+        for k, field in layout.fields.items():
             if (
                 method_name
                 and (
@@ -222,14 +224,7 @@ class SchemaObject(SchemaComponent):  # noqa
                                     'put',
                                     }
                                 if (
-                                    (
-                                        is_id_field := (
-                                            k
-                                            .lower()
-                                            .strip('_')
-                                            .endswith('id')
-                                            )
-                                        )
+                                    (is_id_field := k in layout.id_fields)
                                     and not many
                                     and not response
                                     )
@@ -283,13 +278,13 @@ class SchemaObject(SchemaComponent):  # noqa
                         k.strip('_')
                         )
                     )
-            elif (default_value := field.default) is None:
+            elif k in layout.defaults and layout.defaults[k] is None:
                 schema.nullable = True
-                schema.default = default_value
-            elif not isinstance(default_value, dataclasses._MISSING_TYPE):
-                schema.default = default_value
+                schema.default = None
+            elif k in layout.defaults:
+                schema.default = layout.defaults[k]
             elif isinstance(
-                (default_value := field.default_factory()),
+                (default_value := layout.default_for(k)),
                 docent.core.objects.DocObject
                 ):
                 schema.default = default_value.as_rest
@@ -91,7 +91,11 @@ class SchemaValidator(base.Component):  # noqa
                             docent.core.types.DocMeta
                             )
                         ):
-                        value = field.dtype.from_rest(value)
+                        if not (
+                            getattr(self.reference_object, 'LAZY_NESTED', False)
+                            and isinstance(value, dict)
+                            ):
+                            value = field.dtype.from_rest(value)
                     elif value:
                         value = field.dtype(value)
                 except:
@@ -193,7 +197,17 @@ class SchemaValidator(base.Component):  # noqa
                             docent.core.types.DocMeta
                             )
                         ):
-                        return_obj[name] = field.dtype.from_rest(value)
+                        return_obj[name] = (
+                            docent.core.objects.LazyDocObject(
+                                field.dtype,
+                                value
+                                )
+                            if (
+                                getattr(self.reference_object, 'LAZY_NESTED', False)
+                                and isinstance(value, dict)
+                                )
+                            else field.dtype.from_rest(value)
+                            )
                     else:
                         return_obj[name] = field.dtype(value)
             return return_obj
@@ -217,19 +231,15 @@ class SchemaValidator(base.Component):  # noqa
         ) -> 'SchemaValidator':  # noqa
 
         schema: list[SchemaValidationField] = []
+        layout = docent.core.types.DocLayout.from_object(obj)
 
-        for field_name, field_meta in obj.fields.items():
+        for field_name, field_meta in layout.fields.items():
 
-            if isinstance(
-                field_meta.default_factory,
-                dataclasses._MISSING_TYPE
-                ):
-                default_value = field_meta.default
-            else:
-                default_value = field_meta.default_factory()
+            default_value = layout.default_for(field_name)
+            field_metadata = layout.metadata[field_name]
 
             if (
-                (field_enum := field_meta.metadata.get('enum', []))
+                (field_enum := field_metadata.get('enum', []))
                 and isinstance(field_enum, enum.EnumMeta)
                 ):
                 field_enum = sorted(e.value for e in field_enum)
@@ -238,7 +248,7 @@ class SchemaValidator(base.Component):  # noqa
                 method_name
                 and (
                     (
-                        ignorance := field_meta.metadata.get(
+                        ignorance := field_metadata.get(
                             'ignore',
                             (
                                 {
@@ -266,7 +276,7 @@ class SchemaValidator(base.Component):  # noqa
                 method_name
                 and (
                     (
-                        required := field_meta.metadata.get(
+                        required := field_metadata.get(
                             'required',
                             {}
                             )
@@ -309,7 +319,7 @@ class SchemaValidator(base.Component):  # noqa
                 and (
                     (
                         (
-                            nullable := field_meta.metadata.get(
+                            nullable := field_metadata.get(
                                 'nullable',
                                 True
                                 )
@@ -352,13 +362,13 @@ class SchemaValidator(base.Component):  # noqa
                         default=default_value,
                         dtype=field_meta.type,
                         enum=field_enum,
-                        strict_enum=field_meta.metadata.get('strictEnum', False),
+                        strict_enum=field_metadata.get('strictEnum', False),
                         ignorance=irrelevant,
                         nullable=nullability,
                         required=requisite,
-                        pattern=field_meta.metadata.get('pattern'),
-                        max_length=field_meta.metadata.get('maxLength'),
-                        min_length=field_meta.metadata.get('minLength'),
+                        pattern=field_metadata.get('pattern'),
+                        max_length=field_metadata.get('maxLength'),
+                        min_length=field_metadata.get('minLength'),
                         )
                     )
 
@@ -3,7 +3,6 @@ __all__ = (
     )
 
 import dataclasses
-import functools
 import re
 import typing
 
@@ -214,6 +213,7 @@ def _prepare_method(
             _many=not id_in_path,
             _extensions=integrations,
             _callable=event_handler_function,
+            _resource=cls.resource,
             _response_headers=response_headers,
             _body_validator=body_validator,
             _parameters_validator=parameters_validator,
@@ -926,7 +926,7 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
+    @docent.core.memo.memoized()
     def _resource_id(cls) -> str:
         return '_'.join(
             (
@@ -941,7 +941,7 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
+    @docent.core.memo.memoized()
     def resource_id(cls) -> str:
         """
         Unique ID field name for the resource.
@@ -965,12 +965,9 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
             return k
         elif (
             ordering := sorted(
-                (
-                    f
-                    for f
-                    in cls.resource.fields
-                    if f.strip('_').lower().endswith('id')
-                    ),
+                docent.core.types.DocLayout.from_object(
+                    cls.resource
+                    ).id_fields,
                 key=lambda k: len(k)
                 )
             ):
@@ -980,7 +977,7 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
+    @docent.core.memo.memoized()
     def resource_key(cls) -> str:  # noqa
         return '.'.join(
             (
@@ -992,7 +989,7 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
+    @docent.core.memo.memoized()
     def path_schema(cls) -> str:  # noqa
         cls.__bases__: tuple['Resource']
         parent_schema_elements = [
@@ -1028,7 +1025,7 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
+    @docent.core.memo.memoized()
     def tags(cls) -> list[str]:  # noqa
         split_string = Constants.PATH_ID_PARSE_EXPR.sub(
             '',
@@ -1057,7 +1054,7 @@ class Resource(metaclass=objects.base.ComponentMeta):  # noqa
 
     @classmethod
     @property
-    @functools.lru_cache(maxsize=1)
+    @docent.core.memo.memoized()
     def as_enum(cls) -> 'Resource':
         """Return an Enumeration resource for the managed object."""
 
@@ -10,7 +10,6 @@ __all__ = (
     'to_yaml',
     )
 
-import functools
 import importlib
 import os
 import re
@@ -116,7 +115,7 @@ def convert_open_api_spec(
     return d
 
 
-@functools.cache
+@docent.core.memo.memoized()
 def get_schema_reference_from_object(
     obj: docent.core.objects.DocObject
     ) -> dict[str, dict]:
@@ -190,7 +189,7 @@ def filter_component_uri(ref: str) -> str:  # noqa
     return '/'.join((ref_tag, component_tag, component_type, ref))
 
 
-@functools.lru_cache(maxsize=1)
+@docent.core.memo.memoized(maxsize=1)
 def spec_from_api(
     args: tuple[str],
     help_text: str,
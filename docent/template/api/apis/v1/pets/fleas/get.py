@@ -22,13 +22,9 @@ def get_flea(
     
     if (
         (pet_id := request.params['pet_id'])
-        and not (
-            docent.
-            template.
-            package.
-            clients.
-            DatabaseClient.find_one(pet_id)
-            )
+        and not docent.core.loader.scoped(  # One batched round trip
+            docent.template.package.objects.Pet.from_ids  # per request.
+            ).load(pet_id).result()
         ):
         raise FileNotFoundError(
             f"Could not find a pet for the provided id: '{pet_id!s}'."
@@ -52,37 +48,29 @@ def get_fleas(
 
     if (
         (pet_id := request.params['pet_id'])
-        and not (
-            docent.
-            template.
-            package.
-            clients.
-            DatabaseClient.find_one(pet_id)
-            )
+        and not docent.core.loader.scoped(  # One batched round trip
+            docent.template.package.objects.Pet.from_ids  # per request.
+            ).load(pet_id).result()
         ):
         raise FileNotFoundError(
             f"Could not find a pet for the provided id: '{pet_id!s}'."
             )
-    elif not request.params:
-        return [
-            docent.template.package.objects.Flea.from_dict(record)
-            for record
-            in docent.template.package.clients.DatabaseClient.DATA.values()
-            ]
-
-    return [
-        flea
+    fleas = [
+        docent.template.package.objects.Flea.from_dict(record)
         for record
         in docent.template.package.clients.DatabaseClient.DATA.values()
-        if (
-            (
-                flea := docent.template.package.objects.Flea.from_dict(record)
-                )
-            and all(
-                flea[k] == v
-                for k, v
-                in request.params.items()
-                if k in flea
-                )
-            )
         ]
+
+    if not request.params:
+        return fleas
+
+    query = docent.core.query.DocQuery(
+        {
+            k: {'__eq__': v}
+            for k, v
+            in request.params.items()
+            if k in docent.template.package.objects.Flea
+            }
+        ).compile(docent.template.package.objects.Flea)
+
+    return query.filter(fleas)
@@ -21,13 +21,9 @@ def create_fleas(
 
     if (
         (pet_id := request.params['pet_id'])
-        and not (
-            docent.
-            template.
-            package.
-            clients.
-            DatabaseClient.find_one(pet_id)
-            )
+        and not docent.core.loader.scoped(  # One batched round trip
+            docent.template.package.objects.Pet.from_ids  # per request.
+            ).load(pet_id).result()
         ):
         raise FileNotFoundError(
             f"Could not find a pet for the provided id: '{pet_id!s}'."
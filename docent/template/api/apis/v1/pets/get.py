@@ -42,25 +42,23 @@ def get_pets(
     ) -> list[docent.template.package.objects.Pet]:  # You MUST annotate the return signature.
     """Retrieve as many pets in the database as match the query."""
 
-    if not request.params:
-        return [
-            docent.template.package.objects.Pet.from_dict(record)
-            for record
-            in docent.template.package.clients.DatabaseClient.DATA.values()
-            ]
-
-    return [
-        pet
+    pets = [
+        docent.template.package.objects.Pet.from_dict(record)
         for record
         in docent.template.package.clients.DatabaseClient.DATA.values()
-        if (
-            (
-                pet := docent.template.package.objects.Pet.from_dict(record)
-                )
-            and all(
-                pet.as_rest[k] == v
-                for k, v
-                in request.params.items()
-                )
-            )
         ]
+
+    if not request.params:
+        return pets
+
+    # Compile the query parameters to a single predicate
+    # (an invalid field name raises an exception here).
+    query = docent.core.query.DocQuery(
+        {
+            k: {'__eq__': v}
+            for k, v
+            in request.params.items()
+            }
+        ).compile(docent.template.package.objects.Pet)
+
+    return query.filter(pets)
@@ -40,8 +40,12 @@ def update_pet(
             if k in request.params:
                 setattr(pet, k, v)
 
-        # Update in our 'database'.
-        docent.template.package.clients.DatabaseClient.update_one(pet.as_dbo)
+        # Pet tracks changes, so only the fields assigned above
+        # need to be sent to our 'database'.
+        docent.template.package.clients.DatabaseClient.patch_one(
+            pet._id,
+            pet.as_dirty_dbo
+            )
 
         return pet
     else:
@@ -4,8 +4,17 @@ import uuid
 import docent.core
 
 
-class DatabaseClient:
-    """A simple, example database client."""
+class DatabaseClient(docent.core.LocalClient):
+    """
+    A simple, example database client.
+
+    ---
+
+    Connections are borrowed from a class-level pool, so resource \
+    handlers reuse them across requests. Replace the in-process \
+    fake by overriding `connect` (and `ping`) for a real data store.
+
+    """
 
     DATA = {}
 
@@ -13,7 +22,9 @@ class DatabaseClient:
     def delete_one(cls, _id: str) -> dict:
         """Delete an existing record from database."""
 
-        if _id in cls.DATA and (record := cls.DATA.pop(_id)):
+        with cls.connection() as conn:
+            record = conn.data.pop(_id, None)
+        if record:
             docent.core.log.info(
                 {
                     'client': 'database',
@@ -26,18 +37,27 @@ class DatabaseClient:
     def find_many(cls, query: dict[str, typing.Any]) -> dict:
         """Get records from database that match the query."""
 
-        return [
-            record
-            for record
-            in cls.DATA.values()
-            if all(record[k] == v for k, v in query.items())
-            ]
+        with cls.connection() as conn:
+            return [
+                record
+                for record
+                in conn.data.values()
+                if all(record[k] == v for k, v in query.items())
+                ]
+
+    @classmethod
+    def load_many(cls, _ids: list[str]) -> list[dict]:
+        """Get records from database by primary keys, in one round trip."""
+
+        with cls.connection() as conn:
+            return [conn.data.get(_id) for _id in _ids]
 
     @classmethod
     def find_one(cls, _id: str) -> dict:
         """Get one record from database by primary key."""
 
-        return cls.DATA.get(_id)
+        with cls.connection() as conn:
+            return conn.data.get(_id)
 
     @classmethod
     def insert_one(cls, record: dict) -> dict:
@@ -51,9 +71,25 @@ class DatabaseClient:
                 'record': record,
                 }
             )
-        cls.DATA[_id] = record
+        with cls.connection() as conn:
+            conn.data[_id] = record
         return record
 
+    @classmethod
+    def patch_one(cls, _id: str, fields: dict) -> dict:
+        """Update only the specified fields of an existing record."""
+
+        docent.core.log.info(
+            {
+                'client': 'database',
+                'operation': 'patch',
+                'record': {'_id': _id, **fields},
+                }
+            )
+        with cls.connection() as conn:
+            conn.data[_id].update(fields)
+            return conn.data[_id]
+
     @classmethod
     def update_one(cls, record: dict) -> dict:
         """Update existing record in database."""
@@ -65,5 +101,6 @@ class DatabaseClient:
                 'record': record,
                 }
             )
-        cls.DATA[record['_id']] = record
+        with cls.connection() as conn:
+            conn.data[record['_id']] = record
         return record
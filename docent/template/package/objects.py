@@ -62,6 +62,10 @@ class Pet(docent.core.DocObject):
     # by restricting user input so no pet will ever again
     # be called "Mr. James Gak".
 
+    TRACK_CHANGES = True  # Record which fields are assigned after a pet
+                          # is loaded, so PATCH requests only need to
+                          # send what actually changed to the database.
+
     _id: str = None  # Broadly speaking, DocObjects should be 1:1 with
                      # a record in a data store. This generally means
                      # they should have a unique identifier (example: '_id').
@@ -122,12 +126,13 @@ class Pet(docent.core.DocObject):
         )
 
     @classmethod
-    def from_id(cls, _id: str) -> 'Pet':
+    @docent.core.cache.cached(ttl=60)  # Hot pets skip the database; PUT,
+    def from_id(cls, _id: str) -> 'Pet':  # PATCH and DELETE invalidate.
         """
         Return an instantiated Pet object from database by id.
     
-        If no pet is returned from the database, an empty Pet \
-        will be returned instead.
+        If no pet is returned from the database, None will be \
+        returned instead (and not cached).
 
         ---
 
@@ -151,22 +156,46 @@ class Pet(docent.core.DocObject):
             \"""
             Return an instantiated Pet object from database by id.
 
-            If no pet is returned from the database, an empty Pet
-            will be returned instead.
+            If no pet is returned from the database, None will be
+            returned instead.
             \"""
 
-            return cls(
-                **(
-                    clients.DatabaseClient.find_one(_id)
-                    or {}
-                    )
-                )
+            if (record := clients.DatabaseClient.find_one(_id)):
+                return cls(**record)
+
+        ```
+
+        """
+
+        if (record := clients.DatabaseClient.find_one(_id)):
+            pet = cls(**record)
+            pet.mark_clean()  # Freshly loaded: nothing has changed yet.
+            return pet
+
+    @classmethod
+    def from_ids(cls, _ids: list[str]) -> dict[str, 'Pet']:
+        """
+        Return Pets from database by id, in one round trip.
+
+        ---
 
+        Pair with docent.core.loader to batch lookups made one at a \
+        time (ex. while enriching a list of fleas):
+
+        ```py
+        loader = docent.core.loader.scoped(Pet.from_ids)
+        pets = [loader.load(flea.pet_id) for flea in fleas]
+        names = [pet.result().name for pet in pets]
         ```
 
         """
 
-        return cls(**(clients.DatabaseClient.find_one(_id) or {}))
+        return {
+            record['_id']: cls(**record)
+            for record
+            in clients.DatabaseClient.load_many(_ids)
+            if record
+            }
 
 
 @dataclasses.dataclass
@@ -200,7 +229,10 @@ class Flea(docent.core.DocObject):
         default=None,
         metadata={
             'ignore': True,  # Expectation is this will be passed
-            }                # in any request handling logic.
+                             # in any request handling logic.
+            'index': 'hash',  # Declare a secondary hash index so
+            }                 # docent.core.DocStore lookups by pet
+                              # are O(1) ('sorted' for range lookups).
         )
 
     name: str = dataclasses.field(
@@ -232,7 +264,9 @@ class Flea(docent.core.DocObject):
         )
 
     @classmethod
+    @docent.core.cache.cached(ttl=60)
     def from_id(cls, _id: str) -> 'Flea':
         """Return an instantiated Flea object from database by id."""
 
-        return cls(**(clients.DatabaseClient.find_one(_id) or {}))
+        if (record := clients.DatabaseClient.find_one(_id)):
+            return cls(**record)
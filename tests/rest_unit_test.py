@@ -15,3 +15,111 @@ class TestImport(unittest.TestCase):
             raise e
         else:
             self.assertTrue(True)
+
+
+class TestResponse(unittest.TestCase):
+    """Fixture for testing Response encoding."""
+
+    def test_streamed_content(self):
+        """Test lists of DocObjects are streamed without Content-Length."""
+
+        import dataclasses
+        import json
+        import unittest.mock
+
+        import docent.core
+        import docent.rest
+
+        @dataclasses.dataclass
+        class Pet(docent.core.DocObject):
+            _id: str = None
+
+        pets = [Pet(str(i)) for i in range(3)]
+        with unittest.mock.patch.object(
+            docent.rest.objects.response.Constants,
+            'CHUNK_SIZE',
+            8
+            ):
+            response = docent.rest.objects.response.Response(body=pets)
+        self.assertNotIn('Content-Length', response._headers)
+        self.assertEqual(
+            json.loads(b''.join(response._content)),
+            [pet.as_rest for pet in pets]
+            )
+        response = docent.rest.objects.response.Response(body=pets[0])
+        self.assertEqual(
+            response._headers['Content-Length'],
+            len(response._content)
+            )
+
+    def test_buffered_content(self):
+        """Test streamed bodies fitting in one chunk are buffered."""
+
+        import dataclasses
+        import json
+
+        import docent.core
+        import docent.rest
+
+        @dataclasses.dataclass
+        class Pet(docent.core.DocObject):
+            _id: str = None
+
+        pets = [Pet(str(i)) for i in range(3)]
+        response = docent.rest.objects.response.Response(
+            body=(pet for pet in pets)
+            )
+        self.assertIsInstance(response._content, bytes)
+        self.assertEqual(
+            response._headers['Content-Length'],
+            len(response._content)
+            )
+        self.assertEqual(
+            json.loads(response._content),
+            [pet.as_rest for pet in pets]
+            )
+
+    def test_stream(self):
+        """Test Streams encode their first chunk on init, in scope."""
+
+        import dataclasses
+
+        import docent.core
+        import docent.rest
+
+        @dataclasses.dataclass
+        class Pet(docent.core.DocObject):
+            _id: str = None
+
+        def pets(fail_at: int):
+            for i in range(4):
+                if i == fail_at:
+                    raise ValueError(i)
+                self.assertIs(docent.core.identity.current(), identity_map)
+                yield Pet(str(i))
+
+        with docent.core.identity.scope() as identity_map:
+            with self.assertRaises(ValueError):
+                docent.rest.objects.response.Stream(pets(0), 8)
+            stream = docent.rest.objects.response.Stream(pets(2), 8)
+            self.assertFalse(stream.done)
+        self.assertIsNone(docent.core.identity.current())
+        with self.assertRaises(ValueError):
+            b''.join(stream)
+        self.assertIsNone(docent.core.identity.current())
+
+
+class TestError(unittest.TestCase):
+    """Fixture for testing Error status codes."""
+
+    def test_invalid_query(self):
+        """Test invalid queries (ex. unknown fields) are bad requests."""
+
+        import docent.core
+        import docent.rest
+
+        error = docent.rest.objects.response.Error.from_exception(
+            docent.core.exceptions.InvalidQueryError('Invalid query field')
+            )
+        self.assertEqual(error.errorCode, 400)
+        self.assertEqual(error.errorMessage, 'Invalid query field')
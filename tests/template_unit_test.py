@@ -15,3 +15,56 @@ class TestImport(unittest.TestCase):
             raise e
         else:
             self.assertTrue(True)
+
+
+class TestFleas(unittest.TestCase):
+    """Fixture for testing the template Fleas resource."""
+
+    def test_parent_lookup(self):
+        """Test parent pets are looked up through a scoped loader."""
+
+        import unittest.mock
+
+        import docent.rest
+        import docent.template.api
+        import docent.template.package
+
+        clients = docent.template.package.clients
+        pets, _ = docent.rest.API[
+            docent.rest.Request(
+                body=[{'name': 'Sophie', 'type': 'dog'}],
+                headers={},
+                method='POST',
+                path='/api/v1/pets',
+                params={}
+                )
+            ]
+        path = f'/api/v1/pets/{pets[0]._id}/fleas'
+        with unittest.mock.patch.object(
+            clients.DatabaseClient,
+            'load_many',
+            wraps=clients.DatabaseClient.load_many
+            ) as load_many, unittest.mock.patch.object(
+                clients.DatabaseClient,
+                'find_one',
+                wraps=clients.DatabaseClient.find_one
+                ) as find_one:
+            for method, body in (
+                ('POST', [{'name': 'FLEA', 'type': 'flea'}]),
+                ('GET', {}),
+                ):
+                _, status_code = docent.rest.API[
+                    docent.rest.Request(
+                        body=body,
+                        headers={},
+                        method=method,
+                        path=path,
+                        params={'pet_id': pets[0]._id}
+                        )
+                    ]
+                self.assertLess(status_code, 300)
+        self.assertEqual(
+            load_many.call_args_list,
+            [unittest.mock.call([pets[0]._id])] * 2
+            )
+        find_one.assert_not_called()